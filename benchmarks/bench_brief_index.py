@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Build and query times of the brief search index on a synthetic corpus.
+
+Writes `--briefs` generated briefs (front-matter, the usual sections and a
+handful of owned action items each) to a temporary directory, then times a
+full build, a no-op rebuild, a rebuild after touching/editing/removing a few
+briefs, and a set of `search` / `actions` queries.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import pathlib
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+from brief_index import BriefIndex  # noqa: E402
+from synthetic_transcripts import transcript_lines  # noqa: E402
+
+OWNERS = ["Godhavari Gopal", "Terri Corney", "Alex Morgan", "Priya Nair", "Sam Lee", "Jordan Wu"]
+TOPICS = ["webhook", "policy sync", "claims API", "SFTP batch", "quotation flow", "renewal journey"]
+
+
+def make_brief(number: int, rng: random.Random) -> str:
+    lines = transcript_lines(40, seed=number)
+    topic = rng.choice(TOPICS)
+    actions = [
+        f"- [{'x' if rng.random() < 0.3 else ' '}] Follow up on the {rng.choice(TOPICS)} "
+        f"(owner: {rng.choice(OWNERS)}; due: 2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d})"
+        for _ in range(rng.randint(2, 6))
+    ]
+    body = [
+        "---",
+        f'meeting: "Discovery session {number}: {topic}"',
+        f'date: "2026-{number % 12 + 1:02d}-{number % 28 + 1:02d}"',
+        f'source_transcript: "meeting-notes/session-{number}.md"',
+        f'agent_id: "bc-{number:06d}"',
+        "---",
+        "",
+        "## Summary",
+        "",
+        *lines[:6],
+        "",
+        "## Architecture / Integration Notes",
+        "",
+        f"- The {topic} integration goes through the partner gateway.",
+        *lines[6:14],
+        "",
+        "## Action Items",
+        "",
+        *actions,
+        "",
+        "## Risks & Open Questions",
+        "",
+        *lines[14:20],
+    ]
+    return "\n".join(body) + "\n"
+
+
+def timed(function, repeat: int = 1) -> list:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = function()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples if repeat > 1 else [samples[0], result]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--briefs", type=int, default=3000)
+    parser.add_argument("--changed", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    with tempfile.TemporaryDirectory() as tmp:
+        outputs = pathlib.Path(tmp) / "meeting_outputs"
+        outputs.mkdir()
+        paths = []
+        for number in range(args.briefs):
+            path = outputs / f"session-{number:05d}.md"
+            path.write_text(make_brief(number, rng), encoding="utf-8")
+            paths.append(path)
+        corpus_bytes = sum(path.stat().st_size for path in paths)
+
+        index = BriefIndex(pathlib.Path(tmp) / "index.sqlite")
+        full_ms, full_counts = timed(lambda: index.update(outputs))
+        noop_ms, noop_counts = timed(lambda: index.update(outputs))
+
+        for path in paths[: args.changed]:
+            path.write_text(path.read_text(encoding="utf-8") + "\n- Added after review.\n", encoding="utf-8")
+        for path in paths[args.changed : 2 * args.changed]:
+            os.utime(path)  # touched, content unchanged
+        for path in paths[2 * args.changed : 3 * args.changed]:
+            path.unlink()
+        incremental_ms, incremental_counts = timed(lambda: index.update(outputs))
+
+        queries = {
+            "search_term": lambda: index.search("webhook"),
+            "search_phrase_section": lambda: index.search('"partner gateway"', section="Architecture"),
+            "search_prefix": lambda: index.search("renew*"),
+            "actions_owner": lambda: index.actions(owner="Terri"),
+            "actions_owner_open_match": lambda: index.actions(owner="Priya", match="claims", open_only=True),
+        }
+        query_results = {}
+        for name, query in queries.items():
+            samples = timed(query, repeat=args.repeat)
+            query_results[name] = {
+                "rows": len(query()),
+                "median_ms": round(statistics.median(samples), 2),
+                "max_ms": round(max(samples), 2),
+            }
+        index.close()
+
+    print(
+        json.dumps(
+            {
+                "briefs": args.briefs,
+                "corpus_mb": round(corpus_bytes / 1e6, 1),
+                "full_build": {"ms": round(full_ms), **full_counts},
+                "noop_rebuild": {"ms": round(noop_ms), **noop_counts},
+                "incremental_rebuild": {"ms": round(incremental_ms), **incremental_counts},
+                "queries": query_results,
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
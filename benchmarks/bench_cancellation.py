@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Cancellation latency and deadline overrun of the runner.
+
+The runner is started as a subprocess against the fake Cursor API with some
+status polls stalling for `--stall-seconds`:
+
+* `cancel` – SIGINT after `--cancel-after` seconds; reports the time from the
+  signal to exit, the exit status and how many agents were stopped;
+* `deadline` – `--deadline` with every poll stalling; reports the wall time
+  past the deadline before the run finished with its heuristic fallbacks.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import pathlib
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+from fake_cursor_api import FakeCursorServer  # noqa: E402
+
+RUNNER = ROOT / "scripts" / "run_cursor_meeting_agent.py"
+
+
+def start_runner(server: FakeCursorServer, transcripts: List[str], extra: List[str], cwd: str) -> subprocess.Popen:
+    command = [sys.executable, str(RUNNER), "--no-cache", "--no-journal", "--no-chunking", "--poll-policy", "fixed",
+               "--poll-interval", "0.2"]
+    for transcript in transcripts:
+        command += ["--transcript", transcript]
+    env = dict(os.environ, CURSOR_API_KEY="bench", CURSOR_API_BASE=server.base_url)
+    return subprocess.Popen(
+        command + extra, cwd=cwd, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+    )
+
+
+def measure_cancel(options: argparse.Namespace, transcripts: List[str], cwd: str) -> Dict[str, Any]:
+    with FakeCursorServer(
+        completion_seconds=options.completion_seconds,
+        stall_rate=options.stall_rate,
+        stall_seconds=options.stall_seconds,
+    ) as server:
+        process = start_runner(server, transcripts, [], cwd)
+        time.sleep(options.cancel_after)
+        signalled = time.perf_counter()
+        process.send_signal(signal.SIGINT)
+        _, stderr = process.communicate()
+        return {
+            "exit_s": round(time.perf_counter() - signalled, 3),
+            "returncode": process.returncode,
+            "agents_launched": server.state.counts["launch"],
+            "agents_stopped": server.state.counts["stop"],
+            "summary": next((line for line in stderr.splitlines() if line.startswith("[cancel]")), None),
+        }
+
+
+def measure_deadline(options: argparse.Namespace, transcripts: List[str], cwd: str) -> Dict[str, Any]:
+    with FakeCursorServer(
+        completion_seconds=options.completion_seconds, stall_rate=1.0, stall_seconds=options.stall_seconds
+    ) as server:
+        started = time.perf_counter()
+        process = start_runner(server, transcripts, ["--deadline", str(options.deadline)], cwd)
+        process.communicate()
+        wall = time.perf_counter() - started
+        return {
+            "wall_s": round(wall, 3),
+            "overrun_s": round(wall - options.deadline, 3),
+            "returncode": process.returncode,
+            "stalled_polls": server.state.counts["stalled"],
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--corpus", default=str(ROOT / "meeting-notes"))
+    parser.add_argument("--transcripts", type=int, default=4)
+    parser.add_argument("--completion-seconds", type=float, default=30.0)
+    parser.add_argument("--stall-rate", type=float, default=0.3)
+    parser.add_argument("--stall-seconds", type=float, default=40.0)
+    parser.add_argument("--cancel-after", type=float, default=3.0)
+    parser.add_argument("--deadline", type=float, default=5.0)
+    options = parser.parse_args()
+
+    transcripts = [str(path) for path in sorted(pathlib.Path(options.corpus).iterdir()) if path.is_file()]
+    transcripts = transcripts[: options.transcripts]
+    results: Dict[str, Any] = {"transcripts": len(transcripts), "stall_seconds": options.stall_seconds}
+    with tempfile.TemporaryDirectory() as cwd:
+        results["cancel"] = measure_cancel(options, transcripts, cwd)
+        results["deadline"] = measure_deadline(options, transcripts, cwd)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
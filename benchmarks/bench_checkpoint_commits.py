@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Cost of atomic brief writes and of checkpoint commits against a local remote.
+
+* `write_us` – median time of writing one brief with `Path.write_text` and with
+  `write_atomic` (temp file + rename);
+* `commits` – in a scratch clone of a bare repository, `--briefs` briefs are
+  committed and pushed once at the end (like the old workflow step) and in
+  checkpoints of `--every` briefs. For each mode this reports the total git
+  time and the time of the step left after the last brief is written; with
+  checkpoints, at most `--every` briefs are ever uncommitted.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import pathlib
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+from atomic_write import write_atomic  # noqa: E402
+from brief_outputs import CheckpointCommitter  # noqa: E402
+
+BRIEF = "## Summary\n\n" + "A decision was recorded and an owner was assigned.\n" * 200
+
+
+def timed(function: Callable[[], Any], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - started)
+    return round(statistics.median(samples) * 1e6, 1)
+
+
+def scratch_clone(tmp: pathlib.Path, name: str) -> pathlib.Path:
+    remote = tmp / f"{name}.git"
+    work = tmp / name
+    subprocess.run(["git", "init", "-q", "--bare", "-b", "main", str(remote)], check=True)
+    subprocess.run(["git", "clone", "-q", str(remote), str(work)], check=True, capture_output=True)
+    for key, value in (("user.name", "bench"), ("user.email", "bench@example.com")):
+        subprocess.run(["git", "-C", str(work), "config", key, value], check=True)
+    return work
+
+
+def measure_commits(work: pathlib.Path, briefs: int, every: int) -> Dict[str, Any]:
+    """Write `briefs` briefs in `work`, committing every `every` of them (0: once at the end)."""
+    paths = [pathlib.Path("meeting_outputs") / f"brief-{index:03d}.md" for index in range(briefs)]
+    previous = os.getcwd()
+    os.chdir(work)  # brief_outputs runs git in the working directory
+    try:
+        committer = CheckpointCommitter(every_files=every or briefs + 1, every_seconds=1e9, branch="main")
+        for path in paths:
+            write_atomic(path, BRIEF)
+            committer.add([path])
+        started = time.perf_counter()
+        committer.checkpoint()
+        final = time.perf_counter() - started
+    finally:
+        os.chdir(previous)
+    return {"git_s": round(committer.seconds, 3), "final_step_s": round(final, 3), "commits": committer.checkpoints}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--briefs", type=int, default=40)
+    parser.add_argument("--every", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    results: Dict[str, Any] = {"briefs": args.briefs, "every": args.every}
+    with tempfile.TemporaryDirectory() as tmp_name:
+        tmp = pathlib.Path(tmp_name)
+        target = tmp / "brief.md"
+        results["write_us"] = {
+            "write_text": timed(lambda: target.write_text(BRIEF, encoding="utf-8"), args.repeat),
+            "write_atomic": timed(lambda: write_atomic(target, BRIEF), args.repeat),
+        }
+        with contextlib.redirect_stdout(io.StringIO()):
+            results["commits"] = {
+                "end_of_run": measure_commits(scratch_clone(tmp, "final"), args.briefs, 0),
+                "checkpoints": measure_commits(scratch_clone(tmp, "checkpoints"), args.briefs, args.every),
+            }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+End-to-end latency of single-agent vs map-reduce summarisation.
+
+The fake Cursor API is configured so agent run time grows with prompt size,
+which is the behaviour that makes one giant prompt slow. A long synthetic
+transcript is summarised once as a single prompt and once in chunks whose map
+agents run concurrently before a final reduce agent.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import pathlib
+import sys
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "scripts"))
+
+from agent_runs import run_agent  # noqa: E402
+from chunking import split_transcript  # noqa: E402
+from cursor_api import CursorClient, set_client  # noqa: E402
+from fake_cursor_api import FakeCursorServer  # noqa: E402
+from meeting_briefs import build_prompt, summarize_chunked  # noqa: E402
+from polling import BackoffPolicy  # noqa: E402
+from synthetic_transcripts import transcript_lines  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=4000, help="Synthetic transcript lines (~80 chars each).")
+    parser.add_argument("--chunk-chars", type=int, default=60_000)
+    parser.add_argument("--seconds-per-kchar", type=float, default=0.01)
+    args = parser.parse_args()
+
+    transcript = "\n".join(transcript_lines(args.lines))
+    metadata = {"title": "Synthetic Long Meeting", "date": "2025-01-01"}
+    run_args = argparse.Namespace(
+        branch_name=None,
+        timeout=300,
+        policy=BackoffPolicy(initial=0.05, maximum=0.5, jitter=0),
+        max_concurrency=16,
+        stakeholders=None,
+        stream=False,
+        journal=None,
+    )
+    results = {"transcript_chars": len(transcript)}
+    with FakeCursorServer(completion_seconds=0.5, seconds_per_kchar=args.seconds_per_kchar) as server:
+        set_client(CursorClient("bench", base_url=server.base_url, max_connections=16))
+        started = time.perf_counter()
+        run_agent(build_prompt(metadata, None, transcript), run_args)
+        results["single_agent_s"] = round(time.perf_counter() - started, 3)
+
+        chunks = split_transcript(transcript, args.chunk_chars)
+        started = time.perf_counter()
+        summarize_chunked(chunks, metadata, run_args)
+        results["chunked_s"] = round(time.perf_counter() - started, 3)
+        results["chunks"] = len(chunks)
+        results["agents_launched"] = server.state.counts["launch"]
+        set_client(None)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
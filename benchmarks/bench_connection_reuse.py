@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Count TCP connections opened for a launch/poll/fetch cycle against the fake API.
+
+Compares the old one-`urlopen`-per-request pattern with the pooled
+`CursorClient`. Each new connection against the real API is a TLS handshake.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import pathlib
+import sys
+import time
+import urllib.request
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "scripts"))
+
+from cursor_api import CursorClient  # noqa: E402
+from fake_cursor_api import FakeCursorServer  # noqa: E402
+
+
+def run_urlopen(base_url: str, polls: int) -> None:
+    def call(path: str, payload=None, method: str = "GET"):
+        data = json.dumps(payload).encode("utf-8") if payload is not None else None
+        request = urllib.request.Request(
+            f"{base_url}{path}", data=data, method=method, headers={"Content-Type": "application/json"}
+        )
+        with urllib.request.urlopen(request, timeout=30) as response:
+            return json.loads(response.read().decode("utf-8"))
+
+    agent_id = call("/agents", {"prompt": {"text": "bench"}}, method="POST")["id"]
+    for _ in range(polls):
+        call(f"/agents/{agent_id}")
+    call(f"/agents/{agent_id}/conversation")
+
+
+def run_client(base_url: str, polls: int) -> None:
+    client = CursorClient("bench", base_url=base_url)
+    agent_id = client.request("/agents", {"prompt": {"text": "bench"}}, method="POST")["id"]
+    for _ in range(polls):
+        client.request(f"/agents/{agent_id}")
+    client.request(f"/agents/{agent_id}/conversation")
+    client.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--polls", type=int, default=120, help="Status polls per agent (default: 120).")
+    args = parser.parse_args()
+
+    results = {}
+    for name, runner in (("urlopen", run_urlopen), ("pooled_client", run_client)):
+        with FakeCursorServer(completion_seconds=0) as server:
+            started = time.perf_counter()
+            runner(server.base_url, args.polls)
+            elapsed = time.perf_counter() - started
+            results[name] = {
+                "requests": server.state.counts["requests"],
+                "connections": server.state.counts["connections"],
+                "seconds": round(elapsed, 4),
+            }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
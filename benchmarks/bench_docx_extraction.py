@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Compare the streaming DOCX extractor with the original whole-tree version.
+
+Runs both on every `.docx` under `meeting-notes/` (optionally inflated by
+repeating the document body to mimic multi-hour exports), checks the output is
+identical and reports wall time and peak traced memory for each.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import pathlib
+import sys
+import tempfile
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+import zipfile
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+from transcript_ingest.docx import NAMESPACE, extract_docx_text  # noqa: E402
+
+
+def legacy_extract_docx_text(path: pathlib.Path) -> str:
+    with zipfile.ZipFile(path) as archive:
+        xml_data = archive.read("word/document.xml")
+    root = ET.fromstring(xml_data)
+    paragraphs = []
+    for para in root.findall(".//w:p", NAMESPACE):
+        texts = []
+        for node in para.findall(".//w:t", NAMESPACE):
+            if node.text:
+                texts.append(node.text)
+        if texts:
+            paragraphs.append("".join(texts))
+    return "\n".join(paragraphs)
+
+
+def inflate(source: pathlib.Path, factor: int, target_dir: pathlib.Path) -> pathlib.Path:
+    """Copy `source` with the body content repeated `factor` times."""
+    target = target_dir / f"{source.stem}-x{factor}.docx"
+    with zipfile.ZipFile(source) as src, zipfile.ZipFile(target, "w", zipfile.ZIP_DEFLATED) as dst:
+        for item in src.infolist():
+            data = src.read(item.filename)
+            if item.filename == "word/document.xml":
+                text = data.decode("utf-8")
+                start = text.index("<w:body>") + len("<w:body>")
+                end = text.rfind("<w:sectPr", start, text.rindex("</w:body>"))
+                text = text[:start] + text[start:end] * factor + text[end:]
+                data = text.encode("utf-8")
+            dst.writestr(item, data)
+    return target
+
+
+def measure(func, path: pathlib.Path) -> dict:
+    tracemalloc.start()
+    started = time.perf_counter()
+    text = func(path)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"seconds": round(elapsed, 4), "peak_mib": round(peak / 2**20, 2), "text": text}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--corpus", default=str(ROOT / "meeting-notes"))
+    parser.add_argument("--inflate", type=int, default=1, help="Repeat each document body N times.")
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for source in sorted(pathlib.Path(args.corpus).glob("*.docx")):
+            path = inflate(source, args.inflate, pathlib.Path(tmp)) if args.inflate > 1 else source
+            legacy = measure(legacy_extract_docx_text, path)
+            streaming = measure(extract_docx_text, path)
+            results[path.name] = {
+                "identical": legacy.pop("text") == streaming.pop("text"),
+                "legacy": legacy,
+                "streaming": streaming,
+            }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
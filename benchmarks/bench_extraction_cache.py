@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Repeat-extraction time of `.docx`/`.pdf` transcripts with the extraction cache.
+
+For every binary transcript in `meeting-notes/` plus a large synthetic PDF
+this reports the uncached extraction time, the first cached read (extract,
+hash, compress and store), a repeat read served from the cache, and the size
+of the stored entry against the extracted text.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import pathlib
+import statistics
+import sys
+import tempfile
+import time
+from typing import Any, Callable, List
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+from synthetic_transcripts import write_transcript  # noqa: E402
+from transcript_ingest import ExtractionCache, read_transcript  # noqa: E402
+
+
+def timed(function: Callable[[], Any], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - started)
+    return round(statistics.median(samples) * 1000, 2)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--corpus", default=str(ROOT / "meeting-notes"))
+    parser.add_argument("--pdf-chars", type=int, default=2_000_000, help="Size of the synthetic PDF transcript.")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths: List[pathlib.Path] = [
+            path for path in sorted(pathlib.Path(args.corpus).iterdir()) if path.suffix.lower() in (".docx", ".pdf")
+        ]
+        synthetic = pathlib.Path(tmp) / "synthetic.pdf"
+        write_transcript(synthetic, args.pdf_chars, seed=7)
+        paths.append(synthetic)
+
+        results = []
+        for path in paths:
+            cache = ExtractionCache(pathlib.Path(tmp) / "cache")
+            text = read_transcript(path)
+            started = time.perf_counter()
+            read_transcript(path, cache)
+            first_ms = round((time.perf_counter() - started) * 1000, 2)
+            entry_bytes = sum(entry.stat().st_size for entry in cache.directory.glob("*.txt.gz"))
+            results.append(
+                {
+                    "transcript": path.name,
+                    "file_kb": round(path.stat().st_size / 1024, 1),
+                    "text_kb": round(len(text.encode("utf-8")) / 1024, 1),
+                    "entry_kb": round(entry_bytes / 1024, 1),
+                    "uncached_ms": timed(lambda: read_transcript(path), args.repeat),
+                    "first_cached_ms": first_ms,
+                    "cache_hit_ms": timed(lambda: read_transcript(path, cache), args.repeat),
+                }
+            )
+            for entry in cache.directory.glob("*.txt.gz"):
+                entry.unlink()
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Time the offline extractive fallback on the `meeting-notes/` corpus and on a
+synthetic multi-hour transcript.
+
+Extraction (reading the file) is timed separately and excluded from the
+summariser timings; each timing is the best of `--repeat` runs.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import pathlib
+import sys
+import time
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+from extractive_summary import extractive_brief, split_sentences  # noqa: E402
+from synthetic_transcripts import transcript_lines  # noqa: E402
+from transcript_ingest import SUPPORTED_EXTENSIONS, read_transcript  # noqa: E402
+
+
+def best_of(repeat: int, text: str) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        extractive_brief(text)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def measure(name: str, text: str, repeat: int) -> dict:
+    return {
+        "name": name,
+        "chars": len(text),
+        "sentences": len(split_sentences(text)),
+        "summary_ms": round(best_of(repeat, text) * 1000, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--corpus", default=str(ROOT / "meeting-notes"))
+    parser.add_argument("--synthetic-lines", type=int, default=6000, help="~80-char turns; 6000 is roughly 5 hours.")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    results = []
+    for path in sorted(pathlib.Path(args.corpus).iterdir()):
+        if path.suffix.lower() in SUPPORTED_EXTENSIONS:
+            results.append(measure(path.name, read_transcript(path), args.repeat))
+    synthetic = "\n".join(transcript_lines(args.synthetic_lines))
+    results.append(measure(f"synthetic ({args.synthetic_lines} turns)", synthetic, args.repeat))
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Prompt payload size and agent latency with and without transcript normalisation.
+
+For every transcript in `meeting-notes/` the prompt is built from the raw
+extracted text, the normalised text and the normalised text without
+timestamps. Each prompt is then run through `run_agent` against the fake
+Cursor API, whose agents take `--seconds-per-kchar` per 1000 prompt
+characters (a stand-in for the real API's size-dependent processing time).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import pathlib
+import sys
+import time
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+from agent_runs import run_agent  # noqa: E402
+from cursor_api import CursorClient, set_client  # noqa: E402
+from fake_cursor_api import FakeCursorServer  # noqa: E402
+from meeting_briefs import build_prompt, infer_metadata  # noqa: E402
+from normalization import normalize_transcript  # noqa: E402
+from polling import BackoffPolicy  # noqa: E402
+from transcript_ingest import SUPPORTED_EXTENSIONS, read_transcript  # noqa: E402
+
+
+def agent_seconds(prompt: str, args: argparse.Namespace) -> float:
+    started = time.perf_counter()
+    run_agent(prompt, args)
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--corpus", default=str(ROOT / "meeting-notes"))
+    parser.add_argument("--seconds-per-kchar", type=float, default=0.02)
+    args = parser.parse_args()
+
+    run_args = argparse.Namespace(
+        stream=False,
+        journal=None,
+        timeout=120,
+        branch_name=None,
+        policy=BackoffPolicy(initial=0.02, maximum=0.1, jitter=0),
+    )
+    results = []
+    with FakeCursorServer(completion_seconds=0.2, seconds_per_kchar=args.seconds_per_kchar) as server:
+        set_client(CursorClient("bench", base_url=server.base_url))
+        for path in sorted(pathlib.Path(args.corpus).iterdir()):
+            if path.suffix.lower() not in SUPPORTED_EXTENSIONS:
+                continue
+            raw = read_transcript(path)
+            metadata = infer_metadata(path, None, None)
+            variants = {
+                "raw": raw,
+                "normalized": normalize_transcript(raw)[0],
+                "normalized_no_timestamps": normalize_transcript(raw, strip_timestamps=True)[0],
+            }
+            row = {"transcript": path.name}
+            for name, text in variants.items():
+                prompt = build_prompt(metadata, None, text)
+                row[f"{name}_prompt_bytes"] = len(prompt.encode("utf-8"))
+                row[f"{name}_agent_s"] = round(agent_seconds(prompt, run_args), 3)
+            row["bytes_saved_pct"] = round(
+                100 * (1 - row["normalized_prompt_bytes"] / row["raw_prompt_bytes"]), 1
+            )
+            results.append(row)
+        set_client(None)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Serial vs process-pool PDF extraction on a generated multi-hundred-page PDF.
+
+Requires PyPDF2. Verifies that both paths return the same text.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import pathlib
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "scripts"))
+
+from synthetic_transcripts import write_pdf  # noqa: E402
+from transcript_ingest import pdf  # noqa: E402
+
+
+def timed(path: pathlib.Path, workers: int) -> tuple:
+    started = time.perf_counter()
+    text = pdf.extract_pdf_text(path, workers=workers)
+    return time.perf_counter() - started, text
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+    if pdf.PyPDF2 is None:
+        sys.exit("PyPDF2 is required for this benchmark.")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_pdf(pathlib.Path(tmp) / "synthetic.pdf", args.pages)
+        serial_s, serial_text = timed(path, 1)
+        parallel_s, parallel_text = timed(path, args.workers)
+    print(
+        json.dumps(
+            {
+                "pages": args.pages,
+                "workers": args.workers,
+                "serial_s": round(serial_s, 3),
+                "parallel_s": round(parallel_s, 3),
+                "speedup": round(serial_s / parallel_s, 2) if parallel_s else None,
+                "identical": serial_text == parallel_text,
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
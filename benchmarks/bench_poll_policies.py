@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Compare `wait_for_agent` poll policies against the fake Cursor API.
+
+For each policy a batch of agents with randomised completion times is launched
+and waited on concurrently. The report lists status requests per agent and the
+pickup latency (time between the fake agent finishing and the runner noticing).
+Timings are scaled down from production values so a run takes seconds.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import pathlib
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "scripts"))
+
+from agent_runs import launch_agent, wait_for_agent  # noqa: E402
+from cursor_api import CursorClient, set_client  # noqa: E402
+from fake_cursor_api import FakeCursorServer  # noqa: E402
+from polling import AdaptivePolicy, BackoffPolicy, FixedPolicy, PollPolicy  # noqa: E402
+
+
+def run_batch(server: FakeCursorServer, policy: PollPolicy, agents: int, timeout: float) -> dict:
+    set_client(CursorClient("bench", base_url=server.base_url, max_connections=agents))
+    status_before = server.state.counts["status"]
+
+    def one(_: int) -> float:
+        agent_id = launch_agent("bench prompt", None)
+        wait_for_agent(agent_id, int(timeout), policy)
+        return time.monotonic() - server.state.agents[agent_id].finishes_at
+
+    with ThreadPoolExecutor(max_workers=agents) as pool:
+        pickups = sorted(pool.map(one, range(agents)))
+    set_client(None)
+    polls = server.state.counts["status"] - status_before
+    return {
+        "status_requests_per_agent": round(polls / agents, 2),
+        "pickup_p50_s": round(statistics.median(pickups), 3),
+        "pickup_max_s": round(pickups[-1], 3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--agents", type=int, default=12)
+    parser.add_argument("--completion-seconds", type=float, default=4.0)
+    parser.add_argument("--completion-jitter", type=float, default=0.5)
+    parser.add_argument("--throttle-every", type=int, default=0, help="Have the fake API 429 every Nth poll.")
+    args = parser.parse_args()
+
+    options = {
+        "completion_seconds": args.completion_seconds,
+        "completion_jitter": args.completion_jitter,
+        "throttle_every": args.throttle_every,
+        "retry_after": 0.5,
+        "seed": 7,
+    }
+    timeout = args.completion_seconds * 10
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp, FakeCursorServer(**options) as server:
+        history = pathlib.Path(tmp) / "durations.json"
+        policies = {
+            "fixed": FixedPolicy(2.0),
+            "backoff": BackoffPolicy(initial=0.25, maximum=4.0),
+            "adaptive": AdaptivePolicy(history, initial=0.25, maximum=4.0),
+        }
+        # Warm the adaptive history with one untimed batch, as past runs would.
+        run_batch(server, policies["adaptive"], args.agents, timeout)
+        for name, policy in policies.items():
+            results[name] = run_batch(server, policy, args.agents, timeout)
+        results["throttled_responses"] = server.state.counts["throttled"]
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Throughput at the API's rate limit with and without the client-side budget.
+
+The fake Cursor API enforces per-second launch and poll limits (429 +
+Retry-After). A batch of agents is pushed through `run_agent` with many
+workers three ways: no retries and no budget, retries only, and retries plus
+a `RequestBudget` matching the server limits. The report lists completed and
+failed agents, 429s received, wall time and achieved launch throughput.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import pathlib
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "scripts"))
+
+from agent_runs import run_agent  # noqa: E402
+from cursor_api import CursorApiError, CursorClient, set_client  # noqa: E402
+from fake_cursor_api import FakeCursorServer  # noqa: E402
+from polling import BackoffPolicy  # noqa: E402
+from rate_limit import CircuitBreaker, RequestBudget  # noqa: E402
+
+
+def run_batch(options: dict, agents: int, workers: int, budget: Optional[RequestBudget], max_retries: int) -> dict:
+    args = argparse.Namespace(
+        stream=False,
+        journal=None,
+        timeout=60,
+        branch_name=None,
+        policy=BackoffPolicy(initial=0.2, maximum=1.0),
+    )
+    with FakeCursorServer(**options) as server:
+        client = CursorClient(
+            "bench",
+            base_url=server.base_url,
+            max_connections=workers,
+            budget=budget,
+            breaker=CircuitBreaker(failure_threshold=20, reset_after=2.0),
+            max_retries=max_retries,
+        )
+        set_client(client)
+
+        def one(_: int) -> bool:
+            try:
+                return bool(run_agent("bench prompt", args)[1])
+            except CursorApiError:
+                return False
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(one, range(agents)))
+        elapsed = time.perf_counter() - started
+        set_client(None)
+        counts = server.state.counts
+        completed = sum(results)
+        return {
+            "completed": completed,
+            "failed": agents - completed,
+            "responses_429": counts["rate_limited_launch"] + counts["rate_limited_poll"],
+            "responses_503": counts["errors"],
+            "client_retries": client.retries,
+            "wall_s": round(elapsed, 2),
+            "launches_per_s": round(counts["launch"] / elapsed, 2),
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--agents", type=int, default=40)
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--launch-limit", type=int, default=5)
+    parser.add_argument("--poll-limit", type=int, default=20)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    options = {
+        "completion_seconds": 1.0,
+        "launch_limit": args.launch_limit,
+        "poll_limit": args.poll_limit,
+        "error_rate": args.error_rate,
+        "seed": 7,
+    }
+    # Stay a little under the server's limits, as one would against the real API.
+    budget_args = (args.launch_limit * 0.9, args.poll_limit * 0.9, 1, 1)
+    results = {
+        "no_retries": run_batch(options, args.agents, args.workers, None, 0),
+        "retries_only": run_batch(options, args.agents, args.workers, None, 4),
+        "budget_and_retries": run_batch(options, args.agents, args.workers, RequestBudget.build(*budget_args), 4),
+    }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Track cold-start cost of each entry point with `python -X importtime`.
+
+Each script is run in a fresh interpreter on a small `.md` transcript (the
+runners fall back to the heuristic summary because no API key is set). The
+report lists total import time, the number of modules imported, wall time and
+whether any format-specific dependency was loaded that a Markdown run should
+not need.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import pathlib
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+SCRIPTS = ROOT / "scripts"
+HEAVY_MODULES = ("zipfile", "xml.etree.ElementTree", "PyPDF2")
+
+
+def entry_points(workdir: pathlib.Path) -> Dict[str, List[str]]:
+    transcript = workdir / "2025-01-01-startup.md"
+    transcript.write_text("# Notes\n\nAlice: hello\nBob: hi\n", encoding="utf-8")
+    return {
+        "run_cursor_meeting_agent": [
+            str(SCRIPTS / "run_cursor_meeting_agent.py"),
+            "--transcript",
+            str(transcript),
+            "--output",
+            str(workdir / "brief.md"),
+            "--no-cache",
+        ],
+        "run_cursor_cloud_agent": [
+            str(SCRIPTS / "run_cursor_cloud_agent.py"),
+            "--input",
+            str(transcript),
+            "--output",
+            str(workdir / "summary.md"),
+        ],
+        "list_changed_transcripts": [str(SCRIPTS / "list_changed_transcripts.py"), "--help"],
+    }
+
+
+def parse_importtime(stderr: str) -> Dict[str, int]:
+    modules: Dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = int(self_us)
+    return modules
+
+
+def measure(argv: List[str], cwd: pathlib.Path, runs: int) -> Dict[str, object]:
+    env = {key: value for key, value in os.environ.items() if not key.startswith("CURSOR_")}
+    walls = []
+    imports: Dict[str, int] = {}
+    for _ in range(runs):
+        started = time.perf_counter()
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", *argv],
+            cwd=cwd,
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        walls.append(time.perf_counter() - started)
+        imports = parse_importtime(completed.stderr)
+    return {
+        "wall_ms_median": round(statistics.median(walls) * 1000, 1),
+        "import_ms": round(sum(imports.values()) / 1000, 1),
+        "modules": len(imports),
+        "heavy_modules_loaded": [name for name in HEAVY_MODULES if name in imports],
+        "slowest_imports": sorted(imports, key=imports.get, reverse=True)[:5],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = pathlib.Path(tmp)
+        results = {name: measure(argv, workdir, args.runs) for name, argv in entry_points(workdir).items()}
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Poll-then-fetch vs streamed conversations against the fake Cursor API.
+
+Runs the same batch of agents through `run_agent` twice, once polling with the
+default backoff policy and once with `--stream`, and reports HTTP requests per
+agent and pickup latency (time between the fake agent finishing and the runner
+holding the brief).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import pathlib
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "scripts"))
+
+from agent_runs import run_agent  # noqa: E402
+from cursor_api import CursorClient, set_client  # noqa: E402
+from fake_cursor_api import FakeCursorServer  # noqa: E402
+from polling import BackoffPolicy  # noqa: E402
+
+
+def run_batch(server: FakeCursorServer, stream: bool, agents: int, timeout: int) -> dict:
+    set_client(CursorClient("bench", base_url=server.base_url, max_connections=agents))
+    args = argparse.Namespace(
+        stream=stream,
+        journal=None,
+        timeout=timeout,
+        branch_name=None,
+        policy=BackoffPolicy(initial=0.25, maximum=4.0),
+    )
+    requests_before = server.state.counts["requests"]
+
+    def one(_: int) -> float:
+        agent_id, markdown = run_agent("bench prompt", args)
+        assert markdown, agent_id
+        return time.monotonic() - server.state.agents[agent_id].finishes_at
+
+    with ThreadPoolExecutor(max_workers=agents) as pool:
+        pickups = sorted(pool.map(one, range(agents)))
+    set_client(None)
+    requests = server.state.counts["requests"] - requests_before
+    return {
+        "requests_per_agent": round(requests / agents, 2),
+        "pickup_p50_s": round(statistics.median(pickups), 3),
+        "pickup_max_s": round(pickups[-1], 3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--agents", type=int, default=12)
+    parser.add_argument("--completion-seconds", type=float, default=4.0)
+    parser.add_argument("--completion-jitter", type=float, default=0.5)
+    args = parser.parse_args()
+
+    options = {
+        "completion_seconds": args.completion_seconds,
+        "completion_jitter": args.completion_jitter,
+        "streaming": True,
+        "heartbeat_seconds": 0.5,
+        "seed": 7,
+    }
+    timeout = int(args.completion_seconds * 10)
+    with FakeCursorServer(**options) as server:
+        results = {
+            "poll": run_batch(server, False, args.agents, timeout),
+            "stream": run_batch(server, True, args.agents, timeout),
+        }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
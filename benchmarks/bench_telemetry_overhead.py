@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Per-call cost of the telemetry hooks with tracing disabled and enabled.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import pathlib
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "scripts"))
+
+import telemetry  # noqa: E402
+
+
+def per_call_ns(statement, number: int) -> float:
+    return min(timeit.repeat(statement, number=number, repeat=5)) / number * 1e9
+
+
+def measure(number: int) -> dict:
+    def with_span() -> None:
+        with telemetry.span("bench"):
+            pass
+
+    def with_http() -> None:
+        telemetry.record_http("GET", "/agents/{id}", 200, 0, 120, 0.01)
+
+    return {
+        "span_ns": round(per_call_ns(with_span, number), 1),
+        "record_http_ns": round(per_call_ns(with_http, number), 1),
+        "count_ns": round(per_call_ns(lambda: telemetry.count("agent.polls"), number), 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=100_000)
+    args = parser.parse_args()
+    results = {}
+    telemetry.configure()
+    results["disabled"] = measure(args.number)
+    with tempfile.TemporaryDirectory() as tmp:
+        telemetry.configure(metrics_file=str(pathlib.Path(tmp) / "metrics.jsonl"))
+        results["enabled"] = measure(args.number)
+        telemetry.configure()
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
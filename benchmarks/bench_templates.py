@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Wall time of producing several brief templates from one transcript.
+
+Against the fake Cursor API, every template in `--templates` is produced for
+one transcript twice:
+
+* `sequential` – one `process_transcript` call per template, as separate runs
+  would do: the transcript is read and normalised again and the agents run one
+  after another;
+* `concurrent` – one call with all templates: the transcript is read once and
+  the template agents run at the same time through the shared client.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import pathlib
+import sys
+import tempfile
+import time
+from typing import Any, Dict
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+from agent_cli import add_agent_arguments, configure_agent_args  # noqa: E402
+from agent_runs import install_shared_client  # noqa: E402
+from fake_cursor_api import FakeCursorServer  # noqa: E402
+from meeting_briefs import process_transcript  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--transcript",
+        default=str(ROOT / "meeting-notes" / "GC-4 GMS Architecture Call - 2025_11_28 16_59 CET - Notes byi.docx"),
+    )
+    parser.add_argument("--templates", default="architecture,executive-summary,action-items,risk-register")
+    parser.add_argument("--completion-seconds", type=float, default=1.0)
+    options = parser.parse_args()
+
+    results: Dict[str, Any] = {"transcript": pathlib.Path(options.transcript).name}
+    with FakeCursorServer(completion_seconds=options.completion_seconds) as server, \
+            tempfile.TemporaryDirectory() as tmp:
+        os.environ["CURSOR_API_KEY"] = "bench"
+        os.environ["CURSOR_API_BASE"] = server.base_url
+        agent_parser = argparse.ArgumentParser()
+        add_agent_arguments(agent_parser)
+        args = agent_parser.parse_args(
+            ["--templates", options.templates, "--no-cache", "--no-journal", "--poll-policy", "fixed",
+             "--poll-interval", "0.1"]
+        )
+        args.output = str(pathlib.Path(tmp) / "brief.md")
+        args.slug = args.meeting_date = args.meeting_title = None
+        configure_agent_args(agent_parser, args)
+        install_shared_client(args)
+        templates = args.templates
+        results["templates"] = [template.name for template in templates]
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            launches = server.state.counts["launch"]
+            started = time.perf_counter()
+            extract_s = 0.0
+            for template in templates:
+                args.templates = [template]
+                stats: Dict[str, Any] = {}
+                process_transcript(pathlib.Path(options.transcript), args, stats)
+                extract_s += stats["extract_s"]
+            results["sequential"] = {
+                "wall_s": round(time.perf_counter() - started, 3),
+                "extract_s": round(extract_s, 3),
+                "agents": server.state.counts["launch"] - launches,
+            }
+
+            args.templates = templates
+            launches = server.state.counts["launch"]
+            started = time.perf_counter()
+            stats = {}
+            process_transcript(pathlib.Path(options.transcript), args, stats)
+            results["concurrent"] = {
+                "wall_s": round(time.perf_counter() - started, 3),
+                "extract_s": round(stats["extract_s"], 3),
+                "agents": server.state.counts["launch"] - launches,
+                "outputs": [path.name for path in stats["outputs"]],
+            }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Parse time and memory of the structured `Transcript` vs per-line string splitting.
+
+For each transcript in `meeting-notes/` (optionally repeated `--inflate`
+times to simulate multi-hour meetings) this compares:
+
+* `strings` – what consumers did before: `splitlines()`, split run-together
+  turns, match the speaker prefix and keep `(speaker, body)` string copies;
+* `model` – `Transcript.from_text` over the already-extracted text;
+* `read_*` – reading the file into each representation (the docx and PDF
+  readers build the transcript while they parse, without a second scan);
+* `cache` – `Transcript.to_bytes` size and `from_bytes` time, i.e. what an
+  extraction cache hit costs.
+
+Memory is the tracemalloc size still held by the parsed result (excluding the
+text itself, which both representations need).
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import pathlib
+import re
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, List, Optional, Tuple
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+from transcript_ingest import SUPPORTED_EXTENSIONS, Transcript, read_structured, read_transcript  # noqa: E402
+from transcript_ingest.model import TURN_BREAK  # noqa: E402
+
+LINE_PREFIX = re.compile(
+    r"^\s*(?:[-*•]\s+)?(?:\[?\d{1,2}:\d{2}(?::\d{2})?\]?\s*)?(?:(?:\*\*)?(?P<speaker>[A-Z][\w.'’ \-]{0,40}?):(?:\*\*)?\s+)?"
+)
+
+
+def split_strings(text: str) -> List[Tuple[Optional[str], str]]:
+    turns = []
+    for line in text.splitlines():
+        for turn in TURN_BREAK.split(line):
+            match = LINE_PREFIX.match(turn)
+            body = turn[match.end():].strip()
+            if body:
+                turns.append((match.group("speaker"), body))
+    return turns
+
+
+def timed(function: Callable[[], Any], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - started)
+    return round(statistics.median(samples) * 1000, 2)
+
+
+def retained_kb(function: Callable[[], Any]) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = function()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return round((after - before) / 1024, 1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--corpus", default=str(ROOT / "meeting-notes"))
+    parser.add_argument("--inflate", type=int, default=1, help="Repeat each transcript's text N times.")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    results = []
+    for path in sorted(pathlib.Path(args.corpus).iterdir()):
+        if path.suffix.lower() not in SUPPORTED_EXTENSIONS:
+            continue
+        text = "\n".join([read_transcript(path)] * args.inflate)
+        transcript = Transcript.from_text(text)
+        blob = transcript.to_bytes()
+        row = {
+            "transcript": path.name,
+            "chars": len(text),
+            "turns": len(transcript),
+            "strings_ms": timed(lambda: split_strings(text), args.repeat),
+            "model_ms": timed(lambda: Transcript.from_text(text), args.repeat),
+            "strings_kb": retained_kb(lambda: split_strings(text)),
+            # The model keeps a reference to `text`, so only the index is counted.
+            "model_kb": retained_kb(lambda: Transcript.from_text(text)),
+            "cache_kb": round(len(blob) / 1024, 1),
+            "cache_load_ms": timed(lambda: Transcript.from_bytes(blob), args.repeat),
+        }
+        if args.inflate == 1:
+            row["read_strings_ms"] = timed(lambda: split_strings(read_transcript(path)), args.repeat)
+            row["read_model_ms"] = timed(lambda: read_structured(path), args.repeat)
+        results.append(row)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
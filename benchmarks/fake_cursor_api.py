@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Cursor Cloud Agents API used by the benchmarks.
+
+Implements `POST /agents`, `GET /agents/{id}`, `GET /agents/{id}/conversation`
+and `POST /agents/{id}/stop` over HTTP/1.1 with keep-alive, and counts
+connections and requests so client behaviour (handshakes, polls) can be
+measured without touching the real API. Every response can be delayed by
+`latency` seconds (± `latency_jitter`), a fraction `error_rate` of requests is
+answered with 503 and a fraction `failure_rate` of agents ends `FAILED`
+without a brief. A fraction `stall_rate` of status polls hangs for
+`stall_seconds` before answering, like a request stuck on a bad connection.
+
+With `streaming=True` (`--streaming`), a conversation request that accepts
+`text/event-stream` is answered with a chunked server-sent event stream: the
+user message, heartbeats while the agent runs, the brief as `delta` message
+events over the last `stream_write_fraction` of the run, then a terminal
+`status` event.
+
+Run standalone to point the runner at it:
+
+    python benchmarks/fake_cursor_api.py --port 8765 --completion-seconds 3
+    CURSOR_API_KEY=dummy CURSOR_API_BASE=http://127.0.0.1:8765/v0 \\
+        python scripts/run_cursor_meeting_agent.py --transcript notes.md
+"""
+
+from __future__ import annotations
+
+import argparse
+import collections
+import itertools
+import json
+import random
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Counter, Deque, Dict, Optional
+
+AGENT_PATH = re.compile(r"^/v0/agents/(?P<id>[^/]+)(?P<rest>/conversation|/stop)?$")
+
+
+class FakeAgent:
+    def __init__(self, agent_id: str, prompt: str, completion_seconds: float, fails: bool = False) -> None:
+        self.agent_id = agent_id
+        self.prompt = prompt
+        self.created = time.monotonic()
+        self.finishes_at = self.created + completion_seconds
+        self.fails = fails
+        self.stopped = False
+
+    @property
+    def status(self) -> str:
+        if self.stopped:
+            return "STOPPED"
+        if time.monotonic() < self.finishes_at:
+            return "RUNNING"
+        return "FAILED" if self.fails else "FINISHED"
+
+    def brief(self) -> str:
+        return f"## Summary\n\nFake brief for agent {self.agent_id} ({len(self.prompt)} prompt chars)."
+
+    def conversation(self) -> Dict[str, Any]:
+        messages = [{"id": "m1", "type": "user_message", "text": self.prompt[:200]}]
+        if not self.fails:
+            messages.append({"id": "m2", "type": "assistant_message", "text": self.brief()})
+        return {"id": self.agent_id, "messages": messages}
+
+
+class FakeCursorState:
+    def __init__(
+        self,
+        completion_seconds: float = 1.0,
+        completion_jitter: float = 0.0,
+        seconds_per_kchar: float = 0.0,
+        throttle_every: int = 0,
+        retry_after: float = 1.0,
+        streaming: bool = False,
+        stream_write_fraction: float = 0.2,
+        heartbeat_seconds: float = 1.0,
+        launch_limit: int = 0,
+        poll_limit: int = 0,
+        error_rate: float = 0.0,
+        failure_rate: float = 0.0,
+        latency: float = 0.0,
+        latency_jitter: float = 0.0,
+        stall_rate: float = 0.0,
+        stall_seconds: float = 30.0,
+        seed: Optional[int] = None,
+    ) -> None:
+        self.completion_seconds = completion_seconds
+        self.completion_jitter = completion_jitter
+        self.seconds_per_kchar = seconds_per_kchar
+        self.throttle_every = throttle_every
+        self.retry_after = retry_after
+        self.streaming = streaming
+        self.stream_write_fraction = stream_write_fraction
+        self.heartbeat_seconds = heartbeat_seconds
+        self.limits = {"launch": launch_limit, "poll": poll_limit}
+        self.error_rate = error_rate
+        self.failure_rate = failure_rate
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.stall_rate = stall_rate
+        self.stall_seconds = stall_seconds
+        self._windows: Dict[str, Deque[float]] = {"launch": collections.deque(), "poll": collections.deque()}
+        self.agents: Dict[str, FakeAgent] = {}
+        self.counts: Counter[str] = collections.Counter()
+        self.lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._rng = random.Random(seed)
+
+    def should_throttle(self) -> bool:
+        """Every `throttle_every`-th status poll is answered with 429 + Retry-After."""
+        if not self.throttle_every:
+            return False
+        with self.lock:
+            return self.counts["status"] % self.throttle_every == 0
+
+    def over_limit(self, kind: str) -> Optional[float]:
+        """Seconds until a `kind` request would be allowed, or None if it is allowed now."""
+        limit = self.limits[kind]
+        if not limit:
+            return None
+        now = time.monotonic()
+        with self.lock:
+            window = self._windows[kind]
+            while window and window[0] <= now - 1.0:
+                window.popleft()
+            if len(window) >= limit:
+                return window[0] + 1.0 - now
+            window.append(now)
+            return None
+
+    def should_fail(self) -> bool:
+        if not self.error_rate:
+            return False
+        with self.lock:
+            return self._rng.random() < self.error_rate
+
+    def delay(self) -> None:
+        """Simulated network/server latency for one request."""
+        if not self.latency:
+            return
+        with self.lock:
+            spread = self.latency * self.latency_jitter
+            seconds = self._rng.uniform(self.latency - spread, self.latency + spread)
+        time.sleep(max(0.0, seconds))
+
+    def stall(self) -> None:
+        """Hang a fraction `stall_rate` of status polls for `stall_seconds`."""
+        if not self.stall_rate:
+            return
+        with self.lock:
+            stalls = self._rng.random() < self.stall_rate
+            if stalls:
+                self.counts["stalled"] += 1
+        if stalls:
+            time.sleep(self.stall_seconds)
+
+    def count(self, key: str) -> None:
+        with self.lock:
+            self.counts[key] += 1
+
+    def create_agent(self, prompt: str) -> FakeAgent:
+        with self.lock:
+            agent_id = f"bc_fake{next(self._ids):05d}"
+            spread = self.completion_seconds * self.completion_jitter
+            duration = max(0.0, self._rng.uniform(self.completion_seconds - spread, self.completion_seconds + spread))
+            duration += len(prompt) / 1000 * self.seconds_per_kchar
+            fails = bool(self.failure_rate) and self._rng.random() < self.failure_rate
+            if fails:
+                self.counts["failed_agents"] += 1
+            agent = FakeAgent(agent_id, prompt, duration, fails)
+            self.agents[agent_id] = agent
+            return agent
+
+
+class FakeCursorHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: "FakeCursorServer"
+
+    def setup(self) -> None:
+        super().setup()
+        self.server.state.count("connections")
+
+    def log_message(self, format: str, *args: Any) -> None:
+        return
+
+    def _send_json(self, status: int, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self) -> Dict[str, Any]:
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b"{}"
+        return json.loads(raw.decode("utf-8") or "{}")
+
+    def _write_chunk(self, text: str) -> None:
+        data = text.encode("utf-8")
+        self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+        self.wfile.flush()
+
+    def _send_event(self, event: str, payload: Dict[str, Any]) -> None:
+        self._write_chunk(f"event: {event}\ndata: {json.dumps(payload)}\n\n")
+
+    def _stream_conversation(self, agent: FakeAgent) -> None:
+        state = self.server.state
+        state.count("streams")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        self._send_event("status", {"status": "RUNNING"})
+        self._send_event("message", {"id": "m1", "type": "user_message", "text": agent.prompt[:200]})
+        # A failing agent writes nothing, but the stream still runs until it ends.
+        lines = [""] if agent.fails else agent.brief().splitlines(keepends=True)
+        duration = agent.finishes_at - agent.created
+        writing_starts = agent.finishes_at - duration * state.stream_write_fraction
+        for index, line in enumerate(lines, start=1):
+            emit_at = writing_starts + (agent.finishes_at - writing_starts) * index / len(lines)
+            remaining = emit_at - time.monotonic()
+            while remaining > 0:
+                time.sleep(min(state.heartbeat_seconds, remaining))
+                remaining = emit_at - time.monotonic()
+                if remaining > 0:
+                    self._write_chunk(": heartbeat\n\n")
+            if line:
+                self._send_event("message", {"id": "m2", "type": "assistant_message", "text": line, "delta": True})
+        self._send_event("status", {"status": agent.status})
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _reject(self, kind: str) -> bool:
+        """Answer with an injected 503 or a rate-limit 429 if the request should not be served."""
+        state = self.server.state
+        if state.should_fail():
+            state.count("errors")
+            self._send_json(503, {"error": "unavailable"})
+            return True
+        wait = state.over_limit(kind)
+        if wait is not None:
+            state.count(f"rate_limited_{kind}")
+            self._send_json(429, {"error": "rate limited"}, {"Retry-After": f"{wait:.3f}"})
+            return True
+        return False
+
+    def do_POST(self) -> None:
+        state = self.server.state
+        state.count("requests")
+        state.delay()
+        match = AGENT_PATH.match(self.path)
+        if match and match.group("rest") == "/stop":
+            self._read_json()
+            agent = state.agents.get(match.group("id"))
+            if agent is None:
+                self._send_json(404, {"error": "not found"})
+                return
+            state.count("stop")
+            agent.stopped = True
+            self._send_json(200, {"id": agent.agent_id})
+            return
+        if self.path != "/v0/agents":
+            self._send_json(404, {"error": "not found"})
+            return
+        payload = self._read_json()
+        if self._reject("launch"):
+            return
+        state.count("launch")
+        agent = state.create_agent(payload.get("prompt", {}).get("text", ""))
+        self._send_json(201, {"id": agent.agent_id, "status": "CREATING"})
+
+    def do_GET(self) -> None:
+        state = self.server.state
+        state.count("requests")
+        state.delay()
+        match = AGENT_PATH.match(self.path)
+        agent = state.agents.get(match.group("id")) if match and match.group("rest") != "/stop" else None
+        if agent is None:
+            self._send_json(404, {"error": "not found"})
+            return
+        if self._reject("poll"):
+            return
+        if match.group("rest"):
+            state.count("conversation")
+            if state.streaming and "text/event-stream" in (self.headers.get("Accept") or ""):
+                self._stream_conversation(agent)
+            else:
+                self._send_json(200, agent.conversation())
+            return
+        state.count("status")
+        state.stall()
+        if state.should_throttle():
+            state.count("throttled")
+            self._send_json(429, {"error": "rate limited"}, {"Retry-After": f"{state.retry_after:g}"})
+            return
+        self._send_json(200, {"id": agent.agent_id, "status": agent.status})
+
+
+class FakeCursorServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, port: int = 0, **state_options: Any) -> None:
+        super().__init__(("127.0.0.1", port), FakeCursorHandler)
+        self.state = FakeCursorState(**state_options)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/v0"
+
+    def __enter__(self) -> "FakeCursorServer":
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.shutdown()
+        self.server_close()
+
+    def handle_error(self, request: Any, client_address: Any) -> None:
+        if not isinstance(sys.exc_info()[1], (BrokenPipeError, ConnectionResetError)):
+            super().handle_error(request, client_address)  # a cancelled client hanging up is expected
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve a fake Cursor Cloud Agents API locally.")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--completion-seconds", type=float, default=3.0)
+    parser.add_argument("--completion-jitter", type=float, default=0.0, help="Fractional spread of completion times.")
+    parser.add_argument(
+        "--seconds-per-kchar", type=float, default=0.0, help="Extra completion time per 1000 prompt characters."
+    )
+    parser.add_argument("--throttle-every", type=int, default=0, help="Answer every Nth status poll with 429.")
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    parser.add_argument("--streaming", action="store_true", help="Serve conversations as event streams on request.")
+    parser.add_argument("--launch-limit", type=int, default=0, help="Agent launches allowed per second (0: no limit).")
+    parser.add_argument("--poll-limit", type=int, default=0, help="Status/conversation reads allowed per second.")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 503.")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Fraction of agents that end FAILED.")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response.")
+    parser.add_argument("--latency-jitter", type=float, default=0.0, help="Fractional spread of the added latency.")
+    parser.add_argument("--stall-rate", type=float, default=0.0, help="Fraction of status polls that hang.")
+    parser.add_argument("--stall-seconds", type=float, default=30.0, help="How long a stalled poll hangs.")
+    args = parser.parse_args()
+    server = FakeCursorServer(
+        args.port,
+        completion_seconds=args.completion_seconds,
+        completion_jitter=args.completion_jitter,
+        seconds_per_kchar=args.seconds_per_kchar,
+        throttle_every=args.throttle_every,
+        retry_after=args.retry_after,
+        streaming=args.streaming,
+        launch_limit=args.launch_limit,
+        poll_limit=args.poll_limit,
+        error_rate=args.error_rate,
+        failure_rate=args.failure_rate,
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        stall_rate=args.stall_rate,
+        stall_seconds=args.stall_seconds,
+    )
+    print(f"Fake Cursor API listening on {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(json.dumps(dict(server.state.counts)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+End-to-end and extractor benchmark suite with machine-readable results.
+
+Generates synthetic `.md`, `.docx` and `.pdf` transcripts at several sizes,
+then runs each case in a fresh child process so its peak RSS is its own:
+
+* `extract:<fmt>:<chars>` – `read_transcript` on one file, repeated;
+* `e2e:<fmt>` – the runner's `process_batch` over `--transcripts` files
+  against the fake Cursor API (started here, outside the measured process)
+  with the configured latency, 503 rate, agent failure rate and completion
+  times.
+
+Each case reports throughput, p50/p95 latency and peak RSS; end-to-end cases
+also report server-side request counts, client retries and brief sources.
+Results go to `benchmarks/results/<commit>.json`; `--compare` prints the
+change against an earlier results file and exits non-zero on regressions
+beyond `--tolerance`.
+
+    python benchmarks/run_suite.py
+    python benchmarks/run_suite.py --quick --compare benchmarks/results/<old>.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import datetime as dt
+import io
+import json
+import os
+import pathlib
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+from fake_cursor_api import FakeCursorServer  # noqa: E402
+from synthetic_transcripts import write_transcript  # noqa: E402
+
+DEFAULT_RESULTS_DIR = ROOT / "benchmarks" / "results"
+FORMATS = ("md", "docx", "pdf")
+# Metric name -> True if higher is better; only these are compared across runs.
+COMPARED_METRICS = {
+    "throughput_per_min": True,
+    "kchars_per_s": True,
+    "p50_s": False,
+    "p95_s": False,
+    "peak_rss_mb": False,
+    "requests": False,
+}
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is kilobytes on Linux, bytes on macOS.
+    scale = 1 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale / 1e6
+
+
+def run_extract_case(spec: Dict[str, Any]) -> Dict[str, Any]:
+    from transcript_ingest import read_transcript
+
+    path = pathlib.Path(spec["path"])
+    baseline = peak_rss_mb()
+    samples = []
+    chars = 0
+    for _ in range(spec["repeat"]):
+        started = time.perf_counter()
+        chars = len(read_transcript(path))
+        samples.append(time.perf_counter() - started)
+    size_mb = path.stat().st_size / 1e6
+    return {
+        "file_mb": round(size_mb, 3),
+        "chars": chars,
+        "runs": len(samples),
+        "p50_s": round(percentile(samples, 0.5), 4),
+        "p95_s": round(percentile(samples, 0.95), 4),
+        "kchars_per_s": round(chars / 1000 / statistics.median(samples), 1),
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+        "rss_over_baseline_mb": round(peak_rss_mb() - baseline, 1),
+    }
+
+
+def run_e2e_case(spec: Dict[str, Any]) -> Dict[str, Any]:
+    from agent_cli import add_agent_arguments, configure_agent_args
+    from agent_runs import install_shared_client
+    from cursor_api import get_client
+    from meeting_briefs import process_batch
+
+    os.environ["CURSOR_API_KEY"] = "bench"
+    os.environ["CURSOR_API_BASE"] = spec["base_url"]
+    parser = argparse.ArgumentParser()
+    add_agent_arguments(parser)
+    args = parser.parse_args(spec["runner_args"])
+    args.output = args.slug = args.meeting_date = args.meeting_title = None
+    configure_agent_args(parser, args)
+    install_shared_client(args)
+
+    transcripts = [pathlib.Path(path) for path in spec["transcripts"]]
+    latencies: List[float] = []
+    sources: Dict[str, int] = {}
+    errors = 0
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for record in process_batch(transcripts, args):
+            latencies.append(record["total_s"])
+            errors += record["error"] is not None
+            source = record.get("source", "error")
+            sources[source] = sources.get(source, 0) + 1
+    wall = time.perf_counter() - started
+    return {
+        "transcripts": len(transcripts),
+        "wall_s": round(wall, 3),
+        "throughput_per_min": round(len(transcripts) / wall * 60, 1),
+        "p50_s": round(percentile(latencies, 0.5), 3),
+        "p95_s": round(percentile(latencies, 0.95), 3),
+        "errors": errors,
+        "sources": sources,
+        "client_retries": get_client().retries,
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+    }
+
+
+def run_child(spec: Dict[str, Any], cwd: pathlib.Path) -> Dict[str, Any]:
+    completed = subprocess.run(
+        [sys.executable, __file__, "--run-case", json.dumps(spec)],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode != 0:
+        return {"error": completed.stderr.strip().splitlines()[-1:] or [f"exit {completed.returncode}"]}
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def git_commit() -> Dict[str, Any]:
+    def git(*argv: str) -> str:
+        return subprocess.run(["git", *argv], cwd=ROOT, capture_output=True, text=True).stdout.strip()
+
+    return {"commit": git("rev-parse", "--short", "HEAD") or "unknown", "dirty": bool(git("status", "--porcelain"))}
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> int:
+    regressions = 0
+    print(f"Compared with {baseline.get('commit', '?')} (tolerance {tolerance:.0%}):", file=sys.stderr)
+    for case, metrics in current["cases"].items():
+        previous = baseline.get("cases", {}).get(case)
+        if not previous:
+            continue
+        for metric, higher_is_better in COMPARED_METRICS.items():
+            old, new = previous.get(metric), metrics.get(metric)
+            if not isinstance(old, (int, float)) or not isinstance(new, (int, float)) or not old:
+                continue
+            change = (new - old) / old
+            worse = -change if higher_is_better else change
+            flag = "REGRESSION" if worse > tolerance else ""
+            regressions += bool(flag)
+            print(f"  {case:<24} {metric:<20} {old:>10} -> {new:<10} {change:+.1%} {flag}", file=sys.stderr)
+    return regressions
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run the benchmark suite and write JSON results.")
+    parser.add_argument("--run-case", help=argparse.SUPPRESS)
+    parser.add_argument("--quick", action="store_true", help="Small sizes and few transcripts (smoke run).")
+    parser.add_argument("--formats", default=",".join(FORMATS), help="Comma-separated transcript formats.")
+    parser.add_argument("--sizes", default="20000,200000,2000000", help="Extractor case sizes in characters.")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per extractor case.")
+    parser.add_argument("--transcripts", type=int, default=24, help="Transcripts per end-to-end case.")
+    parser.add_argument("--transcript-chars", type=int, default=30000, help="Size of end-to-end transcripts.")
+    parser.add_argument("--max-concurrency", type=int, default=8)
+    parser.add_argument("--completion-seconds", type=float, default=0.5)
+    parser.add_argument("--completion-jitter", type=float, default=0.5)
+    parser.add_argument("--latency", type=float, default=0.01, help="Fake API seconds per response.")
+    parser.add_argument("--error-rate", type=float, default=0.02, help="Fraction of API requests answered 503.")
+    parser.add_argument("--failure-rate", type=float, default=0.05, help="Fraction of agents that end FAILED.")
+    parser.add_argument(
+        "--runner-args",
+        default="",
+        help="Extra runner options for end-to-end cases, e.g. --runner-args='--stream --poll-policy adaptive'.",
+    )
+    parser.add_argument("--skip-e2e", action="store_true")
+    parser.add_argument("--skip-extract", action="store_true")
+    parser.add_argument("--output", help=f"Results file (default: {DEFAULT_RESULTS_DIR.relative_to(ROOT)}/<commit>.json).")
+    parser.add_argument("--compare", help="Earlier results file to compare against.")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="Relative change counted as a regression.")
+    args = parser.parse_args()
+    if args.quick:
+        args.sizes, args.repeat, args.transcripts = "20000,200000", 2, 6
+    return args
+
+
+def main() -> None:
+    args = parse_args()
+    if args.run_case:
+        spec = json.loads(args.run_case)
+        result = run_extract_case(spec) if spec["kind"] == "extract" else run_e2e_case(spec)
+        print(json.dumps(result))
+        return
+
+    formats = [item for item in args.formats.split(",") if item]
+    sizes = [int(item) for item in args.sizes.split(",") if item]
+    cases: Dict[str, Any] = {}
+    with tempfile.TemporaryDirectory(prefix="meeting-bench-") as tmp:
+        workdir = pathlib.Path(tmp)
+        if not args.skip_extract:
+            for fmt in formats:
+                for chars in sizes:
+                    path = write_transcript(workdir / f"extract-{chars}.{fmt}", chars, seed=chars)
+                    name = f"extract:{fmt}:{chars}"
+                    cases[name] = run_child({"kind": "extract", "path": str(path), "repeat": args.repeat}, workdir)
+                    print(f"[suite] {name}: {cases[name]}", file=sys.stderr)
+        if not args.skip_e2e:
+            runner_args = [
+                "--no-cache",
+                "--no-journal",
+                "--max-concurrency",
+                str(args.max_concurrency),
+                "--poll-min-interval",
+                "0.05",
+                "--poll-max-interval",
+                "0.5",
+                *args.runner_args.split(),
+            ]
+            for fmt in formats:
+                directory = workdir / f"e2e-{fmt}"
+                directory.mkdir()
+                transcripts = [
+                    str(write_transcript(directory / f"2026-01-{index % 28 + 1:02d}-meeting-{index}.{fmt}", args.transcript_chars, seed=index))
+                    for index in range(args.transcripts)
+                ]
+                with FakeCursorServer(
+                    completion_seconds=args.completion_seconds,
+                    completion_jitter=args.completion_jitter,
+                    latency=args.latency,
+                    error_rate=args.error_rate,
+                    failure_rate=args.failure_rate,
+                    streaming=True,
+                    seed=1,
+                ) as server:
+                    spec = {
+                        "kind": "e2e",
+                        "base_url": server.base_url,
+                        "transcripts": transcripts,
+                        "runner_args": runner_args,
+                    }
+                    result = run_child(spec, directory)
+                    counts = dict(server.state.counts)
+                result["requests"] = counts.get("requests", 0)
+                result["server_counts"] = counts
+                name = f"e2e:{fmt}"
+                cases[name] = result
+                print(f"[suite] {name}: {result}", file=sys.stderr)
+
+    results = {
+        **git_commit(),
+        "timestamp": dt.datetime.now(dt.timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {key: value for key, value in vars(args).items() if key not in ("run_case", "output", "compare")},
+        "cases": cases,
+    }
+    output = pathlib.Path(args.output) if args.output else DEFAULT_RESULTS_DIR / f"{results['commit']}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+    print(f"Wrote benchmark results to {output}")
+
+    regressions = 0
+    if args.compare:
+        regressions = compare(results, json.loads(pathlib.Path(args.compare).read_text(encoding="utf-8")), args.tolerance)
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Synthetic transcript generators for the benchmarks (stdlib only).
+"""
+
+from __future__ import annotations
+
+import pathlib
+import random
+import zipfile
+from typing import List
+from xml.sax.saxutils import escape
+
+SPEAKERS = ["Kate Oconer", "Ahmad Elkassaby", "Emma Nghiem", "Yashpal Deswal", "Godhavari Gopal"]
+WORDS = (
+    "promo code quotation premium breakdown referral integration api talon validation "
+    "proposal admin portal budget marketing discount policy renewal claim workflow "
+    "decision action owner deadline sprint release environment deployment"
+).split()
+
+
+def transcript_lines(count: int, seed: int = 0) -> List[str]:
+    rng = random.Random(seed)
+    lines = []
+    for index in range(count):
+        speaker = SPEAKERS[index % len(SPEAKERS)] if rng.random() > 0.3 else rng.choice(SPEAKERS)
+        sentence = " ".join(rng.choice(WORDS) for _ in range(rng.randint(6, 18)))
+        lines.append(f"{speaker}: {sentence.capitalize()}.")
+    return lines
+
+
+def transcript_of_size(chars: int, seed: int = 0) -> List[str]:
+    """Fake transcript lines totalling roughly `chars` characters."""
+    lines: List[str] = []
+    total = 0
+    batch = 0
+    while total < chars:
+        for line in transcript_lines(max(1, chars // 80), seed + batch):
+            if total >= chars:
+                break
+            lines.append(line)
+            total += len(line) + 1
+        batch += 1
+    return lines
+
+
+def write_markdown(path: pathlib.Path, lines: List[str], title: str = "Synthetic meeting") -> pathlib.Path:
+    path.write_text(f"# {title}\n\n" + "\n\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+DOCX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    "</Types>"
+)
+DOCX_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="word/document.xml"/>'
+    "</Relationships>"
+)
+
+
+def write_docx(path: pathlib.Path, lines: List[str]) -> pathlib.Path:
+    """Write a minimal Word document with one paragraph (speaker run + text run) per line."""
+    paragraphs = []
+    for line in lines:
+        speaker, _, text = line.partition(": ")
+        paragraphs.append(
+            f'<w:p><w:r><w:rPr><w:b/></w:rPr><w:t xml:space="preserve">{escape(speaker)}: </w:t></w:r>'
+            f"<w:r><w:t>{escape(text)}</w:t></w:r></w:p>"
+        )
+    document = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"><w:body>'
+        + "".join(paragraphs)
+        + "</w:body></w:document>"
+    )
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("[Content_Types].xml", DOCX_CONTENT_TYPES)
+        archive.writestr("_rels/.rels", DOCX_RELS)
+        archive.writestr("word/document.xml", document)
+    return path
+
+
+def write_transcript(path: pathlib.Path, chars: int, seed: int = 0) -> pathlib.Path:
+    """Write a transcript of about `chars` characters in the format given by `path`'s suffix."""
+    lines = transcript_of_size(chars, seed)
+    suffix = path.suffix.lower()
+    if suffix in (".md", ".txt"):
+        return write_markdown(path, lines)
+    if suffix == ".docx":
+        return write_docx(path, lines)
+    if suffix == ".pdf":
+        lines_per_page = 40
+        return write_pdf(path, max(1, -(-len(lines) // lines_per_page)), lines_per_page, seed)
+    raise ValueError(f"no synthetic writer for {suffix}")
+
+
+def _pdf_escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def write_pdf(path: pathlib.Path, pages: int, lines_per_page: int = 40, seed: int = 0) -> pathlib.Path:
+    """Write a text-only PDF with `pages` pages of fake transcript lines."""
+    lines = transcript_lines(pages * lines_per_page, seed)
+    objects: List[bytes] = []
+    page_ids = [3 + 2 * index for index in range(pages)]
+    font_id = 3 + 2 * pages
+    objects.append(b"<< /Type /Catalog /Pages 2 0 R >>")
+    kids = " ".join(f"{page_id} 0 R" for page_id in page_ids)
+    objects.append(f"<< /Type /Pages /Kids [{kids}] /Count {pages} >>".encode())
+    for index, page_id in enumerate(page_ids):
+        chunk = lines[index * lines_per_page:(index + 1) * lines_per_page]
+        stream = ["BT", "/F1 9 Tf", "11 TL", "40 800 Td"]
+        stream.extend(f"({_pdf_escape(line[:110])}) Tj T*" for line in chunk)
+        stream.append("ET")
+        data = "\n".join(stream).encode("latin-1", errors="replace")
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            f"/Resources << /Font << /F1 {font_id} 0 R >> >> /Contents {page_id + 1} 0 R >>".encode()
+        )
+        objects.append(b"<< /Length %d >>\nstream\n" % len(data) + data + b"\nendstream")
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n".encode() + body + b"\nendobj\n"
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    out += b"".join(f"{offset:010d} 00000 n \n".encode() for offset in offsets)
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    path.write_bytes(bytes(out))
+    return path
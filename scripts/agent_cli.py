@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Command-line options shared by every entry point that dispatches agents.
+
+`add_agent_arguments` declares the options (concurrency, polling, rate
+limits, deadlines, templates, chunking, normalisation, caches, journal,
+telemetry, manifest) and `configure_agent_args` validates them and turns them
+into run state on the namespace: the poll policy, the selected templates, the
+caches, the journal, the manifest, the run deadline and the agent slots that
+cap running agents at `--max-concurrency`. The runner and
+`meeting_pipeline.py` both build their parsers from these.
+"""
+
+from __future__ import annotations
+
+import argparse
+import pathlib
+import threading
+from typing import Dict, List, Optional
+
+import telemetry
+from agent_journal import DEFAULT_JOURNAL_PATH, AgentJournal
+from brief_cache import DEFAULT_CACHE_DIR, BriefCache
+from chunking import DEFAULT_CHUNK_CHARS, DEFAULT_OVERLAP_CHARS
+from cursor_api import DEFAULT_MAX_RETRIES, Deadline
+from meeting_briefs import ARCHITECTURE_TEMPLATE
+from polling import POLICY_NAMES, build_policy
+from prompt_templates import DEFAULT_TEMPLATE, load_templates, select_templates
+from rate_limit import DEFAULT_LAUNCH_RATE, DEFAULT_POLL_RATE
+from transcript_ingest import ExtractionCache
+from transcript_ingest.cache import DEFAULT_CACHE_DIR as DEFAULT_EXTRACTION_CACHE_DIR
+from transcript_manifest import TranscriptManifest
+
+
+def add_agent_arguments(parser: argparse.ArgumentParser) -> None:
+    """Options shared by every entry point that dispatches agents (runner, pipeline)."""
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=4,
+        help="Maximum number of agents running at once, across transcripts, templates and chunks (default: 4).",
+    )
+    parser.add_argument(
+        "--stakeholders",
+        help="Comma-separated stakeholder names/roles for the prompt.",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=int,
+        default=600,
+        help="Seconds to wait for the agent to finish (default: 600).",
+    )
+    parser.add_argument(
+        "--poll-policy",
+        choices=POLICY_NAMES,
+        default="backoff",
+        help="How to space status checks: fixed, backoff or adaptive (default: backoff).",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=5,
+        help="Seconds between status checks for the fixed policy (default: 5).",
+    )
+    parser.add_argument(
+        "--poll-min-interval",
+        type=float,
+        default=1,
+        help="First/shortest delay for the backoff and adaptive policies (default: 1).",
+    )
+    parser.add_argument(
+        "--poll-max-interval",
+        type=float,
+        default=30,
+        help="Delay cap for the backoff and adaptive policies (default: 30).",
+    )
+    parser.add_argument(
+        "--poll-history",
+        help="Completion-time history used by the adaptive policy "
+        "(default: .cache/agent-durations.json).",
+    )
+    parser.add_argument(
+        "--launch-rate",
+        type=float,
+        default=DEFAULT_LAUNCH_RATE,
+        help=f"Agent launches per second across all workers, 0 for unlimited (default: {DEFAULT_LAUNCH_RATE:g}).",
+    )
+    parser.add_argument(
+        "--poll-rate",
+        type=float,
+        default=DEFAULT_POLL_RATE,
+        help=f"Status/conversation requests per second across all workers, 0 for unlimited "
+        f"(default: {DEFAULT_POLL_RATE:g}).",
+    )
+    parser.add_argument(
+        "--max-retries",
+        type=int,
+        default=DEFAULT_MAX_RETRIES,
+        help=f"Retries for 429/5xx responses before giving up (default: {DEFAULT_MAX_RETRIES}).",
+    )
+    parser.add_argument(
+        "--deadline",
+        type=float,
+        help="Overall run budget in seconds; requests and agent waits are cut short when it runs out.",
+    )
+    parser.add_argument(
+        "--detach-on-cancel",
+        action="store_true",
+        help="On Ctrl-C/SIGTERM leave running agents for the journal to resume instead of stopping them.",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream the agent conversation instead of polling, writing <output>.partial "
+        "as the brief arrives (falls back to polling if the API does not stream).",
+    )
+    parser.add_argument(
+        "--branch-name",
+        help="Optional branch name to send in the agent target payload.",
+    )
+    parser.add_argument(
+        "--templates",
+        default=DEFAULT_TEMPLATE,
+        help="Comma-separated brief templates to produce from each transcript "
+        f"(default: {DEFAULT_TEMPLATE}; others are read from docs/templates/).",
+    )
+    parser.add_argument(
+        "--template-dir",
+        help="Directory of template spec files (default: docs/templates/).",
+    )
+    parser.add_argument(
+        "--chunk-chars",
+        type=int,
+        default=DEFAULT_CHUNK_CHARS,
+        help="Transcripts longer than this are summarised map-reduce style in chunks "
+        f"of at most this many characters (default: {DEFAULT_CHUNK_CHARS}).",
+    )
+    parser.add_argument(
+        "--chunk-overlap",
+        type=int,
+        default=DEFAULT_OVERLAP_CHARS,
+        help=f"Characters of context repeated between consecutive chunks (default: {DEFAULT_OVERLAP_CHARS}).",
+    )
+    parser.add_argument(
+        "--no-chunking",
+        action="store_true",
+        help="Always send the whole transcript to a single agent.",
+    )
+    parser.add_argument(
+        "--no-normalize",
+        action="store_true",
+        help="Send the extracted transcript verbatim instead of normalising it "
+        "(whitespace, filler turns, repeated paragraphs, same-speaker merging).",
+    )
+    parser.add_argument(
+        "--strip-timestamps",
+        action="store_true",
+        help="Also drop timestamps while normalising.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=str(DEFAULT_CACHE_DIR),
+        help=f"Directory of cached agent briefs (default: {DEFAULT_CACHE_DIR}).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Neither read nor write the brief cache.",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore cached briefs but store the fresh agent results.",
+    )
+    parser.add_argument(
+        "--extraction-cache-dir",
+        default=str(DEFAULT_EXTRACTION_CACHE_DIR),
+        help="Directory of extracted .docx/.pdf text shared with run_cursor_cloud_agent.py "
+        f"(default: {DEFAULT_EXTRACTION_CACHE_DIR}).",
+    )
+    parser.add_argument(
+        "--no-extraction-cache",
+        action="store_true",
+        help="Always re-extract .docx/.pdf transcripts.",
+    )
+    parser.add_argument(
+        "--pdf-workers",
+        type=int,
+        help="Processes of the shared PDF extraction pool (default: $TRANSCRIPT_PDF_WORKERS or CPU count; "
+        "1 extracts serially).",
+    )
+    parser.add_argument(
+        "--journal",
+        default=str(DEFAULT_JOURNAL_PATH),
+        help=f"Journal of launched agents used to resume interrupted runs (default: {DEFAULT_JOURNAL_PATH}).",
+    )
+    parser.add_argument(
+        "--no-journal",
+        action="store_true",
+        help="Do not record or resume launched agents.",
+    )
+    parser.add_argument(
+        "--metrics-file",
+        help="Write span timings and HTTP/poll metrics to this JSON-lines file.",
+    )
+    parser.add_argument(
+        "--otel-file",
+        help="Write spans to this file in OpenTelemetry OTLP/JSON format.",
+    )
+    parser.add_argument(
+        "--profile",
+        help="Dump a cProfile of the local (extraction/prompt/write) stages to this file.",
+    )
+    parser.add_argument(
+        "--manifest",
+        help="Record each transcript's blob SHA and brief in this manifest "
+        "(e.g. meeting_outputs/.manifest.json) once an agent brief is written.",
+    )
+
+
+def configure_agent_args(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    if args.max_concurrency < 1:
+        parser.error("--max-concurrency must be at least 1")
+    if args.chunk_chars < 1000:
+        parser.error("--chunk-chars must be at least 1000")
+    if args.launch_rate < 0 or args.poll_rate < 0 or args.max_retries < 0:
+        parser.error("--launch-rate, --poll-rate and --max-retries cannot be negative")
+    if args.deadline is not None and args.deadline <= 0:
+        parser.error("--deadline must be positive")
+    if args.pdf_workers is not None:
+        if args.pdf_workers < 1:
+            parser.error("--pdf-workers must be at least 1")
+        from transcript_ingest import pdf  # only when asked for: it imports PyPDF2
+
+        pdf.set_workers(args.pdf_workers)
+    args.run_deadline = Deadline.after(args.deadline) if args.deadline else None
+    args.agent_slots = threading.BoundedSemaphore(args.max_concurrency)
+    args.policy = build_policy(
+        args.poll_policy,
+        args.poll_interval,
+        args.poll_min_interval,
+        args.poll_max_interval,
+        pathlib.Path(args.poll_history) if args.poll_history else None,
+    )
+    try:
+        template_dir = pathlib.Path(args.template_dir) if args.template_dir else None
+        args.templates = select_templates(load_templates(ARCHITECTURE_TEMPLATE, template_dir), args.templates)
+    except ValueError as exc:
+        parser.error(str(exc))
+    args.cache = None if args.no_cache else BriefCache(pathlib.Path(args.cache_dir))
+    args.extraction_cache = (
+        None if args.no_extraction_cache else ExtractionCache(pathlib.Path(args.extraction_cache_dir))
+    )
+    args.manifest = TranscriptManifest(pathlib.Path(args.manifest)) if args.manifest else None
+    args.journal = None if args.no_journal else AgentJournal(pathlib.Path(args.journal))
+    telemetry.configure(args.metrics_file, args.otel_file, args.profile)
+
+
+def collect_transcripts(transcripts: List[str], batch_file: Optional[str]) -> List[pathlib.Path]:
+    paths = [pathlib.Path(item) for item in transcripts]
+    if batch_file:
+        for line in pathlib.Path(batch_file).read_text(encoding="utf-8").splitlines():
+            line = line.strip()
+            if line and not line.startswith("#"):
+                paths.append(pathlib.Path(line))
+    unique: Dict[str, pathlib.Path] = {}
+    for path in paths:
+        unique.setdefault(path.as_posix(), path)
+    return list(unique.values())
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Append-only journal of launched agents, so interrupted runs can resume.
+
+Every state change is one JSON line in `.cache/agent-journal.jsonl`:
+
+* `{"kind": "agent", "key": <prompt sha256>, "agent_id": ..., "status": ...}`
+  when an agent is launched and when it reaches a terminal status;
+* `{"kind": "brief", "key": <brief cache key>, "transcript": ..., "output": ...}`
+  once a transcript's brief has been written.
+
+A re-run after a cancelled or timed-out job re-attaches to agents that were
+still running (or already finished) instead of launching new ones for the
+same prompt, and skips transcripts whose brief was already written. Each
+record is a single `write()` on an `O_APPEND` descriptor, guarded by a lock,
+so worker threads (and concurrent processes on a local filesystem) never
+interleave lines. Loading keeps the latest record per key and drops entries
+older than `max_age_days`.
+
+`compact()` rewrites the file with one line per key. It runs when a journal
+is opened with superseded lines, but only under an exclusive `flock` on
+`<journal>.lock`, which appenders hold shared while they write. It re-reads
+the file under that lock, so lines other processes appended since are kept,
+and it is skipped while another process is writing. Without `fcntl`
+(Windows) the journal is only ever appended to.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import pathlib
+import threading
+import time
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+
+from atomic_write import write_atomic
+
+DEFAULT_JOURNAL_PATH = pathlib.Path(".cache/agent-journal.jsonl")
+DEFAULT_MAX_AGE_DAYS = 7
+RESUMABLE_STATUSES = {"CREATING", "RUNNING", "FINISHED"}
+
+
+def prompt_key(prompt: str) -> str:
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+
+class AgentJournal:
+    def __init__(self, path: pathlib.Path = DEFAULT_JOURNAL_PATH, max_age_days: float = DEFAULT_MAX_AGE_DAYS) -> None:
+        self.path = path
+        self.lock_path = path.with_name(path.name + ".lock")
+        self.max_age = max_age_days * 86400
+        self._lock = threading.Lock()
+        self.entries, lines = self._load()
+        if lines > len(self.entries):
+            self.compact()
+
+    def _load(self) -> Tuple[Dict[str, Dict[str, Any]], int]:
+        """Latest unexpired record per key, and the number of lines read."""
+        entries: Dict[str, Dict[str, Any]] = {}
+        lines = 0
+        try:
+            handle = self.path.open("r", encoding="utf-8")
+        except OSError:
+            return entries, lines
+        cutoff = time.time() - self.max_age
+        with handle:
+            for line in handle:
+                lines += 1
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # torn final line from a killed process
+                if isinstance(record, dict) and record.get("key") and record.get("ts", 0) >= cutoff:
+                    entries[f"{record.get('kind')}:{record['key']}"] = record
+        return entries, lines
+
+    @contextlib.contextmanager
+    def _file_lock(self, exclusive: bool) -> Iterator[bool]:
+        """Hold `lock_path` shared (blocking) or exclusive (non-blocking); yields whether it is held."""
+        if fcntl is None:
+            yield not exclusive
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB if exclusive else fcntl.LOCK_SH)
+            except BlockingIOError:
+                yield False
+                return
+            yield True
+        finally:
+            os.close(fd)  # releases the lock
+
+    def compact(self) -> bool:
+        """Rewrite the journal with one line per key; False if another process holds it right now."""
+        with self._lock, self._file_lock(exclusive=True) as locked:
+            if not locked:
+                return False
+            self.entries, _ = self._load()  # picks up what other processes appended since we loaded
+            lines = [json.dumps(record, sort_keys=True) + "\n" for record in self.entries.values()]
+            write_atomic(self.path, "".join(lines))
+        return True
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        record["ts"] = round(time.time(), 3)
+        line = (json.dumps(record, sort_keys=True) + "\n").encode("utf-8")
+        with self._lock, self._file_lock(exclusive=False):
+            self.entries[f"{record['kind']}:{record['key']}"] = record
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, line)
+            finally:
+                os.close(fd)
+
+    def resumable_agent(self, key: str) -> Optional[str]:
+        """Agent id previously launched for this prompt that can still be waited on."""
+        with self._lock:
+            record = self.entries.get(f"agent:{key}")
+        if record and record.get("status") in RESUMABLE_STATUSES:
+            return record.get("agent_id")
+        return None
+
+    def record_agent(self, key: str, agent_id: str, status: str) -> None:
+        self._append({"kind": "agent", "key": key, "agent_id": agent_id, "status": status})
+
+    def written_brief(self, key: str) -> Optional[pathlib.Path]:
+        """Output path of a brief already written for this cache key, if it still exists."""
+        with self._lock:
+            record = self.entries.get(f"brief:{key}")
+        if record:
+            output = pathlib.Path(record["output"])
+            if output.exists():
+                return output
+        return None
+
+    def record_brief(self, key: str, transcript: pathlib.Path, output: pathlib.Path) -> None:
+        self._append({"kind": "brief", "key": key, "transcript": transcript.as_posix(), "output": output.as_posix()})
@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+Running Cursor Cloud agents from the thread-based runners.
+
+`install_shared_client` sizes the process-wide `CursorClient` for a run.
+`run_agent` launches an agent for a prompt (or re-attaches to the one the
+journal recorded for it), waits for it by polling or, with `--stream`, by
+reading its conversation stream, and returns its brief. Once the API has
+answered a stream request without an event stream, the client remembers it
+(`CursorClient.streaming`) and later agents go straight to polling. Every
+agent, whether for a transcript, a template or a chunk, holds one of the run's
+`--max-concurrency` agent slots from launch until it is collected, so nested
+worker pools never run more agents at once than that.
+
+`cancellable` turns Ctrl-C and SIGTERM into an orderly stop: in-flight
+requests are aborted, agents that are still running are stopped (or left for
+the journal with `--detach-on-cancel`) and the process exits with status 130.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import os
+import pathlib
+import signal
+import sys
+import threading
+import time
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+import telemetry
+from agent_journal import AgentJournal, prompt_key
+from atomic_write import write_atomic
+from cursor_api import (
+    TERMINAL_STATUSES,
+    THROTTLED_STATUSES,
+    CursorApiError,
+    CursorClient,
+    Deadline,
+    DeadlineExceeded,
+    RunCancelled,
+    StreamingUnsupported,
+    assistant_markdown,
+    current_deadline,
+    cursor_request,
+    cursor_stream,
+    deadline_scope,
+    get_client,
+    set_client,
+)
+from polling import PollPolicy
+from rate_limit import CircuitBreaker, RequestBudget
+
+DEFAULT_REPOSITORY = os.getenv(
+    "CURSOR_REPOSITORY", "https://github.com/godhavari-gopal-covergo/architecture"
+)
+DEFAULT_REF = os.getenv("CURSOR_REPOSITORY_REF", "main")
+PARTIAL_WRITE_INTERVAL = 0.5
+# Agents launched or re-attached by this run that have not finished yet, with their journal keys.
+_active_agents: Dict[str, str] = {}
+_active_lock = threading.Lock()
+
+
+def install_shared_client(args: argparse.Namespace) -> None:
+    """Size the process-wide HTTP client for the run's concurrency and request budget."""
+    try:
+        set_client(
+            CursorClient.from_env(
+                max_connections=max(args.max_concurrency, 1),
+                budget=RequestBudget.build(args.launch_rate, args.poll_rate),
+                breaker=CircuitBreaker(),
+                max_retries=args.max_retries,
+            )
+        )
+    except CursorApiError:
+        pass  # requests report the missing key and the runner falls back
+
+
+def launch_agent(prompt: str, branch_name: Optional[str]) -> str:
+    payload: Dict[str, Any] = {
+        "prompt": {"text": prompt},
+        "source": {
+            "repository": DEFAULT_REPOSITORY,
+            "ref": DEFAULT_REF,
+        },
+        "target": {
+            "autoCreatePr": False,
+        },
+    }
+    if branch_name:
+        payload["target"]["branchName"] = branch_name
+    response = cursor_request("/agents", payload, method="POST")
+    agent_id = response.get("id")
+    if not agent_id:
+        raise CursorApiError("Launch agent response missing 'id'.")
+    return agent_id
+
+
+def wait_for_agent(
+    agent_id: str, timeout: float, policy: PollPolicy, span: Optional[telemetry.Span] = None
+) -> Dict[str, Any]:
+    """Poll until the agent reaches a terminal status; the poll count is kept on `span` if given."""
+    deadline = Deadline.after(timeout).earliest(current_deadline())
+    client = get_client()
+    started = time.monotonic()
+    last_status = None
+    attempt = 0
+    while True:
+        telemetry.count("agent.polls")
+        if span is not None:
+            span.set("polls", attempt + 1)
+        try:
+            status_payload = cursor_request(f"/agents/{agent_id}")
+        except CursorApiError as exc:
+            if exc.status not in THROTTLED_STATUSES:
+                raise
+            telemetry.count("agent.polls_throttled")
+            # Rate limited: wait as long as the server asks (or the policy suggests).
+            elapsed = time.monotonic() - started
+            delay = exc.retry_after if exc.retry_after is not None else policy.next_delay(attempt, elapsed)
+        else:
+            last_status = status_payload.get("status")
+            if last_status in TERMINAL_STATUSES:
+                if last_status == "FINISHED":
+                    policy.record_completion(time.monotonic() - started)
+                return status_payload
+            delay = policy.next_delay(attempt, time.monotonic() - started)
+        attempt += 1
+        remaining = deadline.remaining()
+        if remaining <= 0:
+            break
+        client.pause(min(delay, remaining))
+    raise CursorApiError(f"Timed out waiting for agent {agent_id} (last status={last_status}).")
+
+
+def fetch_agent_markdown(agent_id: str) -> Optional[str]:
+    return assistant_markdown(cursor_request(f"/agents/{agent_id}/conversation"))
+
+
+class PartialBrief:
+    """Mirror the latest assistant text to a `.partial` file, at most every PARTIAL_WRITE_INTERVAL seconds.
+
+    Each update replaces the file atomically, so a reader never sees a torn brief.
+    """
+
+    def __init__(self, path: Optional[pathlib.Path]) -> None:
+        self.path = path
+        self._written_at = 0.0
+
+    def update(self, text: str, force: bool = False) -> None:
+        now = time.monotonic()
+        if self.path is None or (not force and now - self._written_at < PARTIAL_WRITE_INTERVAL):
+            return
+        write_atomic(self.path, text)
+        self._written_at = now
+
+    def discard(self) -> None:
+        if self.path is not None:
+            self.path.unlink(missing_ok=True)
+
+
+def stream_agent_markdown(agent_id: str, timeout: int, partial: PartialBrief) -> Tuple[str, Optional[str]]:
+    """Consume the agent's conversation stream until it reports a terminal status."""
+    deadline = time.monotonic() + timeout
+    texts: Dict[str, str] = {}
+    latest: Optional[str] = None
+    for event, data in cursor_stream(f"/agents/{agent_id}/conversation"):
+        if time.monotonic() > deadline:
+            raise CursorApiError(f"Timed out streaming agent {agent_id}.")
+        if not data:
+            continue
+        try:
+            payload = json.loads(data)
+        except json.JSONDecodeError as exc:
+            raise CursorApiError(f"Invalid event from Cursor API stream: {exc}") from exc
+        if event == "status":
+            if payload.get("status") in TERMINAL_STATUSES:
+                text = texts.get(latest, "").strip() if latest else ""
+                return payload["status"], text or None
+        elif event == "message" and payload.get("type") == "assistant_message":
+            latest = payload.get("id") or latest or "assistant"
+            chunk = payload.get("text", "")
+            texts[latest] = texts.get(latest, "") + chunk if payload.get("delta") else chunk
+            telemetry.count("agent.stream_messages")
+            partial.update(texts[latest])
+    raise CursorApiError(f"Conversation stream for agent {agent_id} ended before the agent finished.")
+
+
+def collect_agent(
+    agent_id: str,
+    args: argparse.Namespace,
+    partial_path: Optional[pathlib.Path] = None,
+) -> Tuple[str, Optional[str]]:
+    """Wait for a launched agent and return its terminal status and brief markdown."""
+    if args.stream and get_client().streaming is not False:
+        partial = PartialBrief(partial_path)
+        try:
+            with telemetry.span("stream", agent_id=agent_id):
+                return stream_agent_markdown(agent_id, args.timeout, partial)
+        except StreamingUnsupported as exc:
+            print(f"[warn] {exc} Falling back to polling.", file=sys.stderr)
+        except CursorApiError as exc:
+            if exc.status is not None and exc.status not in THROTTLED_STATUSES:
+                raise
+            print(f"[warn] agent {agent_id}: {exc} Falling back to polling.", file=sys.stderr)
+        finally:
+            partial.discard()
+    with telemetry.span("wait", agent_id=agent_id) as span:
+        status = wait_for_agent(agent_id, args.timeout, args.policy, span).get("status", "")
+        if span is not None:
+            span.set("status", status)
+    with telemetry.span("fetch", agent_id=agent_id):
+        return status, fetch_agent_markdown(agent_id)
+
+
+@contextlib.contextmanager
+def agent_slot(args: argparse.Namespace) -> Iterator[None]:
+    """Hold one of the run's agent slots (`args.agent_slots`), waiting at most until `--deadline`."""
+    slots: Optional[threading.BoundedSemaphore] = getattr(args, "agent_slots", None)
+    if slots is None:
+        yield
+        return
+    run_deadline: Optional[Deadline] = getattr(args, "run_deadline", None)
+    with telemetry.span("queue"):
+        if not slots.acquire(timeout=run_deadline.remaining() if run_deadline else None):
+            raise DeadlineExceeded("Run deadline reached while waiting for a free agent slot.")
+    try:
+        yield
+    finally:
+        slots.release()
+
+
+def run_agent(
+    prompt: str,
+    args: argparse.Namespace,
+    partial_path: Optional[pathlib.Path] = None,
+) -> Tuple[str, Optional[str]]:
+    """Run one agent to completion in an agent slot; its requests are bounded by `--timeout` and `--deadline`."""
+    with agent_slot(args):
+        with deadline_scope(Deadline.after(args.timeout).earliest(getattr(args, "run_deadline", None))):
+            return _run_agent(prompt, args, partial_path)
+
+
+def _run_agent(
+    prompt: str,
+    args: argparse.Namespace,
+    partial_path: Optional[pathlib.Path],
+) -> Tuple[str, Optional[str]]:
+    journal: Optional[AgentJournal] = args.journal
+    key = prompt_key(prompt) if journal else ""
+    agent_id = journal.resumable_agent(key) if journal else None
+    status: Optional[str] = None
+    markdown: Optional[str] = None
+    if agent_id:
+        print(f"[resume] re-attaching to agent {agent_id}")
+        telemetry.count("agent.resumed")
+        try:
+            status, markdown = _collect_tracked(agent_id, key, args, partial_path)
+        except CursorApiError as exc:
+            if exc.status != 404:
+                raise
+            print(f"[warn] agent {agent_id} no longer exists; launching a new one.", file=sys.stderr)
+            agent_id = None
+    if not agent_id:
+        with telemetry.span("launch", prompt_chars=len(prompt)):
+            agent_id = launch_agent(prompt, args.branch_name)
+        if journal:
+            journal.record_agent(key, agent_id, "CREATING")
+        status, markdown = _collect_tracked(agent_id, key, args, partial_path)
+    if journal:
+        # Finished agents without a brief are not worth re-attaching to.
+        journal.record_agent(key, agent_id, status if markdown or status != "FINISHED" else "EMPTY")
+    return agent_id, markdown
+
+
+def _collect_tracked(
+    agent_id: str, key: str, args: argparse.Namespace, partial_path: Optional[pathlib.Path]
+) -> Tuple[str, Optional[str]]:
+    """`collect_agent`, keeping the agent listed as running until it is collected or the run is cancelled."""
+    with _active_lock:
+        _active_agents[agent_id] = key
+    cancelled = False
+    try:
+        return collect_agent(agent_id, args, partial_path)
+    except (RunCancelled, KeyboardInterrupt):
+        cancelled = True  # left listed so the cancelled run stops it
+        raise
+    finally:
+        if not cancelled:
+            with _active_lock:
+                _active_agents.pop(agent_id, None)
+
+
+def stop_active_agents(args: argparse.Namespace) -> int:
+    """Stop the agents a cancelled run left running and mark them in the journal; returns how many."""
+    with _active_lock:
+        agents = dict(_active_agents)
+        _active_agents.clear()
+    if not agents or args.detach_on_cancel:
+        return 0
+    try:
+        stopped = get_client().stop_agents(list(agents))
+    except CursorApiError:
+        return 0
+    for agent_id in stopped:
+        if args.journal:
+            args.journal.record_agent(agents[agent_id], agent_id, "STOPPED")
+    return len(stopped)
+
+
+@contextlib.contextmanager
+def cancellable(args: argparse.Namespace) -> Iterator[None]:
+    """On Ctrl-C or SIGTERM abort in-flight requests, stop running agents and exit with status 130."""
+
+    def interrupt(signum: int, frame: Any) -> None:
+        try:
+            get_client().cancel()
+        except CursorApiError:
+            pass
+        raise KeyboardInterrupt
+
+    previous = {signum: signal.signal(signum, interrupt) for signum in (signal.SIGINT, signal.SIGTERM)}
+    try:
+        yield
+    except KeyboardInterrupt:
+        # A second Ctrl-C while the agents are being stopped exits at once.
+        for signum, handler in previous.items():
+            signal.signal(signum, handler)
+        stopped = stop_active_agents(args)
+        action = "left running" if args.detach_on_cancel else f"stopped {stopped}"
+        print(f"[cancel] run cancelled; {action} agent(s).", file=sys.stderr)
+        raise SystemExit(130)
+    finally:
+        for signum, handler in previous.items():
+            signal.signal(signum, handler)
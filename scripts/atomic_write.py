@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Atomic file replacement shared by the brief writers and the on-disk caches.
+
+`write_atomic` writes to a temporary file in the target's directory and
+renames it over the target, so readers (other workers, the commit step, the
+artifact upload) see either the old file or the new one, never a torn write,
+and a killed process leaves at most a stray `.<name>.*.tmp` file behind.
+"""
+
+from __future__ import annotations
+
+import os
+import pathlib
+import secrets
+from typing import Tuple, Union
+
+# Unlike mkstemp (always 0600), the temporary file is created with 0666 and the
+# process umask applied by the OS at creation, so replaced files get the same
+# mode `open()` would give them without reading (and briefly changing) the umask.
+_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+
+
+def _create_temp(path: pathlib.Path) -> Tuple[int, str]:
+    while True:
+        tmp_name = str(path.parent / f".{path.name}.{secrets.token_hex(4)}.tmp")
+        try:
+            return os.open(tmp_name, _FLAGS, 0o666), tmp_name
+        except FileExistsError:
+            continue
+
+
+def write_atomic(path: pathlib.Path, data: Union[str, bytes]) -> None:
+    """Replace `path` with `data` (text is written as UTF-8) via a temporary file and rename."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = _create_temp(path)
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data.encode("utf-8") if isinstance(data, str) else data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        pathlib.Path(tmp_name).unlink(missing_ok=True)
+        raise
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Content-addressed cache of generated meeting briefs.
+
+Entries live in `.cache/meeting-briefs/<sha256>.json`, keyed on the normalised
+transcript text, the prompt template version and the metadata the caller
+passes in. The runners pass only what the user set explicitly (title, date,
+stakeholders) and the normalisation settings, never values inferred from the
+file name or the clock, so a renamed file, a re-export of the same `.docx` or
+a re-run workflow on another day reuses the earlier agent result instead of
+launching a new agent. Only real agent output is stored; heuristic fallbacks
+are never cached.
+
+The directory is plain files so CI can persist it with `actions/cache`.
+Eviction drops entries older than `max_age_days`, then the least recently
+used ones until the directory fits in `max_bytes`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pathlib
+import re
+import time
+from typing import Any, Dict, Optional
+
+from atomic_write import write_atomic
+
+DEFAULT_CACHE_DIR = pathlib.Path(".cache/meeting-briefs")
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+DEFAULT_MAX_AGE_DAYS = 90
+CACHE_FORMAT = 1
+
+
+def canonical_text(text: str) -> str:
+    """Whitespace-insensitive form of a transcript used for hashing."""
+    lines = [line.rstrip() for line in text.replace("\r\n", "\n").replace("\r", "\n").split("\n")]
+    return re.sub(r"\n{3,}", "\n\n", "\n".join(lines)).strip()
+
+
+def cache_key(transcript: str, template_version: str, metadata: Dict[str, Any]) -> str:
+    transcript_hash = hashlib.sha256(canonical_text(transcript).encode("utf-8")).hexdigest()
+    prompt_material = json.dumps(
+        {"format": CACHE_FORMAT, "template": template_version, "metadata": metadata},
+        sort_keys=True,
+    )
+    prompt_hash = hashlib.sha256(prompt_material.encode("utf-8")).hexdigest()
+    return hashlib.sha256(f"{transcript_hash}:{prompt_hash}".encode("ascii")).hexdigest()
+
+
+class BriefCache:
+    def __init__(
+        self,
+        directory: pathlib.Path = DEFAULT_CACHE_DIR,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_age_days: float = DEFAULT_MAX_AGE_DAYS,
+    ) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_age = max_age_days * 86400
+
+    def _path(self, key: str) -> pathlib.Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or not entry.get("markdown"):
+            return None
+        if time.time() - entry.get("created_at", 0) > self.max_age:
+            return None
+        try:
+            os.utime(path)  # refresh LRU position
+        except OSError:
+            pass
+        return entry
+
+    def put(self, key: str, markdown: str, agent_id: Optional[str], metadata: Dict[str, Any]) -> None:
+        entry = {
+            "markdown": markdown,
+            "agent_id": agent_id,
+            "metadata": metadata,
+            "created_at": time.time(),
+        }
+        write_atomic(self._path(key), json.dumps(entry))
+
+    def prune(self) -> int:
+        """Apply age and size eviction; returns the number of entries removed."""
+        if not self.directory.is_dir():
+            return 0
+        now = time.time()
+        entries = []
+        removed = 0
+        for path in self.directory.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            if now - stat.st_mtime > self.max_age:
+                path.unlink(missing_ok=True)
+                removed += 1
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        return removed
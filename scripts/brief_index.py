@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Full-text index over the generated meeting briefs.
+
+`build` walks `meeting_outputs/*.md` and (re)parses only briefs whose size or
+mtime changed and whose content hash differs from the indexed one, storing
+front-matter, sections and action items in SQLite with an FTS5 index over the
+sections. Deleted briefs are dropped. `search` runs an FTS5 query over section
+text; `actions` lists action items, optionally filtered by owner or text.
+
+    python scripts/brief_index.py build
+    python scripts/brief_index.py search "NEAR(integration webhook, 5)" --section "Architecture"
+    python scripts/brief_index.py actions --owner "Godhavari" --open
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import pathlib
+import re
+import sqlite3
+import sys
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+DEFAULT_OUTPUT_DIR = pathlib.Path("meeting_outputs")
+DEFAULT_INDEX_PATH = pathlib.Path(".cache/brief-index.sqlite")
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS briefs (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    meeting TEXT,
+    date TEXT,
+    source_transcript TEXT,
+    agent_id TEXT
+);
+CREATE TABLE IF NOT EXISTS sections (
+    id INTEGER PRIMARY KEY,
+    brief_id INTEGER NOT NULL REFERENCES briefs(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    heading TEXT NOT NULL,
+    body TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS action_items (
+    id INTEGER PRIMARY KEY,
+    brief_id INTEGER NOT NULL REFERENCES briefs(id) ON DELETE CASCADE,
+    text TEXT NOT NULL,
+    owner TEXT,
+    due TEXT,
+    done INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS sections_brief ON sections(brief_id);
+CREATE INDEX IF NOT EXISTS action_items_brief ON action_items(brief_id);
+CREATE INDEX IF NOT EXISTS action_items_owner ON action_items(owner COLLATE NOCASE);
+CREATE VIRTUAL TABLE IF NOT EXISTS sections_fts USING fts5(
+    heading, body, content='sections', content_rowid='id', tokenize='porter unicode61'
+);
+"""
+
+FRONT_MATTER_LINE = re.compile(r'^(?P<key>[A-Za-z_]+):\s*"?(?P<value>.*?)"?\s*$')
+HEADING = re.compile(r"^(?P<level>#{1,4})\s+(?P<title>.+?)\s*#*\s*$")
+ACTION_HEADING = re.compile(r"action items?|actions|follow[- ]ups?|to-?dos?", re.IGNORECASE)
+LIST_ITEM = re.compile(r"^\s*(?:[-*+]|\d+[.)])\s+(?:\[(?P<check>[ xX])\]\s+)?(?P<text>.+)$")
+OWNER = re.compile(r"\b(?:owner|owners|assignee|responsible|who)\s*[:=\-–]\s*\**(?P<owner>[^;,()\n*|]+)", re.IGNORECASE)
+DUE = re.compile(r"\b(?:due(?: date)?|deadline|target date|when)\s*[:=\-–]\s*\**(?P<due>[^;,()\n*|]+)", re.IGNORECASE)
+LEADING_NAME = re.compile(r"^\*\*(?P<owner>[^*]{2,60})\*\*\s*[:\-–]")
+
+
+def parse_brief(text: str) -> Tuple[Dict[str, str], List[Tuple[str, str]], List[Dict[str, object]]]:
+    """Split a brief into front-matter, `(heading, body)` sections and action items."""
+    lines = text.splitlines()
+    front: Dict[str, str] = {}
+    start = 0
+    if lines and lines[0].strip() == "---":
+        for index in range(1, len(lines)):
+            if lines[index].strip() == "---":
+                start = index + 1
+                break
+            match = FRONT_MATTER_LINE.match(lines[index])
+            if match:
+                front[match.group("key")] = match.group("value")
+
+    sections: List[Tuple[str, List[str]]] = [("", [])]
+    for line in lines[start:]:
+        match = HEADING.match(line)
+        if match:
+            sections.append((match.group("title").strip("*_ "), []))
+        else:
+            sections[-1][1].append(line)
+    parsed = [(heading, "\n".join(body).strip()) for heading, body in sections if heading or "".join(body).strip()]
+
+    actions: List[Dict[str, object]] = []
+    for heading, body in parsed:
+        if ACTION_HEADING.search(heading):
+            actions.extend(_parse_actions(body))
+    return front, parsed, actions
+
+
+def _parse_actions(body: str) -> Iterator[Dict[str, object]]:
+    columns: Optional[List[str]] = None
+    for line in body.splitlines():
+        stripped = line.strip()
+        if stripped.startswith("|"):
+            cells = [cell.strip() for cell in stripped.strip("|").split("|")]
+            if all(re.fullmatch(r":?-{2,}:?", cell) for cell in cells if cell):
+                continue
+            if columns is None:
+                columns = [cell.lower() for cell in cells]
+                continue
+            row = dict(zip(columns, cells))
+            owner = next((row[key] for key in row if re.search(r"owner|assignee|responsible|who", key)), None)
+            due = next((row[key] for key in row if re.search(r"due|deadline|date|when", key)), None)
+            text = next((row[key] for key in row if re.search(r"action|task|item|description", key)), cells[0])
+            yield {"text": text, "owner": owner or None, "due": due or None, "done": 0}
+            continue
+        columns = None
+        match = LIST_ITEM.match(line)
+        if not match:
+            continue
+        text = match.group("text").strip()
+        owner_match = OWNER.search(text) or LEADING_NAME.match(text)
+        due_match = DUE.search(text)
+        yield {
+            "text": text,
+            "owner": owner_match.group("owner").strip() if owner_match else None,
+            "due": due_match.group("due").strip() if due_match else None,
+            "done": 1 if (match.group("check") or " ").lower() == "x" else 0,
+        }
+
+
+class BriefIndex:
+    def __init__(self, path: pathlib.Path = DEFAULT_INDEX_PATH) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(path))
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, SCHEMA_VERSION):
+            raise SystemExit(f"{path} was built by another index version; delete it and rebuild.")
+        try:
+            self.conn.executescript(SCHEMA)
+        except sqlite3.OperationalError as exc:
+            raise SystemExit(f"SQLite with FTS5 is required for the brief index: {exc}") from exc
+        self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def _delete(self, brief_id: int) -> None:
+        self.conn.execute(
+            "INSERT INTO sections_fts(sections_fts, rowid, heading, body) "
+            "SELECT 'delete', id, heading, body FROM sections WHERE brief_id = ?",
+            (brief_id,),
+        )
+        self.conn.execute("DELETE FROM briefs WHERE id = ?", (brief_id,))
+
+    def _insert(self, path: str, stat, digest: str, text: str) -> None:
+        front, sections, actions = parse_brief(text)
+        cursor = self.conn.execute(
+            "INSERT INTO briefs(path, mtime_ns, size, sha256, meeting, date, source_transcript, agent_id) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                path,
+                stat.st_mtime_ns,
+                stat.st_size,
+                digest,
+                front.get("meeting"),
+                front.get("date"),
+                front.get("source_transcript"),
+                front.get("agent_id"),
+            ),
+        )
+        brief_id = cursor.lastrowid
+        for position, (heading, body) in enumerate(sections):
+            section_id = self.conn.execute(
+                "INSERT INTO sections(brief_id, position, heading, body) VALUES (?, ?, ?, ?)",
+                (brief_id, position, heading, body),
+            ).lastrowid
+            self.conn.execute(
+                "INSERT INTO sections_fts(rowid, heading, body) VALUES (?, ?, ?)", (section_id, heading, body)
+            )
+        self.conn.executemany(
+            "INSERT INTO action_items(brief_id, text, owner, due, done) VALUES (?, ?, ?, ?, ?)",
+            [(brief_id, item["text"], item["owner"], item["due"], item["done"]) for item in actions],
+        )
+
+    def update(self, output_dir: pathlib.Path) -> Dict[str, int]:
+        """Bring the index in line with `output_dir`, reparsing only changed briefs."""
+        counts = {"added": 0, "updated": 0, "unchanged": 0, "removed": 0}
+        known = {
+            row[0]: row[1:]
+            for row in self.conn.execute("SELECT path, id, mtime_ns, size, sha256 FROM briefs")
+        }
+        with self.conn:
+            for brief in sorted(output_dir.rglob("*.md")):
+                path = brief.as_posix()
+                stat = brief.stat()
+                previous = known.pop(path, None)
+                if previous and previous[1] == stat.st_mtime_ns and previous[2] == stat.st_size:
+                    counts["unchanged"] += 1
+                    continue
+                data = brief.read_bytes()
+                digest = hashlib.sha256(data).hexdigest()
+                if previous and previous[3] == digest:
+                    self.conn.execute(
+                        "UPDATE briefs SET mtime_ns = ?, size = ? WHERE id = ?",
+                        (stat.st_mtime_ns, stat.st_size, previous[0]),
+                    )
+                    counts["unchanged"] += 1
+                    continue
+                if previous:
+                    self._delete(previous[0])
+                self._insert(path, stat, digest, data.decode("utf-8", errors="replace"))
+                counts["updated" if previous else "added"] += 1
+            for brief_id, *_ in known.values():
+                self._delete(brief_id)
+                counts["removed"] += 1
+        return counts
+
+    def search(self, query: str, section: Optional[str] = None, limit: int = 20) -> List[sqlite3.Row]:
+        sql = (
+            "SELECT b.path, b.meeting, b.date, s.heading, "
+            "snippet(sections_fts, 1, '[', ']', ' … ', 12) AS snippet "
+            "FROM sections_fts JOIN sections s ON s.id = sections_fts.rowid JOIN briefs b ON b.id = s.brief_id "
+            "WHERE sections_fts MATCH ?"
+        )
+        params: List[object] = [query]
+        if section:
+            sql += " AND s.heading LIKE ?"
+            params.append(f"%{section}%")
+        sql += " ORDER BY bm25(sections_fts) LIMIT ?"
+        params.append(limit)
+        self.conn.row_factory = sqlite3.Row
+        return self.conn.execute(sql, params).fetchall()
+
+    def actions(
+        self,
+        owner: Optional[str] = None,
+        match: Optional[str] = None,
+        open_only: bool = False,
+        limit: int = 100,
+    ) -> List[sqlite3.Row]:
+        sql = (
+            "SELECT b.path, b.meeting, b.date, a.text, a.owner, a.due, a.done "
+            "FROM action_items a JOIN briefs b ON b.id = a.brief_id WHERE 1 = 1"
+        )
+        params: List[object] = []
+        if owner:
+            sql += " AND a.owner LIKE ?"
+            params.append(f"%{owner}%")
+        if match:
+            sql += " AND a.text LIKE ?"
+            params.append(f"%{match}%")
+        if open_only:
+            sql += " AND a.done = 0"
+        sql += " ORDER BY b.date DESC, b.path LIMIT ?"
+        params.append(limit)
+        self.conn.row_factory = sqlite3.Row
+        return self.conn.execute(sql, params).fetchall()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Build and query the meeting brief search index.")
+    parser.add_argument(
+        "--index",
+        default=str(DEFAULT_INDEX_PATH),
+        help=f"SQLite index file (default: {DEFAULT_INDEX_PATH}).",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build = commands.add_parser("build", help="Index new and changed briefs.")
+    build.add_argument(
+        "--outputs",
+        default=str(DEFAULT_OUTPUT_DIR),
+        help=f"Directory of generated briefs (default: {DEFAULT_OUTPUT_DIR}).",
+    )
+
+    search = commands.add_parser("search", help="Full-text search over brief sections (FTS5 query syntax).")
+    search.add_argument("query")
+    search.add_argument("--section", help="Only sections whose heading contains this text.")
+    search.add_argument("--limit", type=int, default=20)
+
+    actions = commands.add_parser("actions", help="List action items.")
+    actions.add_argument("--owner", help="Owner name (substring, case-insensitive).")
+    actions.add_argument("--match", help="Only items whose text contains this.")
+    actions.add_argument("--open", action="store_true", help="Only unchecked items.")
+    actions.add_argument("--limit", type=int, default=100)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    index = BriefIndex(pathlib.Path(args.index))
+    started = time.perf_counter()
+    try:
+        if args.command == "build":
+            counts = index.update(pathlib.Path(args.outputs))
+            summary = ", ".join(f"{count} {name}" for name, count in counts.items())
+            print(f"Indexed briefs: {summary} ({(time.perf_counter() - started) * 1000:.0f} ms)")
+            return
+        if args.command == "search":
+            try:
+                rows = index.search(args.query, args.section, args.limit)
+            except sqlite3.OperationalError as exc:
+                sys.exit(f"Invalid search query: {exc}")
+            for row in rows:
+                snippet = " ".join(row["snippet"].split())
+                print(f"{row['path']} [{row['date']}] {row['meeting']} – {row['heading']}\n    {snippet}")
+        else:
+            rows = index.actions(args.owner, args.match, args.open, args.limit)
+            for row in rows:
+                details = [f"owner: {row['owner'] or '-'}", f"due: {row['due'] or '-'}", f"{row['path']} [{row['date']}]"]
+                print(f"[{'x' if row['done'] else ' '}] {row['text']}\n    " + " · ".join(details))
+        print(f"{len(rows)} result(s) in {(time.perf_counter() - started) * 1000:.1f} ms", file=sys.stderr)
+    finally:
+        index.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Durable brief outputs: checkpoint commits.
+
+Briefs are written with `atomic_write.write_atomic`, so a crash or a
+cancelled run never leaves a truncated brief for a checkpoint to commit.
+
+`CheckpointCommitter` collects finished briefs and commits them every
+`every_files` files or `every_seconds` seconds instead of once at the end of
+the run, so a batch that fails halfway keeps what it has finished. Each
+checkpoint is pushed straight away, but while agents are still writing briefs
+into the working tree nothing is pulled or rebased there: a push rejected
+because the branch moved leaves the commits local, and they go out with the
+next checkpoint. The final checkpoint, taken once the batch has drained,
+retries a rejected push after `git pull --rebase --autostash`, with a growing
+delay, up to `push_attempts` times. A rebase that fails (a conflict) is
+aborted and tried again on the next attempt.
+
+Run standalone to commit and push whatever changed under the given paths
+(the workflow's final step, which also covers a pipeline that was killed):
+
+    python scripts/brief_outputs.py meeting_outputs --message "chore: add meeting brief outputs [skip ci]"
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import pathlib
+import subprocess
+import sys
+import time
+from typing import Iterable, List, Optional
+
+DEFAULT_MESSAGE = "chore: add meeting brief outputs [skip ci]"
+CHECKPOINT_MESSAGE = "chore: add meeting brief outputs (checkpoint {number}, {count} file(s)) [skip ci]"
+DEFAULT_EVERY_FILES = 10
+DEFAULT_EVERY_SECONDS = 300.0
+DEFAULT_PUSH_ATTEMPTS = 5
+MAX_PUSH_DELAY = 30.0
+
+
+def git(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(["git", *args], capture_output=True, text=True, check=False)
+
+
+def _git_error(result: subprocess.CompletedProcess) -> str:
+    """The most telling line of a failed git command's output (not its trailing hints)."""
+    lines = [line.strip() for line in (result.stderr or result.stdout).splitlines() if line.strip()]
+    for line in lines:
+        if line.startswith(("!", "error:", "fatal:", "CONFLICT")):
+            return line
+    return lines[-1] if lines else f"exit status {result.returncode}"
+
+
+def current_branch() -> Optional[str]:
+    branch = os.getenv("GITHUB_REF_NAME") or git("rev-parse", "--abbrev-ref", "HEAD").stdout.strip()
+    return branch if branch and branch != "HEAD" else None
+
+
+def commit_paths(paths: List[pathlib.Path], message: str) -> bool:
+    """Commit the changes under `paths` (and nothing else staged); False if there was nothing to commit."""
+    specs = [path.as_posix() for path in paths if path.exists()]
+    if not specs:
+        return False
+    added = git("add", "--", *specs)
+    if added.returncode != 0:
+        raise RuntimeError(f"git add failed: {_git_error(added)}")
+    if git("diff", "--cached", "--quiet", "--", *specs).returncode == 0:
+        return False
+    committed = git("commit", "-q", "-m", message, "--", *specs)
+    if committed.returncode != 0:
+        raise RuntimeError(f"git commit failed: {_git_error(committed)}")
+    return True
+
+
+def push(remote: str, branch: Optional[str], attempts: int = DEFAULT_PUSH_ATTEMPTS, rebase: bool = True) -> bool:
+    """Push HEAD to `remote`/`branch`, up to `attempts` times; False if it never went through.
+
+    With `rebase`, a rejected push is rebased onto the remote branch before the next attempt. Only
+    rebase when nothing else is writing to the working tree: `--autostash` stashes uncommitted files.
+    """
+    branch = branch or current_branch()
+    if not branch:
+        print("[warn] push skipped: HEAD is detached and no branch was given.", file=sys.stderr)
+        return False
+    for attempt in range(1, attempts + 1):
+        pushed = git("push", "-q", remote, f"HEAD:{branch}")
+        if pushed.returncode == 0:
+            return True
+        print(f"[warn] push to {remote}/{branch} failed ({attempt}/{attempts}): {_git_error(pushed)}", file=sys.stderr)
+        if attempt == attempts:
+            break
+        time.sleep(min(2.0 ** (attempt - 1), MAX_PUSH_DELAY))
+        if not rebase:
+            continue
+        rebased = git("pull", "-q", "--rebase", "--autostash", remote, branch)
+        if rebased.returncode != 0:
+            git("rebase", "--abort")
+            print(f"[warn] rebase onto {remote}/{branch} failed: {_git_error(rebased)}", file=sys.stderr)
+    return False
+
+
+class CheckpointCommitter:
+    """Commit and push finished outputs every `every_files` files or `every_seconds` seconds."""
+
+    def __init__(
+        self,
+        every_files: int = DEFAULT_EVERY_FILES,
+        every_seconds: float = DEFAULT_EVERY_SECONDS,
+        remote: str = "origin",
+        branch: Optional[str] = None,
+        message: str = CHECKPOINT_MESSAGE,
+        push_attempts: int = DEFAULT_PUSH_ATTEMPTS,
+        extra_paths: Iterable[pathlib.Path] = (),
+    ) -> None:
+        self.every_files = every_files
+        self.every_seconds = every_seconds
+        self.remote = remote
+        self.branch = branch
+        self.message = message
+        self.push_attempts = push_attempts
+        self.extra_paths = list(extra_paths)
+        self.pending: List[pathlib.Path] = []
+        self.checkpoints = 0
+        self.unpushed = 0
+        self.seconds = 0.0
+        self._last = time.monotonic()
+
+    def add(self, paths: Iterable[pathlib.Path]) -> None:
+        """Queue finished outputs and commit if a checkpoint is due."""
+        self.pending.extend(path for path in paths if path not in self.pending)
+        due = len(self.pending) >= self.every_files or time.monotonic() - self._last >= self.every_seconds
+        if self.pending and due:
+            self.checkpoint()
+
+    def checkpoint(self, drained: bool = False) -> bool:
+        """Commit the queued outputs and push; returns whether everything committed so far is pushed.
+
+        Pass `drained` once no worker writes to the working tree any more: only then is a rejected push
+        rebased and retried. Before that a checkpoint pushes once and leaves rejected commits for later.
+        """
+        started = self._last = time.monotonic()
+        try:
+            return self._checkpoint(drained)
+        finally:
+            self.seconds += time.monotonic() - started
+
+    def _checkpoint(self, drained: bool) -> bool:
+        paths, self.pending = self.pending, []
+        message = self.message.format(number=self.checkpoints + 1, count=len(paths))
+        try:
+            committed = bool(paths) and commit_paths(paths + self.extra_paths, message)
+        except RuntimeError as exc:
+            print(f"[warn] checkpoint: {exc}", file=sys.stderr)
+            self.pending = paths + self.pending  # retried with the next checkpoint
+            return False
+        if committed:
+            self.checkpoints += 1
+            self.unpushed += 1
+            print(f"[checkpoint] committed {len(paths)} brief(s)")
+        if not self.unpushed:
+            return True
+        if not push(self.remote, self.branch, self.push_attempts if drained else 1, rebase=drained):
+            return False
+        self.unpushed = 0
+        return True
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Commit and push changes under the given paths.")
+    parser.add_argument("paths", nargs="+", help="Files or directories to commit.")
+    parser.add_argument("--message", default=DEFAULT_MESSAGE)
+    parser.add_argument("--remote", default="origin")
+    parser.add_argument("--branch", help="Branch to push to (default: GITHUB_REF_NAME or the current branch).")
+    parser.add_argument("--push-attempts", type=int, default=DEFAULT_PUSH_ATTEMPTS)
+    args = parser.parse_args()
+
+    committed = commit_paths([pathlib.Path(path) for path in args.paths], args.message)
+    print("Committed outputs." if committed else "No output changes to commit.")
+    # Also pushes checkpoint commits a failed pipeline could not push.
+    ahead = git("rev-list", "--count", "@{upstream}..HEAD").stdout.strip()
+    if (committed or ahead not in ("", "0")) and not push(args.remote, args.branch, args.push_attempts):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Split long transcripts into overlapping chunks for map-reduce summarisation.
+
+Chunks break between the turns of the transcript's `Transcript` model (a
+speaker turn, or a paragraph of notes), so a turn is never split across
+chunks unless it alone exceeds the budget; lines the model does not index
+(timestamp headings) travel with the turn that follows them. Chunks are kept
+under a character budget and repeat the last `overlap_chars` worth of turns at
+the start of the next chunk so that a discussion spanning a boundary is
+visible to both map agents. A single turn longer than the budget is cut at
+whitespace.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import List, Union
+
+from transcript_ingest.model import Transcript
+
+DEFAULT_CHUNK_CHARS = 60_000
+DEFAULT_OVERLAP_CHARS = 1_500
+BLANK_LINES = re.compile(r"\n\s*\n")
+
+
+def _split_long_line(line: str, max_chars: int) -> List[str]:
+    pieces = []
+    while len(line) > max_chars:
+        cut = line.rfind(" ", 0, max_chars)
+        if cut <= 0:
+            cut = max_chars
+        pieces.append(line[:cut])
+        line = line[cut:].lstrip()
+    if line:
+        pieces.append(line)
+    return pieces
+
+
+def _turn_texts(transcript: Transcript) -> List[str]:
+    """Each turn with the unindexed lines before it; the text between turns is kept, not re-split."""
+    text = transcript.text
+    units = []
+    start = 0
+    for end in transcript.ends:
+        unit = BLANK_LINES.sub("\n", text[start:end].strip())
+        if unit:
+            units.append(unit)
+        start = end
+    tail = BLANK_LINES.sub("\n", text[start:].strip())
+    if tail:
+        units.append(tail)
+    return units
+
+
+def split_transcript(
+    transcript: Union[str, Transcript],
+    max_chars: int = DEFAULT_CHUNK_CHARS,
+    overlap_chars: int = DEFAULT_OVERLAP_CHARS,
+) -> List[str]:
+    if max_chars <= 0:
+        raise ValueError("max_chars must be positive")
+    if isinstance(transcript, str):
+        transcript = Transcript.from_text(transcript)
+    overlap_chars = max(0, min(overlap_chars, max_chars // 2))
+    units: List[str] = []
+    for turn in _turn_texts(transcript):
+        units.extend(_split_long_line(turn, max_chars))
+
+    chunks: List[str] = []
+    current: List[str] = []
+    size = 0
+    for unit in units:
+        if current and size + len(unit) + 1 > max_chars:
+            chunks.append("\n".join(current))
+            carried: List[str] = []
+            carried_size = 0
+            for previous in reversed(current):
+                if carried_size + len(previous) + 1 > overlap_chars:
+                    break
+                carried.insert(0, previous)
+                carried_size += len(previous) + 1
+            while carried and carried_size + len(unit) + 1 > max_chars:
+                carried_size -= len(carried.pop(0)) + 1
+            current, size = carried, carried_size
+        current.append(unit)
+        size += len(unit) + 1
+    if current:
+        chunks.append("\n".join(current))
+    return chunks
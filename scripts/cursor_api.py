@@ -0,0 +1,690 @@
+#!/usr/bin/env python3
+"""
+Thin HTTP client for the Cursor Cloud Agents API.
+
+A single `CursorClient` holds the Basic-auth header, SSL context and base URL
+and keeps a small pool of persistent `http.client` connections, so launching,
+polling and fetching an agent's conversation reuse the same TLS session
+instead of paying a fresh handshake per request. The pool is safe to share
+between the worker threads of a batch run.
+
+`CursorClient.stream` asks for a `text/event-stream` response and yields
+server-sent events as they arrive; endpoints that answer with plain JSON
+raise `StreamingUnsupported` so callers can fall back to polling, and
+`streaming` turns False so the rest of the run can skip the attempt.
+
+Requests draw from a shared `RequestBudget` (separate launch and poll
+buckets), are retried with backoff on 429 and 5xx responses (honouring
+`Retry-After`), and go through a `CircuitBreaker` that fails fast with
+`CircuitOpenError` while the API keeps erroring.
+
+A thread can bound every request it makes with `deadline_scope(deadline)`:
+socket timeouts are capped at the time left and requests that cannot finish
+in time raise `DeadlineExceeded`. `cancel()` makes the client refuse further
+requests with `RunCancelled` and aborts the ones in flight by shutting down
+their sockets, so a thread blocked on a stalled response wakes up at once.
+Only `stop_agents`, which stops the agents a cancelled run leaves behind,
+still goes through. A single call can be aborted the same way through the
+`CallHandle` passed to `request` or `stream`.
+"""
+
+from __future__ import annotations
+
+import base64
+import concurrent.futures
+import contextlib
+import datetime as dt
+import email.utils
+import http.client
+import json
+import os
+import queue
+import random
+import re
+import socket
+import ssl
+import threading
+import time
+import urllib.parse
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+import telemetry
+from rate_limit import CircuitBreaker, RequestBudget
+
+DEFAULT_API_BASE = "https://api.cursor.com/v0"
+DEFAULT_TIMEOUT = 120
+DEFAULT_MAX_CONNECTIONS = 8
+DEFAULT_MAX_RETRIES = 4
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+# POST /agents is only retried when the server cannot have started the agent.
+RETRYABLE_GET_STATUSES = {429, 500, 502, 503, 504}
+RETRYABLE_POST_STATUSES = {429, 503}
+AGENT_ID_SEGMENT = re.compile(r"/agents/[^/]+")
+EVENT_STREAM_TYPE = "text/event-stream"
+TERMINAL_STATUSES = {"FINISHED", "FAILED", "ERROR"}
+THROTTLED_STATUSES = {429, 503}
+STOP_TIMEOUT = 10.0
+
+# Errors that mean a pooled keep-alive connection was closed by the server
+# between requests; the request is retried once on a fresh connection.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+
+class CursorApiError(RuntimeError):
+    def __init__(
+        self,
+        message: str,
+        status: Optional[int] = None,
+        retry_after: Optional[float] = None,
+    ) -> None:
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+class CircuitOpenError(CursorApiError):
+    """Raised without contacting the API while the circuit breaker is open."""
+
+
+class StreamingUnsupported(CursorApiError):
+    """The endpoint answered with a regular body instead of an event stream."""
+
+
+class DeadlineExceeded(CursorApiError):
+    """The request could not complete before the caller's deadline."""
+
+
+class RunCancelled(Exception):
+    """The run was cancelled. Deliberately not a `CursorApiError`, so callers do not fall back to a summary."""
+
+
+class Deadline:
+    """A point on the monotonic clock by which work has to finish."""
+
+    def __init__(self, at: float) -> None:
+        self.at = at
+
+    @classmethod
+    def after(cls, seconds: float) -> "Deadline":
+        return cls(time.monotonic() + seconds)
+
+    def remaining(self) -> float:
+        return max(0.0, self.at - time.monotonic())
+
+    def expired(self) -> bool:
+        return time.monotonic() >= self.at
+
+    def earliest(self, other: Optional["Deadline"]) -> "Deadline":
+        return other if other is not None and other.at < self.at else self
+
+
+_scope = threading.local()
+
+
+def current_deadline() -> Optional[Deadline]:
+    return getattr(_scope, "deadline", None)
+
+
+@contextlib.contextmanager
+def deadline_scope(deadline: Optional[Deadline]) -> Iterator[Optional[Deadline]]:
+    """Bound the requests this thread makes inside the block; nested scopes keep the earliest deadline."""
+    outer = current_deadline()
+    _scope.deadline = deadline.earliest(outer) if deadline is not None else outer
+    try:
+        yield _scope.deadline
+    finally:
+        _scope.deadline = outer
+
+
+def call_timeout(default: float, deadline: Optional[Deadline]) -> float:
+    """Timeout for one request: the client's default, capped by the time left before `deadline`."""
+    if deadline is None:
+        return default
+    remaining = deadline.remaining()
+    if remaining <= 0:
+        raise DeadlineExceeded("Deadline reached before the Cursor API request could be sent.")
+    return min(default, remaining)
+
+
+class CallHandle:
+    """Lets another thread abort one in-flight call by shutting down its socket."""
+
+    def __init__(self) -> None:
+        self.aborted = threading.Event()
+        self._conn: Optional[http.client.HTTPConnection] = None
+        self._lock = threading.Lock()
+
+    def attach(self, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            if self.aborted.is_set():
+                raise RunCancelled("Cursor API request cancelled.")
+            self._conn = conn
+
+    def detach(self) -> None:
+        with self._lock:
+            self._conn = None
+
+    def abort(self) -> None:
+        with self._lock:
+            self.aborted.set()
+            sock = self._conn.sock if self._conn is not None else None
+        if sock is not None:
+            with contextlib.suppress(OSError):
+                sock.shutdown(socket.SHUT_RDWR)  # a blocked read returns at once
+
+
+def assistant_markdown(conversation: Dict[str, Any]) -> Optional[str]:
+    """The last non-empty assistant message of an agent conversation."""
+    for msg in reversed(conversation.get("messages", [])):
+        if msg.get("type") == "assistant_message":
+            text = msg.get("text", "").strip()
+            if text:
+                return text
+    return None
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a `Retry-After` header given in seconds or as an HTTP date."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=dt.timezone.utc)
+    return max(0.0, (when - dt.datetime.now(dt.timezone.utc)).total_seconds())
+
+
+class CursorClient:
+    """Keep-alive client shared by every call made during a run."""
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = DEFAULT_API_BASE,
+        verify_ssl: bool = True,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        budget: Optional[RequestBudget] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ) -> None:
+        parsed = urllib.parse.urlsplit(base_url)
+        if parsed.scheme not in {"http", "https"} or not parsed.hostname:
+            raise CursorApiError(f"Unsupported Cursor API base URL: {base_url}")
+        self.base_url = base_url.rstrip("/")
+        self.scheme = parsed.scheme
+        self.host = parsed.hostname
+        self.port = parsed.port
+        self.base_path = parsed.path.rstrip("/")
+        self.timeout = timeout
+        self.ssl_context: Optional[ssl.SSLContext] = None
+        if self.scheme == "https":
+            self.ssl_context = (
+                ssl.create_default_context() if verify_ssl else ssl._create_unverified_context()
+            )
+        auth_header = base64.b64encode(f"{api_key}:".encode()).decode()
+        self.headers = {
+            "Authorization": f"Basic {auth_header}",
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+            "Connection": "keep-alive",
+        }
+        self.max_connections = max_connections
+        self._idle: "queue.LifoQueue[http.client.HTTPConnection]" = queue.LifoQueue(maxsize=max_connections)
+        self.budget = budget or RequestBudget({})
+        self.breaker = breaker
+        self.max_retries = max_retries
+        self._stats_lock = threading.Lock()
+        self._cancelled = threading.Event()
+        self._calls: Set[CallHandle] = set()
+        self.streaming: Optional[bool] = None  # False once the API answered a stream request with plain JSON
+        self.connections_opened = 0
+        self.requests_sent = 0
+        self.retries = 0
+
+    @classmethod
+    def from_env(
+        cls,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        budget: Optional[RequestBudget] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ) -> "CursorClient":
+        return cls(**settings_from_env(max_connections, budget, breaker, max_retries))
+
+    def _new_connection(self) -> http.client.HTTPConnection:
+        with self._stats_lock:
+            self.connections_opened += 1
+        telemetry.count("http.connections_opened")
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(
+                self.host, self.port, timeout=self.timeout, context=self.ssl_context
+            )
+        return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+    def _acquire(self) -> http.client.HTTPConnection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return self._new_connection()
+
+    def _release(self, conn: http.client.HTTPConnection) -> None:
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def request(
+        self,
+        path: str,
+        payload: Optional[Dict[str, Any]] = None,
+        method: str = "GET",
+        deadline: Optional[Deadline] = None,
+        handle: Optional[CallHandle] = None,
+    ) -> Dict[str, Any]:
+        """Send one API request, bounded by `deadline` and the thread's `deadline_scope`."""
+        if self._cancelled.is_set():
+            raise RunCancelled("Cursor API client was cancelled.")
+        deadline = deadline.earliest(current_deadline()) if deadline else current_deadline()
+        return self._request(path, payload, method, deadline, handle)
+
+    def _request(
+        self,
+        path: str,
+        payload: Optional[Dict[str, Any]],
+        method: str,
+        deadline: Optional[Deadline],
+        handle: Optional[CallHandle] = None,
+    ) -> Dict[str, Any]:
+        handle = handle or CallHandle()
+        with self._stats_lock:
+            self._calls.add(handle)
+        try:
+            return self._attempts(path, payload, method, deadline, handle)
+        finally:
+            with self._stats_lock:
+                self._calls.discard(handle)
+
+    def _attempts(
+        self,
+        path: str,
+        payload: Optional[Dict[str, Any]],
+        method: str,
+        deadline: Optional[Deadline],
+        handle: CallHandle,
+    ) -> Dict[str, Any]:
+        body = json.dumps(payload).encode("utf-8") if payload is not None else None
+        kind = "launch" if method == "POST" else "poll"
+        retryable = RETRYABLE_POST_STATUSES if method == "POST" else RETRYABLE_GET_STATUSES
+        attempt = 0
+        while True:
+            trial = self._admit(kind, deadline, handle)
+            try:
+                status, raw, retry_after = self._send(
+                    method, f"{self.base_path}{path}", body, call_timeout(self.timeout, deadline), handle
+                )
+            except DeadlineExceeded:
+                raise
+            except CursorApiError as exc:
+                if handle.aborted.is_set():
+                    raise RunCancelled("Cursor API request cancelled.") from exc
+                status = 0
+                self._record_failure()
+                if deadline is not None and deadline.expired():
+                    raise DeadlineExceeded(f"{exc} (deadline reached)") from exc
+                # A POST may have reached the server before the connection dropped.
+                if method == "POST" or attempt >= self.max_retries:
+                    raise
+                delay = _backoff(attempt)
+            else:
+                self._record_outcome(status)
+                if status < 400:
+                    break
+                if status not in retryable or attempt >= self.max_retries:
+                    raise CursorApiError(
+                        f"Cursor API error {status}"
+                        + (f" after {attempt + 1} attempts" if attempt else "")
+                        + f": {raw.decode('utf-8', errors='replace')}",
+                        status=status,
+                        retry_after=retry_after,
+                    )
+                delay = retry_after if retry_after is not None else _backoff(attempt)
+            finally:
+                # An attempt that ended without an outcome (deadline, cancellation) frees the trial slot.
+                self._release_trial(trial)
+            attempt += 1
+            with self._stats_lock:
+                self.retries += 1
+            telemetry.count("http.retries")
+            if deadline is not None and deadline.remaining() <= delay:
+                raise DeadlineExceeded(f"Cursor API retry in {delay:.1f}s would miss the deadline.")
+            # Throttling is shared: a 429 holds back every thread using the bucket.
+            if not (status == 429 and self.budget.defer(kind, delay)) and handle.aborted.wait(delay):
+                raise RunCancelled("Cursor API request cancelled.")
+        try:
+            return json.loads(raw.decode("utf-8"))
+        except json.JSONDecodeError as exc:
+            raise CursorApiError(f"Invalid JSON from Cursor API: {exc}") from exc
+
+    def pause(self, seconds: float) -> None:
+        """Sleep, waking up early with `RunCancelled` if the client is cancelled."""
+        if self._cancelled.wait(seconds):
+            raise RunCancelled("Cursor API client was cancelled.")
+
+    def cancel(self) -> None:
+        """Refuse further requests and abort those in flight; their threads get `RunCancelled` at once."""
+        self._cancelled.set()
+        with self._stats_lock:
+            calls = list(self._calls)
+        for call in calls:
+            call.abort()
+
+    def stop_agents(self, agent_ids: List[str]) -> List[str]:
+        """Ask the API to stop the agents concurrently, even after `cancel()`; returns the ids it accepted."""
+        if not agent_ids:
+            return []
+        deadline = Deadline.after(STOP_TIMEOUT)
+
+        def stop(agent_id: str) -> bool:
+            try:
+                self._request(f"/agents/{agent_id}/stop", {}, "POST", deadline)
+            except (CursorApiError, RunCancelled):
+                return False
+            return True
+
+        workers = min(len(agent_ids), self.max_connections)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cursor-stop") as pool:
+            results = list(pool.map(stop, agent_ids))
+        return [agent_id for agent_id, stopped in zip(agent_ids, results) if stopped]
+
+    def _admit(self, kind: str, deadline: Optional[Deadline], handle: CallHandle) -> int:
+        """Wait for the breaker and the budget; returns the breaker trial slot taken (0 if none).
+
+        The budget wait ends early with `RunCancelled` if the call is aborted, and
+        with `DeadlineExceeded` if the token would only be ready after `deadline`.
+        """
+        trial = 0
+        if self.breaker:
+            remaining, trial = self.breaker.admit()
+            if remaining is not None:
+                telemetry.count("http.circuit_rejected")
+                raise CircuitOpenError(f"Cursor API circuit open after repeated failures; retry in {remaining:.0f}s.")
+        try:
+            wait = self.budget.reserve(kind)
+            if wait > 0:
+                telemetry.count(f"http.budget_waits.{kind}")
+                late = deadline is not None and deadline.remaining() < wait
+                if handle.aborted.wait(min(wait, deadline.remaining()) if deadline is not None else wait):
+                    raise RunCancelled("Cursor API request cancelled.")
+                if late:
+                    raise DeadlineExceeded(f"Cursor API {kind} budget wait of {wait:.1f}s would miss the deadline.")
+        except BaseException:
+            self._release_trial(trial)
+            raise
+        return trial
+
+    def _release_trial(self, trial: int) -> None:
+        if trial and self.breaker:
+            self.breaker.release_trial(trial)
+
+    def _record_outcome(self, status: int) -> None:
+        if status >= 500:
+            self._record_failure()
+        elif self.breaker:
+            self.breaker.record_success()
+
+    def _record_failure(self) -> None:
+        if self.breaker and self.breaker.record_failure():
+            telemetry.count("http.circuit_opened")
+
+    def _open(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        headers: Dict[str, str],
+        timeout: float,
+        handle: CallHandle,
+    ) -> Tuple[http.client.HTTPConnection, http.client.HTTPResponse]:
+        for attempt in (1, 2):
+            conn = self._acquire()
+            try:
+                handle.attach(conn)
+            except RunCancelled:
+                self._release(conn)
+                raise
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+            try:
+                conn.request(method, url, body=body, headers=headers)
+                response = conn.getresponse()
+            except _STALE_CONNECTION_ERRORS as exc:
+                conn.close()
+                telemetry.count("http.stale_connections")
+                if attempt == 2:
+                    raise CursorApiError(f"Cursor API network error: {exc}") from exc
+                continue
+            except (OSError, http.client.HTTPException) as exc:
+                conn.close()
+                telemetry.count("http.network_errors")
+                raise CursorApiError(f"Cursor API network error: {exc}") from exc
+            with self._stats_lock:
+                self.requests_sent += 1
+            return conn, response
+        raise AssertionError("unreachable")
+
+    def _finish(self, conn: http.client.HTTPConnection, response: http.client.HTTPResponse) -> None:
+        if response.will_close or not response.isclosed():
+            conn.close()
+        else:
+            self._release(conn)
+
+    def _send(
+        self, method: str, url: str, body: Optional[bytes], timeout: float, handle: CallHandle
+    ) -> Tuple[int, bytes, Optional[float]]:
+        started = time.monotonic()
+        try:
+            conn, response = self._open(method, url, body, self.headers, timeout, handle)
+            try:
+                raw = response.read()
+            except (OSError, http.client.HTTPException) as exc:
+                conn.close()
+                telemetry.count("http.network_errors")
+                raise CursorApiError(f"Cursor API network error: {exc}") from exc
+        finally:
+            handle.detach()
+        if telemetry.enabled():
+            route = AGENT_ID_SEGMENT.sub("/agents/{id}", url[len(self.base_path):])
+            telemetry.record_http(
+                method, route, response.status, len(body or b""), len(raw), time.monotonic() - started
+            )
+        self._finish(conn, response)
+        return response.status, raw, parse_retry_after(response.getheader("Retry-After"))
+
+    def stream(
+        self, path: str, deadline: Optional[Deadline] = None, handle: Optional[CallHandle] = None
+    ) -> Iterator[Tuple[str, str]]:
+        """Yield `(event, data)` server-sent events from `path` as they arrive.
+
+        Comment lines (server heartbeats) are yielded as `("", "")` so callers
+        can check their own deadlines while the agent is quiet. Closing the
+        generator early drops the connection instead of returning it to the pool.
+        """
+        if self._cancelled.is_set():
+            raise RunCancelled("Cursor API client was cancelled.")
+        deadline = deadline.earliest(current_deadline()) if deadline else current_deadline()
+        handle = handle or CallHandle()
+        with self._stats_lock:
+            self._calls.add(handle)
+        try:
+            yield from self._stream(path, deadline, handle)
+        finally:
+            handle.detach()
+            with self._stats_lock:
+                self._calls.discard(handle)
+
+    def _stream(self, path: str, deadline: Optional[Deadline], handle: CallHandle) -> Iterator[Tuple[str, str]]:
+        headers = dict(self.headers, Accept=EVENT_STREAM_TYPE)
+        timeout = call_timeout(self.timeout, deadline)
+        trial = self._admit("poll", deadline, handle)
+        try:
+            conn, response = self._open("GET", f"{self.base_path}{path}", None, headers, timeout, handle)
+        except CursorApiError as exc:
+            if handle.aborted.is_set():
+                raise RunCancelled("Cursor API request cancelled.") from exc
+            self._record_failure()
+            raise
+        else:
+            self._record_outcome(response.status)
+        finally:
+            self._release_trial(trial)
+        telemetry.count("http.streams")
+        content_type = (response.getheader("Content-Type") or "").split(";")[0].strip()
+        if response.status >= 400 or content_type != EVENT_STREAM_TYPE:
+            try:
+                raw = response.read()
+            except (OSError, http.client.HTTPException) as exc:
+                conn.close()
+                if handle.aborted.is_set():
+                    raise RunCancelled("Cursor API request cancelled.") from exc
+                raise CursorApiError(f"Cursor API network error: {exc}") from exc
+            handle.detach()
+            self._finish(conn, response)
+            if response.status >= 400:
+                raise CursorApiError(
+                    f"Cursor API error {response.status}: {raw.decode('utf-8', errors='replace')}",
+                    status=response.status,
+                    retry_after=parse_retry_after(response.getheader("Retry-After")),
+                )
+            self.streaming = False
+            raise StreamingUnsupported(f"Cursor API did not stream {path} (Content-Type: {content_type or 'none'}).")
+        completed = False
+        try:
+            yield from _iter_events(response)
+            completed = True
+        except (OSError, http.client.HTTPException) as exc:
+            if handle.aborted.is_set():
+                raise RunCancelled("Cursor API request cancelled.") from exc
+            telemetry.count("http.network_errors")
+            raise CursorApiError(f"Cursor API stream interrupted: {exc}") from exc
+        finally:
+            handle.detach()
+            if completed:
+                self._finish(conn, response)
+            else:
+                conn.close()
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+def settings_from_env(
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    budget: Optional[RequestBudget] = None,
+    breaker: Optional[CircuitBreaker] = None,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+) -> Dict[str, Any]:
+    """Client constructor arguments from `CURSOR_API_KEY`, `CURSOR_API_BASE` and `CURSOR_SKIP_SSL_VERIFY`."""
+    api_key = os.getenv("CURSOR_API_KEY")
+    if not api_key:
+        raise CursorApiError("CURSOR_API_KEY environment variable is required.")
+    return {
+        "api_key": api_key,
+        "base_url": os.getenv("CURSOR_API_BASE", DEFAULT_API_BASE),
+        "verify_ssl": os.getenv("CURSOR_SKIP_SSL_VERIFY") != "1",
+        "max_connections": max_connections,
+        "budget": budget or RequestBudget.build(),
+        "breaker": breaker or CircuitBreaker(),
+        "max_retries": max_retries,
+    }
+
+
+def _backoff(attempt: int) -> float:
+    return random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2**attempt))
+
+
+class EventParser:
+    """Incremental server-sent event parser: feed raw lines, get `(event, data)` items back."""
+
+    def __init__(self) -> None:
+        self.event = ""
+        self.data: List[str] = []
+
+    def feed(self, line: bytes) -> Optional[Tuple[str, str]]:
+        text = line.decode("utf-8").rstrip("\r\n")
+        if not text:
+            item = (self.event or "message", "\n".join(self.data)) if self.data else None
+            self.event, self.data = "", []
+            return item
+        if text.startswith(":"):
+            return "", ""
+        field, _, value = text.partition(":")
+        value = value[1:] if value.startswith(" ") else value
+        if field == "event":
+            self.event = value
+        elif field == "data":
+            self.data.append(value)
+        return None
+
+
+def _iter_events(response: http.client.HTTPResponse) -> Iterator[Tuple[str, str]]:
+    parser = EventParser()
+    while True:
+        line = response.readline()
+        if not line:
+            return
+        item = parser.feed(line)
+        if item is not None:
+            yield item
+
+
+_default_client: Optional[CursorClient] = None
+_default_client_lock = threading.Lock()
+
+
+def get_client() -> CursorClient:
+    """Return the process-wide client, creating it from the environment on first use."""
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = CursorClient.from_env()
+        return _default_client
+
+
+def set_client(client: Optional[CursorClient]) -> None:
+    """Install (or with None, reset) the client returned by `get_client`."""
+    global _default_client
+    with _default_client_lock:
+        if _default_client is not None and _default_client is not client:
+            _default_client.close()
+        _default_client = client
+
+
+def cursor_request(
+    path: str,
+    payload: Optional[Dict[str, Any]] = None,
+    method: str = "GET",
+) -> Dict[str, Any]:
+    return get_client().request(path, payload, method=method)
+
+
+def cursor_stream(path: str) -> Iterator[Tuple[str, str]]:
+    return get_client().stream(path)
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Offline extractive brief used when no agent result is available.
+
+Sentences are ranked with TextRank on the cosine-similarity graph of their
+TF-IDF vectors, with a mild penalty for very short and very long (run-on)
+sentences. The graph is never built: each power-iteration step is two sparse
+matrix-vector products with the TF-IDF matrix, so a step costs one pass over
+the transcript's terms rather than one per pair of sentences, and scoring a
+multi-hour transcript stays linear. Keyword patterns then bucket sentences into the sections
+`build_prompt` asks the agent for: decisions, action items (owner and due date
+when the sentence names them), requirements, integration notes, next sessions
+and risks/open questions. Each section keeps its highest-scoring, non-redundant
+sentences in transcript order.
+"""
+
+from __future__ import annotations
+
+import collections
+import math
+import re
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from transcript_ingest.model import Transcript
+
+# Sections after Summary, in the order build_prompt asks for them.
+SECTIONS = (
+    "Business Requirements",
+    "Technical Requirements",
+    "Architecture / Integration Notes",
+    "Action Items",
+    "Next Steps & Upcoming Sessions",
+    "Risks & Open Questions",
+)
+SECTION_LIMITS = {
+    "Summary": 6,
+    "Key Decisions": 6,
+    "Business Requirements": 6,
+    "Technical Requirements": 6,
+    "Architecture / Integration Notes": 6,
+    "Action Items": 10,
+    "Next Steps & Upcoming Sessions": 5,
+    "Risks & Open Questions": 6,
+}
+
+STOPWORDS = frozenset(
+    """
+    a about above after again against all also am an and any are as at be because been before being below
+    between both but by can could did do does doing down during each few for from further had has have having
+    he her here hers him his how i if in into is it its itself just let like me more most my no nor not now of
+    off on once only or other our ours out over own really right same she should so some such than that the
+    their theirs them then there these they this those through to too under until up us very was we were what
+    when where which while who whom why will with would yeah yes you your okay ok um uh so well think know going
+    get got one two thing things kind sort mean actually sure yep oh hey bye thanks thank great good sounds sense
+    gonna want lot maybe see say said it's that's i'm don't we're you're there's let's can't didn't doesn't isn't
+    i'll we'll they'll i've we've
+    """.split()
+)
+
+TEXTRANK_DAMPING = 0.85
+TEXTRANK_MAX_ITERATIONS = 50
+TEXTRANK_TOLERANCE = 1e-4  # L1 change of the rank vector, which sums to 1
+
+WORD = re.compile(r"[a-z][a-z0-9'\-]+")
+SENTENCE_END = re.compile(r"(?<=[.!?])\s+(?=[A-Z0-9\"'(\[])")
+
+MONTHS = r"jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|jun(?:e)?|jul(?:y)?|aug(?:ust)?|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?"
+WEEKDAYS = r"monday|tuesday|wednesday|thursday|friday|saturday|sunday"
+DUE_DATE = re.compile(
+    rf"\b(?:(?:by|before|until|on|due)\s+)?(?:\d{{4}}-\d{{2}}-\d{{2}}|\d{{1,2}}/\d{{1,2}}(?:/\d{{2,4}})?|"
+    rf"(?:{MONTHS})\.?\s+\d{{1,2}}(?:st|nd|rd|th)?|\d{{1,2}}(?:st|nd|rd|th)?\s+(?:{MONTHS})|"
+    rf"(?:next\s+|this\s+)?(?:{WEEKDAYS})|end of (?:the )?(?:day|week|month|sprint)|eod|eow|tomorrow|next week)\b",
+    re.IGNORECASE,
+)
+ACTION = re.compile(
+    r"\b(?:will|i'll|we'll|they'll|shall|going to|action item|to-?do|follow(?:s|ed)?[ -]up|owner|assigned|"
+    r"committed to|needs? to|take (?:an|the) action|responsible for|send|share|reshare|prepare|schedule)\b",
+    re.IGNORECASE,
+)
+ACTOR = re.compile(r"\b(?P<name>[A-Z][a-z]+(?:\s+[A-Z][a-zA-Z'\-]+)?)\s+(?:will|agreed to|committed to)\b")
+DECISION = re.compile(
+    r"\b(?:decided|decision|agreed|agreement|approved|settled on|concluded|confirmed|go(?:ing)? with|"
+    r"final(?:ised|ized)?|resolved|sign(?:ed)? off)\b",
+    re.IGNORECASE,
+)
+BUSINESS = re.compile(
+    r"\b(?:customer|client|user|business|policy|policies|premium|claims?|quot(?:e|ation)|promo|referral|pricing|"
+    r"product|broker|underwrit\w*|renewal|journey|marketing|finance|financials?|compliance|legal|report(?:ing)?)\b",
+    re.IGNORECASE,
+)
+TECHNICAL = re.compile(
+    r"\b(?:api|apis|endpoint|integration|service|database|schema|json\w*|xml|file|sftp|http\w*|auth\w*|"
+    r"token|latency|performance|deploy\w*|environment|event|webhook|payload|system|platform|data|sync|batch|"
+    r"version|v\d|ui|screen|validation|header)\b",
+    re.IGNORECASE,
+)
+ARCHITECTURE = re.compile(
+    r"\b(?:architecture|integrat\w*|flow|sequence|interface|contract|upstream|downstream|"
+    r"source of truth|mapping|design|proof of concept|poc)\b",
+    re.IGNORECASE,
+)
+NEXT_SESSION = re.compile(
+    r"\b(?:next (?:session|meeting|call|workshop|demo|week)|follow-?up (?:session|meeting|call)|"
+    r"schedul\w*|workshop|reconvene|catch up|sync up|demo)\b",
+    re.IGNORECASE,
+)
+RISK = re.compile(
+    r"\b(?:risk\w*|concern\w*|issue\w*|blocker\w*|block(?:ed|ing)|unclear|open question|not sure|unsure|"
+    r"depend\w*|problem\w*|challenge\w*|lack\w*|missing|delay\w*|unknown)\b",
+    re.IGNORECASE,
+)
+
+
+class Sentence:
+    __slots__ = ("index", "text", "speaker", "tokens", "score")
+
+    def __init__(self, index: int, text: str, speaker: Optional[str], tokens: List[str]) -> None:
+        self.index = index
+        self.text = text
+        self.speaker = speaker
+        self.tokens = tokens
+        self.score = 0.0
+
+
+def split_sentences(text: Union[str, Transcript]) -> List[Sentence]:
+    transcript = text if isinstance(text, Transcript) else Transcript.from_text(text)
+    # Speaker names would otherwise dominate the term weights.
+    names = {word for speaker in transcript.speakers for word in WORD.findall(speaker.lower())}
+    sentences: List[Sentence] = []
+    for speaker, body in transcript.bodies():
+        for part in SENTENCE_END.split(body):
+            part = part.strip()
+            tokens = [word for word in WORD.findall(part.lower()) if word not in STOPWORDS and word not in names]
+            if len(tokens) >= 3:
+                sentences.append(Sentence(len(sentences), part, speaker, tokens))
+    return sentences
+
+
+def _tfidf_rows(sentences: Sequence[Sentence]) -> Tuple[List[Tuple[List[int], List[float]]], List[str]]:
+    """Unit-length TF-IDF rows as (term ids, weights), and the term of each id."""
+    terms: Dict[str, int] = {}
+    counts: List[collections.Counter] = []
+    document_frequency: List[int] = []
+    for sentence in sentences:
+        counter = collections.Counter(terms.setdefault(word, len(terms)) for word in sentence.tokens)
+        if len(terms) > len(document_frequency):
+            document_frequency.extend([0] * (len(terms) - len(document_frequency)))
+        for term in counter:
+            document_frequency[term] += 1
+        counts.append(counter)
+    total = len(sentences)
+    idf = [math.log((1 + total) / (1 + count)) + 1.0 for count in document_frequency]
+    rows = []
+    for counter in counts:
+        ids = list(counter)
+        weights = [counter[term] * idf[term] for term in ids]
+        norm = math.sqrt(sum(weight * weight for weight in weights))
+        rows.append((ids, [weight / norm for weight in weights]))
+    return rows, list(terms)
+
+
+def _textrank(rows: Sequence[Tuple[List[int], List[float]]], vocabulary: int) -> Tuple[List[float], List[float]]:
+    """TextRank scores (mean 1) and the column sums of the TF-IDF matrix `rows`.
+
+    The edge weight between two sentences is the dot product of their rows, so
+    with X the matrix, W·r = X(Xᵀr) - r (the rows have unit length), and a
+    node's degree is its row times the column sums, less its self-similarity.
+    """
+    count = len(rows)
+    column_sums = [0.0] * vocabulary
+    for ids, weights in rows:
+        for term, weight in zip(ids, weights):
+            column_sums[term] += weight
+    degrees = [sum(weight * column_sums[term] for term, weight in zip(ids, weights)) - 1.0 for ids, weights in rows]
+    rank = [1.0 / count] * count
+    for _ in range(TEXTRANK_MAX_ITERATIONS):
+        shares = [value / degree if degree > 1e-9 else 0.0 for value, degree in zip(rank, degrees)]
+        spread = [0.0] * vocabulary  # Xᵀ·shares
+        for (ids, weights), share in zip(rows, shares):
+            if share:
+                for term, weight in zip(ids, weights):
+                    spread[term] += weight * share
+        updated = [
+            (1 - TEXTRANK_DAMPING) / count
+            + TEXTRANK_DAMPING * max(sum(weight * spread[term] for term, weight in zip(ids, weights)) - share, 0.0)
+            for (ids, weights), share in zip(rows, shares)
+        ]
+        change = sum(abs(new - old) for new, old in zip(updated, rank))
+        rank = updated
+        if change < TEXTRANK_TOLERANCE:
+            break
+    total = sum(rank)
+    return [value * count / total for value in rank], column_sums
+
+
+def score_sentences(sentences: Sequence[Sentence]) -> Dict[str, float]:
+    """Set each sentence's TextRank score; return the TF-IDF centroid (term → summed weight)."""
+    if not sentences:
+        return {}
+    rows, terms = _tfidf_rows(sentences)
+    rank, column_sums = _textrank(rows, len(terms))
+    for sentence, value in zip(sentences, rank):
+        length_factor = min(1.0, len(sentence.tokens) / 8, 40 / len(sentence.tokens))
+        sentence.score = value * length_factor
+    return dict(zip(terms, column_sums))
+
+
+def _select(ranked: Sequence[Sentence], predicate: Callable[[str], Any], limit: int, used: set) -> List[Sentence]:
+    """Best `limit` unused, non-redundant sentences matching `predicate`, in transcript order.
+
+    `ranked` is sorted by score, so the (comparatively costly) keyword patterns
+    only run until the section is full rather than over every sentence.
+    """
+    chosen: List[Sentence] = []
+    chosen_tokens: List[set] = []
+    for sentence in ranked:
+        if sentence.index in used or not predicate(sentence.text):
+            continue
+        tokens = set(sentence.tokens)
+        if any(len(tokens & other) / len(tokens | other) > 0.6 for other in chosen_tokens):
+            continue
+        chosen.append(sentence)
+        chosen_tokens.append(tokens)
+        if len(chosen) == limit:
+            break
+    used.update(sentence.index for sentence in chosen)
+    return sorted(chosen, key=lambda item: item.index)
+
+
+def _action_item(sentence: Sentence) -> str:
+    text = sentence.text
+    actor = ACTOR.search(text)
+    if actor and actor.group("name").split()[0].lower() not in STOPWORDS:
+        owner: Optional[str] = actor.group("name")
+    elif sentence.speaker and re.search(r"\b(?:I|I'll|I will|me)\b", text):
+        owner = sentence.speaker
+    else:
+        owner = None
+    due = DUE_DATE.search(text)
+    details = [f"owner: {owner}" if owner else "owner: _unassigned_"]
+    if due:
+        details.append(f"due: {due.group(0)}")
+    return f"- [ ] {text} ({'; '.join(details)})"
+
+
+def bucket_sentences(sentences: Sequence[Sentence]) -> Dict[str, List[Sentence]]:
+    ranked = sorted(sentences, key=lambda item: item.score, reverse=True)
+    used: set = set()
+    # Most specific buckets first so a sentence lands in the section that fits it best.
+    predicates: List[Tuple[str, Callable[[str], Any]]] = [
+        ("Key Decisions", DECISION.search),
+        ("Action Items", lambda text: ACTION.search(text) and (ACTOR.search(text) or DUE_DATE.search(text))),
+        ("Next Steps & Upcoming Sessions", NEXT_SESSION.search),
+        ("Risks & Open Questions", lambda text: text.endswith("?") or RISK.search(text)),
+        ("Architecture / Integration Notes", ARCHITECTURE.search),
+        ("Technical Requirements", TECHNICAL.search),
+        ("Business Requirements", BUSINESS.search),
+        ("Summary", lambda text: True),
+    ]
+    return {
+        section: _select(ranked, predicate, SECTION_LIMITS[section], used) for section, predicate in predicates
+    }
+
+
+def top_keywords(centroid: Dict[str, float], count: int = 12) -> List[str]:
+    return [word for word, _ in sorted(centroid.items(), key=lambda item: item[1], reverse=True)[:count]]
+
+
+def extractive_brief(text: Union[str, Transcript]) -> str:
+    """Sectioned markdown brief built only from sentences of `text`."""
+    sentences = split_sentences(text)
+    centroid = score_sentences(sentences)
+    buckets = bucket_sentences(sentences)
+    lines: List[str] = ["## Summary", ""]
+    lines.extend(f"- {item.text}" for item in buckets["Summary"])
+    if buckets["Key Decisions"]:
+        lines.extend(["", "**Decisions**", ""])
+        lines.extend(f"- {item.text}" for item in buckets["Key Decisions"])
+    lines.append("")
+    for heading in SECTIONS:
+        items = buckets[heading]
+        lines.extend([f"## {heading}", ""])
+        render = _action_item if heading == "Action Items" else (lambda item: f"- {item.text}")
+        lines.extend(render(item) for item in items)
+        if not items:
+            lines.append("_Nothing identified in the transcript._")
+        lines.append("")
+    lines.extend(
+        [
+            "## Mermaid Diagrams",
+            "",
+            "_Not generated in offline fallback mode._",
+            "",
+            "## Appendix",
+            "",
+            f"- Extracted from {len(sentences)} transcript sentences without an agent.",
+            f"- Top keywords: {', '.join(top_keywords(centroid)) or 'n/a'}",
+        ]
+    )
+    return "\n".join(lines).strip()
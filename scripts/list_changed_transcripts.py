@@ -4,7 +4,9 @@ Utility script used by GitHub Actions to discover newly changed meeting
 transcript files between two commits.
 
 It prints one path per line so that downstream steps can iterate and feed each
-file into the Cursor Cloud agent.
+file into the Cursor Cloud agent. Candidates whose git blob SHA is already
+recorded in the brief manifest (see `transcript_manifest.py`) are skipped, so
+content that was summarised before is not sent to the agent again.
 """
 
 from __future__ import annotations
@@ -13,9 +15,12 @@ import argparse
 import pathlib
 import subprocess
 import sys
-from typing import Iterable, List, Sequence
+from typing import Dict, Iterable, List, Sequence, Set
 
-VALID_EXTENSIONS = {".gdoc", ".docx", ".md", ".txt"}
+from transcript_ingest import SUPPORTED_EXTENSIONS
+from transcript_manifest import DEFAULT_MANIFEST_PATH, TranscriptManifest
+
+VALID_EXTENSIONS = set(SUPPORTED_EXTENSIONS)
 
 
 def parse_args() -> argparse.Namespace:
@@ -30,6 +35,16 @@ def parse_args() -> argparse.Namespace:
         default=["meeting-notes", "docs/meeting-notes", "transcripts", "meeting_transcripts"],
         help="Directory prefixes to scan for transcript files.",
     )
+    parser.add_argument(
+        "--manifest",
+        default=str(DEFAULT_MANIFEST_PATH),
+        help=f"Brief manifest used to skip already summarised content (default: {DEFAULT_MANIFEST_PATH}).",
+    )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Ignore the manifest and list every changed transcript.",
+    )
     return parser.parse_args()
 
 
@@ -49,7 +64,38 @@ def changed_files(base: str, head: str) -> Iterable[str]:
     if set(base) == zero:
         # Initial push scenario: list entire tree at head.
         return _run_git(["ls-tree", "-r", "--name-only", head])
-    return _run_git(["diff", "--name-only", f"{base}..{head}"])
+    try:
+        return _run_git(["diff", "--name-only", f"{base}..{head}"])
+    except subprocess.CalledProcessError:
+        # Force-push: the old head is no longer reachable. Fall back to the
+        # whole tree and let the manifest filter out unchanged content.
+        return _run_git(["ls-tree", "-r", "--name-only", head])
+
+
+def blob_shas(head: str, paths: Sequence[str]) -> Dict[str, str]:
+    """Resolve `head:path` to blob SHAs with a single `git cat-file --batch-check`."""
+    if not paths:
+        return {}
+    completed = subprocess.run(
+        ["git", "cat-file", "--batch-check"],
+        input="".join(f"{head}:{path}\n" for path in paths),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        check=True,
+        text=True,
+    )
+    shas: Dict[str, str] = {}
+    for path, line in zip(paths, completed.stdout.splitlines()):
+        parts = line.split()
+        if len(parts) == 3 and parts[1] == "blob":
+            shas[path] = parts[0]
+    return shas
+
+
+def unsummarised(head: str, paths: Sequence[str], known_blobs: Set[str]) -> List[str]:
+    """Drop deleted paths and paths whose content is already in the manifest."""
+    shas = blob_shas(head, paths)
+    return [path for path in paths if path in shas and shas[path] not in known_blobs]
 
 
 def filter_transcripts(files: Iterable[str], roots: Sequence[str]) -> List[str]:
@@ -73,6 +119,13 @@ def main() -> None:
         sys.exit(exc.returncode)
 
     filtered = filter_transcripts(files, args.roots)
+    if not args.all:
+        known_blobs = TranscriptManifest(pathlib.Path(args.manifest)).known_blobs()
+        try:
+            filtered = unsummarised(args.head, filtered, known_blobs)
+        except subprocess.CalledProcessError as exc:
+            sys.stderr.write(exc.stderr)
+            sys.exit(exc.returncode)
     for path in filtered:
         print(path)
 
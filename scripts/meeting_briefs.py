@@ -0,0 +1,410 @@
+#!/usr/bin/env python3
+"""
+Turning transcripts into meeting briefs.
+
+`process_transcript` reads and normalises one transcript, reuses briefs the
+journal or the brief cache already has, runs one agent per template for the
+rest (map-reduce over chunk summaries for long transcripts), falls back to an
+extractive summary when an agent fails, and writes each brief atomically with
+its front matter. `process_batch` does that for many transcripts on a bounded
+worker pool. The prompts for the architecture brief and for the chunk and
+reduce steps live here too.
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import pathlib
+import re
+import sys
+import textwrap
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+import telemetry
+from agent_runs import run_agent
+from atomic_write import write_atomic
+from brief_cache import cache_key
+from chunking import split_transcript
+from cursor_api import CursorApiError
+from extractive_summary import extractive_brief
+from normalization import NORMALIZATION_VERSION, normalize_structured
+from prompt_templates import DEFAULT_TEMPLATE, PromptTemplate
+from transcript_ingest import Transcript, read_structured
+
+DEFAULT_OUTPUT_DIR = pathlib.Path("meeting_outputs")
+# Bump whenever build_prompt changes so cached briefs are not reused for a new prompt.
+PROMPT_TEMPLATE_VERSION = "architecture-brief-1"
+
+
+def slugify(text: str) -> str:
+    safe = re.sub(r"[^A-Za-z0-9]+", "-", text).strip("-")
+    return safe.lower() or "meeting"
+
+
+def infer_metadata(path: pathlib.Path, meeting_date: Optional[str], title: Optional[str]) -> Dict[str, str]:
+    if not title:
+        title = path.stem.replace("-", " ").replace("_", " ").title()
+    if not meeting_date:
+        match = re.match(r"(\d{4}-\d{2}-\d{2})", path.name)
+        if match:
+            meeting_date = match.group(1)
+    if not meeting_date:
+        meeting_date = dt.date.today().isoformat()
+    return {"title": title, "date": meeting_date}
+
+
+def build_prompt(metadata: Dict[str, str], stakeholders: Optional[str], transcript: str) -> str:
+    stakeholder_text = stakeholders or "Not specified"
+    return textwrap.dedent(
+        f"""
+        You are a principal solutions architect. Analyse the following meeting transcript
+        and produce a single markdown document tailored for architecture planning.
+
+        Meeting title: {metadata['title']}
+        Meeting date: {metadata['date']}
+        Stakeholders: {stakeholder_text}
+
+        Requirements:
+        - Summarize the meeting context and key decisions.
+        - List business requirements, technical requirements, constraints, and assumptions.
+        - Capture action items with owners and due dates if available.
+        - Recommend next sessions/workshops with target attendees and agenda bullets.
+        - If business/customer flows were discussed, provide a Mermaid flowchart or sequence diagram.
+        - If solution or integration designs were discussed, provide a Mermaid sequence/class diagram describing system interactions.
+        - Include sections: Summary, Business Requirements, Technical Requirements, Architecture / Integration Notes, Action Items, Next Steps & Upcoming Sessions, Mermaid Diagrams, Risks & Open Questions, Appendix.
+        - Respond with the full markdown document in a single message. Do not reference separate files or attachments.
+        - Keep the output professional and suitable for handoff to implementation teams.
+
+        Transcript:
+        ---
+        {transcript}
+        ---
+        """
+    ).strip()
+
+
+ARCHITECTURE_TEMPLATE = PromptTemplate(
+    DEFAULT_TEMPLATE,
+    "Architecture Brief",
+    PROMPT_TEMPLATE_VERSION,
+    None,
+    [
+        "Summary",
+        "Business Requirements",
+        "Technical Requirements",
+        "Architecture / Integration Notes",
+        "Action Items",
+        "Next Steps & Upcoming Sessions",
+        "Mermaid Diagrams",
+        "Risks & Open Questions",
+        "Appendix",
+    ],
+    build_prompt,
+)
+
+
+def build_chunk_prompt(metadata: Dict[str, str], chunk: str, index: int, total: int) -> str:
+    header = textwrap.dedent(
+        f"""
+        You are a principal solutions architect. The transcript of the meeting
+        "{metadata['title']}" ({metadata['date']}) is too long to read at once, so it has
+        been split into {total} consecutive parts. This is part {index} of {total}; parts
+        overlap slightly at their edges.
+
+        Summarise only this part as markdown notes for a later merge step. Keep every
+        decision, business requirement, technical requirement, constraint, assumption,
+        action item (with owner and due date), risk, open question, proposed follow-up
+        session, and any business flow or system interaction that could become a Mermaid
+        diagram. Keep speaker names. Do not write an introduction or conclusion.
+        """
+    ).strip()
+    return f"{header}\n\nTranscript part {index}/{total}:\n---\n{chunk}\n---"
+
+
+def build_reduce_prompt(
+    metadata: Dict[str, str],
+    stakeholders: Optional[str],
+    partials: List[str],
+    template: PromptTemplate = ARCHITECTURE_TEMPLATE,
+) -> str:
+    merged = "\n\n".join(
+        f"### Part {index} of {len(partials)}\n\n{partial}" for index, partial in enumerate(partials, start=1)
+    )
+    note = (
+        f"Note: the meeting was too long for one pass. The transcript section below contains "
+        f"{len(partials)} partial summaries of consecutive, slightly overlapping parts of it, "
+        "in meeting order. Merge them, removing duplicates from the overlaps."
+    )
+    return f"{note}\n\n{template.render(metadata, stakeholders, merged)}"
+
+
+def summarize_chunks(chunks: List[str], metadata: Dict[str, str], args: argparse.Namespace) -> List[str]:
+    """Map each chunk to a partial summary concurrently (the input of every template's reduce step)."""
+    total = len(chunks)
+    prompts = [build_chunk_prompt(metadata, chunk, index, total) for index, chunk in enumerate(chunks, start=1)]
+    partials: List[str] = []
+    errors: List[CursorApiError] = []
+    with ThreadPoolExecutor(max_workers=min(args.max_concurrency, total), thread_name_prefix="chunk-agent") as pool:
+        futures = [pool.submit(run_agent, prompt, args) for prompt in prompts]
+        for index, future in enumerate(futures, start=1):
+            try:
+                _, partial = future.result()
+            except CursorApiError as exc:
+                errors.append(exc)
+                partial = None
+            partials.append(partial or f"_Summary of part {index} is unavailable._")
+    if len(errors) == total:
+        raise errors[0]
+    return partials
+
+
+def summarize_chunked(
+    chunks: List[str],
+    metadata: Dict[str, str],
+    args: argparse.Namespace,
+    partial_path: Optional[pathlib.Path] = None,
+) -> Tuple[str, Optional[str]]:
+    """Map each chunk to a partial summary concurrently, then reduce them into one brief."""
+    partials = summarize_chunks(chunks, metadata, args)
+    return run_agent(build_reduce_prompt(metadata, args.stakeholders, partials), args, partial_path)
+
+
+def heuristic_fallback(
+    transcript: Union[str, Transcript], metadata: Dict[str, str], template: PromptTemplate = ARCHITECTURE_TEMPLATE
+) -> str:
+    brief = extractive_brief(transcript)
+    if template.name != DEFAULT_TEMPLATE:
+        brief = _template_sections(brief, template.sections)
+    return (
+        "_Cursor agent fallback summary (extractive, generated offline)_\n\n"
+        f"Meeting: {metadata['title']} ({metadata['date']})\n\n"
+        f"{brief}"
+    )
+
+
+def _template_sections(brief: str, sections: List[str]) -> str:
+    """Keep the `## ` sections of an extractive brief that share a heading word with `sections`."""
+    wanted = {word for section in sections for word in re.findall(r"[a-z]{4,}", section.lower())}
+    blocks = re.split(r"\n(?=## )", brief)
+    kept = [block for block in blocks if wanted & set(re.findall(r"[a-z]{4,}", block.splitlines()[0].lower()))]
+    return "\n".join(kept) if kept else brief
+
+
+def build_output(
+    content: str,
+    metadata: Dict[str, str],
+    transcript_path: pathlib.Path,
+    agent_id: Optional[str],
+    template: PromptTemplate = ARCHITECTURE_TEMPLATE,
+) -> str:
+    lines = [
+        "---",
+        f"meeting: \"{metadata['title']}\"",
+        f"date: \"{metadata['date']}\"",
+        f"source_transcript: \"{transcript_path.as_posix()}\"",
+        f"agent_id: \"{agent_id or 'fallback'}\"",
+    ]
+    if template.name != DEFAULT_TEMPLATE:
+        lines.append(f"template: \"{template.name}\"")
+    lines.append("---")
+    header = "\n".join(lines)
+    return f"{header}\n\n{content.strip()}\n"
+
+
+def ensure_output_path(args: argparse.Namespace, slug: str) -> pathlib.Path:
+    if args.output:
+        return pathlib.Path(args.output)
+    DEFAULT_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    return DEFAULT_OUTPUT_DIR / f"{slug}.md"
+
+
+def cache_context(args: argparse.Namespace, normalization: str) -> Dict[str, str]:
+    """Prompt inputs that key the brief cache besides the transcript: only what the user gave explicitly.
+
+    Titles and dates inferred from the file name (or today's date) are left out, so a renamed or
+    undated transcript still hits the cache; the front matter is rebuilt from the current name.
+    """
+    return {
+        "title": args.meeting_title or "",
+        "date": args.meeting_date or "",
+        "stakeholders": args.stakeholders or "",
+        "normalization": normalization,
+    }
+
+
+def process_transcript(
+    transcript_path: pathlib.Path,
+    args: argparse.Namespace,
+    stats: Optional[Dict[str, Any]] = None,
+) -> pathlib.Path:
+    """Summarise one transcript and write its brief; `stats` receives stage timings and the brief source."""
+    stats = stats if stats is not None else {}
+    with telemetry.span("transcript", transcript=transcript_path.as_posix()) as span:
+        output_path = _process_transcript(transcript_path, args, stats)
+        if span is not None:
+            span.set("source", stats.get("source", ""))
+    return output_path
+
+
+def _process_transcript(
+    transcript_path: pathlib.Path,
+    args: argparse.Namespace,
+    stats: Dict[str, Any],
+) -> pathlib.Path:
+    started = time.perf_counter()
+    with telemetry.span("extract"), telemetry.profiled():
+        transcript = read_structured(transcript_path, args.extraction_cache)
+    normalization = "off"
+    if not args.no_normalize:
+        with telemetry.span("normalize"), telemetry.profiled():
+            transcript, report = normalize_structured(transcript, args.strip_timestamps)
+        normalization = NORMALIZATION_VERSION + ("-notimestamps" if args.strip_timestamps else "")
+        stats["bytes_in"], stats["bytes_sent"] = report["bytes_in"], report["bytes_out"]
+        saved = report["bytes_saved"] / report["bytes_in"] * 100 if report["bytes_in"] else 0.0
+        print(
+            f"[normalize] {transcript_path}: {report['bytes_in']:,} -> {report['bytes_out']:,} bytes ({saved:.1f}% saved; "
+            f"{report['filler_turns']} filler turns, {report['merged_turns']} merged, "
+            f"{report['duplicate_paragraphs']} duplicate paragraphs)"
+        )
+    metadata = infer_metadata(transcript_path, args.meeting_date, args.meeting_title)
+    slug = args.slug or slugify(transcript_path.stem)
+    base_path = ensure_output_path(args, slug)
+    context = cache_context(args, normalization)
+    transcript_text = transcript.text
+    briefs: List[Dict[str, Any]] = [
+        {
+            "template": template,
+            "output": template.output_path(base_path),
+            "key": cache_key(transcript_text, template.cache_version, context),
+            "agent_id": None,
+            "markdown": None,
+            "source": None,
+        }
+        for template in args.templates
+    ]
+    stats["extract_s"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for brief in briefs:
+        written = args.journal.written_brief(brief["key"]) if args.journal and not args.refresh else None
+        if written == brief["output"]:
+            brief["source"] = "journal"
+            print(f"[resume] {transcript_path}: brief already written to {brief['output']}")
+            continue
+        with telemetry.span("cache_lookup"):
+            cached = args.cache.get(brief["key"]) if args.cache and not args.refresh else None
+        if cached:
+            brief["agent_id"] = cached.get("agent_id")
+            brief["markdown"] = cached["markdown"]
+            brief["source"] = "cache"
+            print(f"[cache] {transcript_path}: reusing brief from agent {brief['agent_id']}")
+    pending = [brief for brief in briefs if brief["source"] is None]
+    if pending:
+        summarize_templates(pending, transcript, metadata, transcript_path, args)
+    stats["agent_s"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for brief in briefs:
+        if brief["source"] == "journal":
+            if args.manifest and brief is briefs[0]:
+                args.manifest.record(transcript_path, brief["output"])
+            continue
+        output_path = brief["output"]
+        markdown = brief["markdown"]
+        template = brief["template"]
+        with telemetry.span("write", template=template.name), telemetry.profiled():
+            if not markdown:
+                markdown = heuristic_fallback(transcript, metadata, template)
+            write_atomic(output_path, build_output(markdown, metadata, transcript_path, brief["agent_id"], template))
+        # Fallback briefs are not recorded so the next run retries the agent.
+        if brief["source"] != "fallback" and args.journal:
+            args.journal.record_brief(brief["key"], transcript_path, output_path)
+        if brief["source"] != "fallback" and args.manifest and brief is briefs[0]:
+            args.manifest.record(transcript_path, output_path)
+    sources = [brief["source"] for brief in briefs]
+    stats["source"] = sources[0] if len(set(sources)) == 1 else "mixed"
+    stats["outputs"] = [brief["output"] for brief in briefs if brief["source"] != "journal"]
+    stats["skipped"] = [brief["output"] for brief in briefs if brief["source"] == "journal"]
+    stats["write_s"] = time.perf_counter() - started
+    return briefs[0]["output"]
+
+
+def summarize_templates(
+    briefs: List[Dict[str, Any]],
+    transcript: Transcript,
+    metadata: Dict[str, str],
+    transcript_path: pathlib.Path,
+    args: argparse.Namespace,
+) -> None:
+    """Run one agent per template concurrently, sharing the chunk summaries of a long transcript."""
+    transcript_text = transcript.text
+    partials: Optional[List[str]] = None
+    if not args.no_chunking and len(transcript_text) > args.chunk_chars:
+        with telemetry.span("chunk"), telemetry.profiled():
+            chunks = split_transcript(transcript, args.chunk_chars, args.chunk_overlap)
+        print(f"[chunk] {transcript_path}: summarising {len(chunks)} parts")
+        try:
+            partials = summarize_chunks(chunks, metadata, args)
+        except CursorApiError as exc:
+            print(f"[warn] {transcript_path}: {exc}", file=sys.stderr)
+            for brief in briefs:
+                brief["source"] = "fallback"
+            return
+
+    def summarize(brief: Dict[str, Any]) -> None:
+        template: PromptTemplate = brief["template"]
+        output_path: pathlib.Path = brief["output"]
+        with telemetry.span("build_prompt", template=template.name), telemetry.profiled():
+            if partials is not None:
+                prompt = build_reduce_prompt(metadata, args.stakeholders, partials, template)
+            else:
+                prompt = template.render(metadata, args.stakeholders, transcript_text)
+        try:
+            brief["agent_id"], brief["markdown"] = run_agent(
+                prompt, args, output_path.with_name(output_path.name + ".partial")
+            )
+        except CursorApiError as exc:
+            label = "" if len(briefs) == 1 else f" ({template.name})"
+            print(f"[warn] {transcript_path}{label}: {exc}", file=sys.stderr)
+        if brief["markdown"] and args.cache:
+            args.cache.put(brief["key"], brief["markdown"], brief["agent_id"], metadata)
+        brief["source"] = "agent" if brief["markdown"] else "fallback"
+
+    if len(briefs) == 1:
+        summarize(briefs[0])
+        return
+    workers = min(args.max_concurrency, len(briefs))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="template-agent") as pool:
+        list(pool.map(summarize, briefs))
+
+
+def process_batch(
+    transcripts: List[pathlib.Path], args: argparse.Namespace
+) -> Iterator[Dict[str, Any]]:
+    """Process transcripts on a bounded pool, yielding one result record per transcript as it finishes."""
+    if not transcripts:
+        return
+
+    def work(path: pathlib.Path) -> Dict[str, Any]:
+        record: Dict[str, Any] = {"transcript": path, "output": None, "error": None}
+        started = time.perf_counter()
+        try:
+            record["output"] = process_transcript(path, args, record)
+        except Exception as exc:  # keep the rest of the batch going
+            record["error"] = exc
+        record["total_s"] = time.perf_counter() - started
+        return record
+
+    workers = min(args.max_concurrency, len(transcripts))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="meeting-agent") as pool:
+        futures = [pool.submit(work, path) for path in transcripts]
+        try:
+            for future in as_completed(futures):
+                yield future.result()
+        except BaseException:
+            # Cancelled: do not start the transcripts that are still queued.
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Single-process meeting pipeline for GitHub Actions.
+
+Given the base/head SHAs of a push, discovers transcripts that still need a
+brief, extracts them, dispatches their agents concurrently through one shared
+HTTP client, writes the briefs and the manifest, and prints a summary report.
+Per-stage timings are appended to `$GITHUB_STEP_SUMMARY` and `found=true|false`
+is written to `$GITHUB_OUTPUT` for the workflow's commit/upload steps.
+
+With `--checkpoint-commits` finished briefs (and the manifest) are committed
+and pushed every `--checkpoint-files` briefs or `--checkpoint-seconds` seconds
+while the batch runs, and once more at the end, even when the run fails or is
+cancelled (see `brief_outputs.py`). Only that last checkpoint, once the batch
+has drained, rebases onto a branch that moved in the meantime.
+
+    python scripts/meeting_pipeline.py "$BEFORE_SHA" "$HEAD_SHA" --max-concurrency 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import pathlib
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+import list_changed_transcripts as discovery
+import telemetry
+from agent_cli import add_agent_arguments, configure_agent_args
+from agent_runs import cancellable, install_shared_client
+from brief_outputs import DEFAULT_EVERY_FILES, DEFAULT_EVERY_SECONDS, DEFAULT_PUSH_ATTEMPTS, CheckpointCommitter
+from meeting_briefs import process_batch
+from transcript_manifest import DEFAULT_MANIFEST_PATH
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Discover changed transcripts and generate their meeting briefs in one process."
+    )
+    parser.add_argument("base", help="Base commit SHA (can be all zeros for initial push).")
+    parser.add_argument("head", help="Head commit SHA.")
+    parser.add_argument(
+        "--roots",
+        nargs="*",
+        default=["meeting-notes", "docs/meeting-notes", "transcripts", "meeting_transcripts"],
+        help="Directory prefixes to scan for transcript files.",
+    )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Ignore the manifest and process every changed transcript.",
+    )
+    parser.add_argument(
+        "--checkpoint-commits",
+        action="store_true",
+        help="Commit and push finished briefs periodically while the batch runs instead of leaving it to the workflow.",
+    )
+    parser.add_argument(
+        "--checkpoint-files",
+        type=int,
+        default=DEFAULT_EVERY_FILES,
+        help=f"Commit once this many briefs are waiting (default: {DEFAULT_EVERY_FILES}).",
+    )
+    parser.add_argument(
+        "--checkpoint-seconds",
+        type=float,
+        default=DEFAULT_EVERY_SECONDS,
+        help=f"Commit waiting briefs at least this often (default: {DEFAULT_EVERY_SECONDS:.0f}s).",
+    )
+    parser.add_argument(
+        "--push-attempts",
+        type=int,
+        default=DEFAULT_PUSH_ATTEMPTS,
+        help=f"Push attempts per checkpoint, rebasing between them (default: {DEFAULT_PUSH_ATTEMPTS}).",
+    )
+    add_agent_arguments(parser)
+    parser.set_defaults(manifest=str(DEFAULT_MANIFEST_PATH))
+    args = parser.parse_args()
+    if args.checkpoint_files < 1 or args.checkpoint_seconds <= 0 or args.push_attempts < 1:
+        parser.error("--checkpoint-files and --push-attempts must be at least 1 and --checkpoint-seconds positive")
+    # Per-transcript overrides are not meaningful for a whole push.
+    args.output = args.slug = args.meeting_title = args.meeting_date = None
+    configure_agent_args(parser, args)
+    return args
+
+
+def discover(args: argparse.Namespace) -> List[pathlib.Path]:
+    files = discovery.changed_files(args.base, args.head)
+    filtered = discovery.filter_transcripts(files, args.roots)
+    if not args.all and args.manifest:
+        filtered = discovery.unsummarised(args.head, filtered, args.manifest.known_blobs())
+    return [pathlib.Path(path) for path in filtered]
+
+
+def write_github_output(name: str, value: str) -> None:
+    target = os.getenv("GITHUB_OUTPUT")
+    if target:
+        with open(target, "a", encoding="utf-8") as handle:
+            handle.write(f"{name}={value}\n")
+
+
+def format_report(stages: Dict[str, float], records: List[Dict[str, Any]]) -> str:
+    lines = ["## Meeting brief pipeline", "", "| Stage | Seconds |", "| --- | ---: |"]
+    lines.extend(f"| {name} | {seconds:.2f} |" for name, seconds in stages.items())
+    if records:
+        lines.extend(
+            [
+                "",
+                "| Transcript | Brief | Source | Bytes in | Bytes sent | Extract s | Agent s | Write s |",
+                "| --- | --- | --- | ---: | ---: | ---: | ---: | ---: |",
+            ]
+        )
+        for record in sorted(records, key=lambda item: str(item["transcript"])):
+            source = f"error: {record['error']}" if record["error"] is not None else record.get("source", "")
+            sizes = " | ".join(f"{record[key]:,}" if key in record else "-" for key in ("bytes_in", "bytes_sent"))
+            lines.append(
+                f"| `{record['transcript']}` | `{record['output'] or '-'}` | {source} | {sizes} "
+                f"| {record.get('extract_s', 0):.2f} | {record.get('agent_s', 0):.2f} | {record.get('write_s', 0):.2f} |"
+            )
+    return "\n".join(lines) + "\n"
+
+
+def main() -> None:
+    args = parse_args()
+    started = time.perf_counter()
+    stages: Dict[str, float] = {}
+
+    try:
+        with telemetry.span("discovery"):
+            transcripts = discover(args)
+    except subprocess.CalledProcessError as exc:
+        sys.stderr.write(exc.stderr)
+        sys.exit(exc.returncode)
+    stages["discovery"] = time.perf_counter() - started
+    write_github_output("found", "true" if transcripts else "false")
+    print(f"Found {len(transcripts)} transcript(s) to summarise.")
+
+    records: List[Dict[str, Any]] = []
+    committer: Optional[CheckpointCommitter] = None
+    if args.checkpoint_commits:
+        committer = CheckpointCommitter(
+            args.checkpoint_files,
+            args.checkpoint_seconds,
+            push_attempts=args.push_attempts,
+            extra_paths=[args.manifest.path] if args.manifest else [],
+        )
+    pushed = drained = True
+    install_shared_client(args)
+    dispatch_started = time.perf_counter()
+    try:
+        with cancellable(args):
+            drained = False
+            for record in process_batch(transcripts, args):
+                records.append(record)
+                if record["error"] is not None:
+                    print(f"[error] {record['transcript']}: {record['error']}", file=sys.stderr)
+                    continue
+                for output_path in record["outputs"]:
+                    print(f"Wrote meeting brief to {output_path} ({record['source']})")
+                for output_path in record["skipped"]:
+                    print(f"Skipped meeting brief {output_path} (already written)")
+                if committer:
+                    # An interrupted run may have written a skipped brief without committing it.
+                    committer.add(record["outputs"] + record["skipped"])
+            drained = True
+    finally:
+        if committer:
+            # A cancelled batch may still have workers finishing a brief; the workflow's commit step rebases then.
+            with telemetry.span("checkpoint"):
+                pushed = committer.checkpoint(drained=drained)
+        if args.cache:
+            args.cache.prune()
+        if args.extraction_cache:
+            args.extraction_cache.prune()
+        telemetry.flush()
+    stages["dispatch (wall)"] = time.perf_counter() - dispatch_started
+    for key, label in (("extract_s", "extraction (sum)"), ("agent_s", "agent (sum)"), ("write_s", "writing (sum)")):
+        stages[label] = sum(record.get(key, 0.0) for record in records)
+    if committer:
+        stages["checkpoint commits"] = committer.seconds
+    stages["total"] = time.perf_counter() - started
+
+    report = format_report(stages, records)
+    print(report)
+    summary_path = os.getenv("GITHUB_STEP_SUMMARY")
+    if summary_path:
+        with open(summary_path, "a", encoding="utf-8") as handle:
+            handle.write(report)
+    if not pushed:
+        print("[error] checkpoint commits could not be pushed; they are still in the local clone.", file=sys.stderr)
+    if not pushed or any(record["error"] is not None for record in records):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Shrink extracted transcripts before they are sent to an agent.
+
+Gemini/Meet exports carry a lot of bytes the agent does not need: non-breaking
+space padding, markdown timestamp anchors, runs of "Okay."/"Yeah." turns,
+paragraphs repeated between the notes and transcript sections, and several
+speaker turns run together in one docx paragraph. `normalize_transcript`:
+
+* collapses whitespace and blank-line runs;
+* rewrites timestamp anchors (`([00:17:59](#00:17:59))`, `### 00:07:38 {#00:07:38}`)
+  to plain `00:17:59`, or drops them with `strip_timestamps=True`;
+* puts each speaker turn on its own line, drops turns that are only
+  backchannel and, inside turns, backchannel-only sentences ("Okay. Okay.",
+  "Got it.") and hesitations ("um", "uh"); short answers such as "Yes.",
+  "No." or "Right." carry meaning and are kept;
+* merges consecutive turns by the same speaker;
+* drops repeated paragraphs (by hash of their case-folded text).
+
+`normalize_structured` walks the turns of the reader's `Transcript` (see
+`transcript_ingest.model`) rather than re-splitting the text, and indexes the
+lines it emits into the normalised `Transcript` that chunking and the offline
+summary use. `normalize_transcript` is the same on plain strings. Both return
+a report of what was removed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from typing import Dict, List, Optional, Tuple, Union
+
+from transcript_ingest.model import Transcript, TranscriptBuilder
+
+# Bump when the output of normalize_transcript changes so cached briefs are not reused.
+NORMALIZATION_VERSION = "3"
+MIN_DEDUPE_CHARS = 40
+
+# Backchannel and hesitation tokens only: a turn made of them carries no content.
+FILLER_WORDS = frozenset(
+    """
+    yeah yep yup okay ok oh um uh uhm hmm mhm mm mm-hmm uh-huh alright cool great perfect thanks bye hi hello hey
+    """.split()
+)
+FILLER_PHRASE = re.compile(r"\b(?:got it|thank you|sounds good|all right)\b")
+
+TIMESTAMP_LINK = re.compile(r"\(?\[(\d{1,2}:\d{2}(?::\d{2})?)\]\(#[^)]*\)\)?")
+TIMESTAMP_ANCHOR = re.compile(r"\s*\{#[\d:]+\}")
+TIMESTAMP_LINE = re.compile(r"^(?:#+\s*)?\[?\d{1,2}:\d{2}(?::\d{2})?\]?$")
+INLINE_TIMESTAMP = re.compile(r"\s*\(?\[?\b\d{1,2}:\d{2}:\d{2}\b\]?\)?")
+WORD = re.compile(r"[\w'\-]+")
+SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+HESITATION = re.compile(r"\b(?:um+|uh+|uhm|erm|hmm+|mhm)\b,?\s*", re.IGNORECASE)
+
+
+def _is_filler(body: str) -> bool:
+    words = WORD.findall(body.lower())
+    if not words:
+        return False
+    words = FILLER_PHRASE.sub(" ", " ".join(words)).split()
+    return all(word in FILLER_WORDS for word in words)
+
+
+def _strip_filler(body: str, report: Dict[str, int]) -> str:
+    sentences = SENTENCE_END.split(body)
+    kept = []
+    for sentence in sentences:
+        if _is_filler(sentence):
+            continue
+        sentence = HESITATION.sub("", sentence).strip()
+        if sentence:
+            kept.append(sentence[:1].upper() + sentence[1:])
+    if kept:
+        report["filler_sentences"] += len(sentences) - len(kept)
+    return " ".join(kept)
+
+
+def _tidy(line: str) -> str:
+    line = " ".join(line.split())
+    line = TIMESTAMP_LINK.sub(r"(\1)", line)
+    return TIMESTAMP_ANCHOR.sub("", line)
+
+
+def _clean(line: str, strip_timestamps: bool, report: Dict[str, int]) -> str:
+    line = _tidy(line)
+    if strip_timestamps:
+        line, removed = INLINE_TIMESTAMP.subn("", line)
+        report["timestamps_removed"] += removed
+    return line.strip()
+
+
+class _Writer:
+    """Collects normalised lines: merging, paragraph breaks and de-duplication."""
+
+    def __init__(self, strip_timestamps: bool, report: Dict[str, int]) -> None:
+        self.strip_timestamps = strip_timestamps
+        self.report = report
+        self.output: List[str] = []
+        self.seen: set = set()
+        self.speaker: Optional[str] = None
+
+    def line(self, raw: str) -> None:
+        """A line that is not a speaker turn (notes, headings, timestamps) or a blank line."""
+        if self.strip_timestamps and TIMESTAMP_LINE.match(_tidy(raw)):
+            self.report["timestamps_removed"] += 1
+            return
+        line = _clean(raw, self.strip_timestamps, self.report)
+        if not line:
+            if self.output and self.output[-1]:
+                self.output.append("")
+            return
+        self.speaker = None
+        self._append(line)
+
+    def turn(self, speaker: str, prefix: str, body: str) -> None:
+        body = _strip_filler(_clean(body, self.strip_timestamps, self.report), self.report)
+        if not body:
+            self.report["filler_turns"] += 1
+            return
+        if speaker == self.speaker and self.output and self.output[-1]:
+            self.output[-1] = f"{self.output[-1]} {body}"
+            self.report["merged_turns"] += 1
+            return
+        self.speaker = speaker
+        self._append(f"{_clean(prefix, self.strip_timestamps, self.report)} {body}".lstrip())
+
+    def _append(self, line: str) -> None:
+        if len(line) >= MIN_DEDUPE_CHARS:
+            digest = hashlib.blake2b(line.casefold().encode("utf-8"), digest_size=16).digest()
+            if digest in self.seen:
+                self.report["duplicate_paragraphs"] += 1
+                return
+            self.seen.add(digest)
+        self.output.append(line)
+
+
+def normalize_structured(transcript: Transcript, strip_timestamps: bool = False) -> Tuple[Transcript, Dict[str, int]]:
+    text = transcript.text
+    report = {
+        "bytes_in": len(text.encode("utf-8")),
+        "filler_turns": 0,
+        "filler_sentences": 0,
+        "merged_turns": 0,
+        "duplicate_paragraphs": 0,
+        "timestamps_removed": 0,
+    }
+    if "\r" in text:
+        transcript = Transcript.from_text(text.replace("\r\n", "\n").replace("\r", "\n"))
+        text = transcript.text
+    writer = _Writer(strip_timestamps, report)
+
+    def skipped(start: int, end: int) -> None:
+        # Text between two turns: the rest of the previous turn's line, whole lines the
+        # model does not index (blank and timestamp-only lines), and the current line's indent.
+        segments = text[start:end].split("\n")
+        for number, raw in enumerate(segments):
+            whole = (number > 0 or start == 0) and (number < len(segments) - 1 or end == len(text))
+            if whole or raw.strip():
+                writer.line(raw)
+
+    position = 0
+    speakers = transcript.speakers
+    for start, body_start, end, speaker_id in zip(
+        transcript.starts, transcript.body_starts, transcript.ends, transcript.speaker_ids
+    ):
+        skipped(position, start)
+        if speaker_id < 0:
+            writer.line(text[start:end])
+        else:
+            writer.turn(speakers[speaker_id], text[start:body_start], text[body_start:end])
+        position = end
+    skipped(position, len(text))
+
+    output = writer.output
+    while output and not output[-1]:
+        output.pop()
+    if output:
+        builder = TranscriptBuilder()
+        for line in output:
+            builder.add_line(line)
+        normalized = builder.build()
+    else:
+        # Nothing but pleasantries: send what we were given rather than an empty prompt.
+        normalized = Transcript.from_text(text.strip())
+    report["bytes_out"] = len(normalized.text.encode("utf-8"))
+    report["bytes_saved"] = report["bytes_in"] - report["bytes_out"]
+    return normalized, report
+
+
+def normalize_transcript(text: Union[str, Transcript], strip_timestamps: bool = False) -> Tuple[str, Dict[str, int]]:
+    transcript = text if isinstance(text, Transcript) else Transcript.from_text(text)
+    normalized, report = normalize_structured(transcript, strip_timestamps)
+    return normalized.text, report
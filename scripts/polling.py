@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Polling policies used by `wait_for_agent` between `GET /agents/{id}` calls.
+
+* `fixed`    – the historical behaviour: one request every `interval` seconds.
+* `backoff`  – start fast, grow the delay geometrically up to a cap, with
+               random jitter so concurrent waits do not poll in lock-step.
+* `adaptive` – learns how long agents usually take from a small JSON history
+               file. It stays quiet until the earliest typical completion,
+               polls densely through the usual completion window and backs off
+               once an agent runs longer than usual.
+
+Policies are shared between worker threads, so `next_delay` must not keep
+per-agent state; everything it needs is passed in.
+"""
+
+from __future__ import annotations
+
+import abc
+import json
+import pathlib
+import random
+import threading
+from typing import List, Optional
+
+from atomic_write import write_atomic
+
+DEFAULT_HISTORY_PATH = pathlib.Path(".cache/agent-durations.json")
+HISTORY_LIMIT = 50
+MIN_ADAPTIVE_SAMPLES = 3
+
+
+class PollPolicy(abc.ABC):
+    name = "base"
+
+    @abc.abstractmethod
+    def next_delay(self, attempt: int, elapsed: float) -> float:
+        """Seconds to sleep after poll number `attempt` (0-based), `elapsed` seconds into the wait."""
+
+    def record_completion(self, duration: float) -> None:
+        """Called once an agent reaches a terminal status after `duration` seconds."""
+
+
+class FixedPolicy(PollPolicy):
+    name = "fixed"
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+
+    def next_delay(self, attempt: int, elapsed: float) -> float:
+        return self.interval
+
+
+class BackoffPolicy(PollPolicy):
+    name = "backoff"
+
+    def __init__(
+        self,
+        initial: float = 1.0,
+        maximum: float = 30.0,
+        factor: float = 1.5,
+        jitter: float = 0.2,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        self.initial = initial
+        self.maximum = maximum
+        self.factor = factor
+        self.jitter = jitter
+        self._rng = rng or random.Random()
+
+    def _jittered(self, delay: float) -> float:
+        if not self.jitter:
+            return delay
+        return max(0.0, delay * self._rng.uniform(1 - self.jitter, 1 + self.jitter))
+
+    def next_delay(self, attempt: int, elapsed: float) -> float:
+        delay = min(self.maximum, self.initial * (self.factor ** attempt))
+        return self._jittered(delay)
+
+
+class AdaptivePolicy(BackoffPolicy):
+    name = "adaptive"
+
+    def __init__(
+        self,
+        history_path: pathlib.Path = DEFAULT_HISTORY_PATH,
+        initial: float = 1.0,
+        maximum: float = 30.0,
+        factor: float = 1.5,
+        jitter: float = 0.2,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        super().__init__(initial, maximum, factor, jitter, rng)
+        self.history_path = history_path
+        self._lock = threading.Lock()
+        self._durations = self._load()
+
+    def _load(self) -> List[float]:
+        try:
+            data = json.loads(self.history_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return []
+        return [float(value) for value in data.get("durations", []) if isinstance(value, (int, float))]
+
+    def _quantile(self, samples: List[float], q: float) -> float:
+        index = min(len(samples) - 1, max(0, int(round(q * (len(samples) - 1)))))
+        return samples[index]
+
+    def next_delay(self, attempt: int, elapsed: float) -> float:
+        with self._lock:
+            samples = sorted(self._durations)
+        if len(samples) < MIN_ADAPTIVE_SAMPLES:
+            return super().next_delay(attempt, elapsed)
+        early = self._quantile(samples, 0.1)
+        late = self._quantile(samples, 0.9)
+        if elapsed < early:
+            # Nothing usually finishes this soon: sleep until the window opens.
+            return min(self.maximum, early - elapsed)
+        if elapsed <= late:
+            return self._jittered(self.initial)
+        # Running longer than usual: back off relative to the overrun.
+        overrun_steps = int((elapsed - late) // max(self.initial, 1e-3))
+        return super().next_delay(overrun_steps, elapsed)
+
+    def record_completion(self, duration: float) -> None:
+        with self._lock:
+            self._durations = (self._durations + [round(duration, 3)])[-HISTORY_LIMIT:]
+            payload = {"durations": self._durations}
+            try:
+                write_atomic(self.history_path, json.dumps(payload))
+            except OSError:
+                pass
+
+
+POLICY_NAMES = ("fixed", "backoff", "adaptive")
+
+
+def build_policy(
+    name: str,
+    interval: float,
+    min_interval: float,
+    max_interval: float,
+    history_path: Optional[pathlib.Path] = None,
+) -> PollPolicy:
+    if name == "fixed":
+        return FixedPolicy(interval)
+    if name == "backoff":
+        return BackoffPolicy(initial=min_interval, maximum=max_interval)
+    if name == "adaptive":
+        return AdaptivePolicy(history_path or DEFAULT_HISTORY_PATH, initial=min_interval, maximum=max_interval)
+    raise ValueError(f"Unknown poll policy: {name}")
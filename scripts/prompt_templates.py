@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Registry of brief templates for the meeting runner (`--templates a,b,c`).
+
+The `architecture` template is the runner's built-in prompt (`build_prompt`).
+Further templates are spec files in `docs/templates/*.md`, written like
+`docs/meeting-agent.md`; the file stem is the template name:
+
+    # Executive Summary Specification
+
+    ## Purpose
+    - One page for sponsors who were not in the meeting.
+
+    ## Prompt Blueprint
+    - Lead with the outcome and the decisions taken.
+    - ...
+
+    ## Sections
+    - Outcome
+    - Decisions
+    - Asks of Leadership
+
+    ## Output
+    - role: a delivery director writing for executive sponsors
+    - suffix: exec-summary
+    - version: 1
+
+Purpose and Prompt Blueprint bullets become the prompt's requirements,
+Sections become the required headings, and the brief is written next to the
+architecture brief as `<slug>.<suffix>.md`. Bump `version` when a spec
+changes so cached briefs for the old wording are not reused.
+"""
+
+from __future__ import annotations
+
+import pathlib
+import re
+import textwrap
+from typing import Callable, Dict, List, Optional
+
+DEFAULT_TEMPLATE = "architecture"
+DEFAULT_TEMPLATE_DIR = pathlib.Path(__file__).resolve().parents[1] / "docs" / "templates"
+DEFAULT_ROLE = "a principal solutions architect"
+
+HEADING = re.compile(r"^(?P<level>#{1,3})\s+(?P<title>.+?)\s*$")
+BULLET = re.compile(r"^\s*(?:[-*+]|\d+[.)])\s+(?P<text>.+?)\s*$")
+OPTION = re.compile(r"^(?P<key>[a-z_]+)\s*:\s*(?P<value>.+)$")
+NAME = re.compile(r"^[a-z0-9][a-z0-9_-]*$")
+
+PromptBuilder = Callable[[Dict[str, str], Optional[str], str], str]
+
+
+class PromptTemplate:
+    def __init__(
+        self,
+        name: str,
+        title: str,
+        version: str,
+        suffix: Optional[str],
+        sections: List[str],
+        render: PromptBuilder,
+    ) -> None:
+        self.name = name
+        self.title = title
+        self.version = version
+        self.suffix = suffix
+        self.sections = sections
+        self.render = render
+
+    @property
+    def cache_version(self) -> str:
+        """Part of the brief cache key, so each template's briefs are cached separately."""
+        return self.version if self.name == DEFAULT_TEMPLATE else f"{self.name}-{self.version}"
+
+    def output_path(self, base: pathlib.Path) -> pathlib.Path:
+        """`meeting_outputs/<slug>.md` for the default template, `<slug>.<suffix>.md` otherwise."""
+        return base if not self.suffix else base.with_name(f"{base.stem}.{self.suffix}{base.suffix}")
+
+
+def parse_spec(path: pathlib.Path) -> PromptTemplate:
+    """Build a template from a `docs/meeting-agent.md`-style spec file."""
+    name = path.stem
+    if not NAME.match(name):
+        raise ValueError(f"{path}: template names must be lower-case letters, digits, '-' or '_'")
+    title = name.replace("-", " ").replace("_", " ").title()
+    bullets: Dict[str, List[str]] = {}
+    section = ""
+    for line in path.read_text(encoding="utf-8").splitlines():
+        heading = HEADING.match(line)
+        if heading:
+            if len(heading.group("level")) == 1:
+                title = re.sub(r"\s+Specification$", "", heading.group("title"), flags=re.IGNORECASE)
+            else:
+                section = heading.group("title").strip().lower()
+            continue
+        bullet = BULLET.match(line)
+        if bullet and section:
+            bullets.setdefault(section, []).append(bullet.group("text"))
+
+    options: Dict[str, str] = {}
+    for item in bullets.get("output", []):
+        match = OPTION.match(item)
+        if match:
+            options[match.group("key")] = match.group("value").strip().strip("`\"'")
+    sections = bullets.get("sections", [])
+    requirements = bullets.get("purpose", []) + bullets.get("prompt blueprint", [])
+    if not sections or not requirements:
+        raise ValueError(f"{path}: a template needs 'Sections' and 'Purpose' or 'Prompt Blueprint' bullets")
+    role = options.get("role", DEFAULT_ROLE)
+    suffix = options.get("suffix", name)
+    if not NAME.match(suffix):
+        raise ValueError(f"{path}: invalid output suffix {suffix!r}")
+
+    def render(metadata: Dict[str, str], stakeholders: Optional[str], transcript: str) -> str:
+        lines = "\n".join(f"- {item}" for item in requirements)
+        header = textwrap.dedent(
+            f"""
+            You are {role}. Analyse the following meeting transcript and produce a
+            single markdown document: {title}.
+
+            Meeting title: {metadata['title']}
+            Meeting date: {metadata['date']}
+            Stakeholders: {stakeholders or 'Not specified'}
+
+            Requirements:
+            """
+        ).strip()
+        return (
+            f"{header}\n{lines}\n"
+            f"- Include sections: {', '.join(sections)}.\n"
+            "- Respond with the full markdown document in a single message. "
+            "Do not reference separate files or attachments.\n\n"
+            f"Transcript:\n---\n{transcript}\n---"
+        )
+
+    return PromptTemplate(name, title, options.get("version", "1"), suffix, sections, render)
+
+
+def load_templates(default: PromptTemplate, directory: Optional[pathlib.Path] = None) -> Dict[str, PromptTemplate]:
+    """`default` plus every spec in `directory` (`docs/templates/` by default)."""
+    templates = {default.name: default}
+    directory = directory or DEFAULT_TEMPLATE_DIR
+    if directory.is_dir():
+        for path in sorted(directory.glob("*.md")):
+            template = parse_spec(path)
+            if template.name in templates:
+                raise ValueError(f"{path}: template {template.name!r} is already defined")
+            templates[template.name] = template
+    suffixes = [template.suffix for template in templates.values()]
+    if len(set(suffixes)) != len(suffixes):
+        raise ValueError("template output suffixes must be unique")
+    return templates
+
+
+def select_templates(templates: Dict[str, PromptTemplate], names: str) -> List[PromptTemplate]:
+    selected: List[PromptTemplate] = []
+    for name in (item.strip() for item in names.split(",")):
+        if not name or any(template.name == name for template in selected):
+            continue
+        if name not in templates:
+            raise ValueError(f"unknown template {name!r} (available: {', '.join(sorted(templates))})")
+        selected.append(templates[name])
+    if not selected:
+        raise ValueError("--templates needs at least one template name")
+    return selected
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Client-side request budgets and circuit breaking for the Cursor API client.
+
+`RequestBudget` keeps one token bucket per request kind (`launch` for
+`POST /agents`, `poll` for status and conversation reads) shared by every
+worker thread, so a batch run paces itself instead of bursting into 429s.
+Callers reserve a token and wait for their turn themselves, so the wait can be
+cut short by their deadline or a cancellation; a 429's `Retry-After` is
+applied to the whole bucket so all threads back off together.
+
+`CircuitBreaker` opens after `failure_threshold` consecutive server errors or
+network failures and fails requests fast for `reset_after` seconds, then lets
+a single trial request through before closing again. A trial that ends
+without an outcome (cancelled, out of time) hands its slot back with
+`release_trial`, so the next request can try instead.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+DEFAULT_LAUNCH_RATE = 2.0
+DEFAULT_LAUNCH_BURST = 4
+DEFAULT_POLL_RATE = 10.0
+DEFAULT_POLL_BURST = 20
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RESET_AFTER = 30.0
+
+
+class TokenBucket:
+    """Thread-safe token bucket; `rate` tokens per second up to `burst`."""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be positive and burst at least 1")
+        self.rate = rate
+        self.burst = float(burst)
+        self._clock = clock
+        self._tokens = self.burst
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill_locked(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Take a token, possibly on credit, and return how long to wait before using it."""
+        with self._lock:
+            self._refill_locked()
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def defer(self, seconds: float) -> None:
+        """Hold back the next token for at least `seconds` (e.g. a 429's Retry-After)."""
+        with self._lock:
+            self._refill_locked()
+            self._tokens = min(self._tokens, -seconds * self.rate)
+
+
+class RequestBudget:
+    """Token buckets per request kind; a kind without a bucket is unlimited."""
+
+    def __init__(self, buckets: Dict[str, TokenBucket]) -> None:
+        self.buckets = buckets
+
+    @classmethod
+    def build(
+        cls,
+        launch_rate: float = DEFAULT_LAUNCH_RATE,
+        poll_rate: float = DEFAULT_POLL_RATE,
+        launch_burst: float = DEFAULT_LAUNCH_BURST,
+        poll_burst: float = DEFAULT_POLL_BURST,
+    ) -> "RequestBudget":
+        buckets = {}
+        if launch_rate > 0:
+            buckets["launch"] = TokenBucket(launch_rate, launch_burst)
+        if poll_rate > 0:
+            buckets["poll"] = TokenBucket(poll_rate, poll_burst)
+        return cls(buckets)
+
+    def reserve(self, kind: str) -> float:
+        """Take a `kind` token without sleeping; returns how long the caller must wait before using it."""
+        bucket = self.buckets.get(kind)
+        return bucket.reserve() if bucket else 0.0
+
+    def defer(self, kind: str, seconds: float) -> bool:
+        """Apply a server-requested delay to `kind`'s bucket; False if it is unlimited."""
+        bucket = self.buckets.get(kind)
+        if bucket:
+            bucket.defer(seconds)
+        return bucket is not None
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_after: float = DEFAULT_RESET_AFTER,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_after = reset_after
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial = 0  # id of the half-open trial in flight, 0 if none
+        self._trials = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            return "half-open" if self._clock() - self._opened_at >= self.reset_after else "open"
+
+    def allow(self) -> Optional[float]:
+        """Without taking a trial slot: None if a request could go ahead now, else the seconds to wait."""
+        with self._lock:
+            if self._opened_at is None:
+                return None
+            remaining = self.reset_after - (self._clock() - self._opened_at)
+            if remaining > 0 or self._trial:
+                return max(remaining, 0.0)
+            return None
+
+    def admit(self) -> Tuple[Optional[float], int]:
+        """Like `allow`, but a request let through a half-open circuit takes the trial slot (id returned, 0 if none)."""
+        with self._lock:
+            if self._opened_at is None:
+                return None, 0
+            remaining = self.reset_after - (self._clock() - self._opened_at)
+            if remaining > 0 or self._trial:
+                return max(remaining, 0.0), 0
+            self._trials += 1
+            self._trial = self._trials
+            return None, self._trial
+
+    def release_trial(self, trial: int) -> None:
+        """Free trial slot `trial` if no success or failure was recorded for it."""
+        with self._lock:
+            if trial and self._trial == trial:
+                self._trial = 0
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial = 0
+
+    def record_failure(self) -> bool:
+        """Count a failure; return True if this opened (or re-opened) the circuit."""
+        with self._lock:
+            self._failures += 1
+            if self._trial or (self._opened_at is None and self._failures >= self.failure_threshold):
+                self._opened_at = self._clock()
+                self._trial = 0
+                return True
+            return False
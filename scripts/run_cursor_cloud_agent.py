@@ -19,12 +19,13 @@ import sys
 import textwrap
 import urllib.error
 import urllib.request
-import xml.etree.ElementTree as ET
-import zipfile
 from typing import Optional
 
-
-NAMESPACE = {"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"}
+from atomic_write import write_atomic
+from extractive_summary import extractive_brief
+from normalization import normalize_transcript
+from transcript_ingest import ExtractionCache, read_structured
+from transcript_ingest.cache import DEFAULT_CACHE_DIR as DEFAULT_EXTRACTION_CACHE_DIR
 
 
 def parse_args() -> argparse.Namespace:
@@ -36,41 +37,41 @@ def parse_args() -> argparse.Namespace:
         default="Provide an architecture-focused summary of the key technical decisions, rationale, and open issues.",
         help="Instruction that gets passed alongside the transcript.",
     )
-    return parser.parse_args()
-
-
-def extract_text(path: pathlib.Path) -> str:
-    suffix = path.suffix.lower()
-    if suffix == ".docx":
-        return extract_docx_text(path)
-    if suffix in {".md", ".txt"}:
-        return path.read_text(encoding="utf-8")
-    if suffix == ".gdoc":
-        data = json.loads(path.read_text(encoding="utf-8"))
-        url = data.get("url", "https://docs.google.com/")
-        message = (
-            "Google .gdoc files are pointers and do not include the transcript text. "
-            "Export the document as Markdown or DOCX and commit that file instead.\n\n"
-            f"Referenced document: {url}"
-        )
-        return message
-    # Fall back to binary-safe read and decode errors.
-    return path.read_text(encoding="utf-8", errors="ignore")
-
-
-def extract_docx_text(path: pathlib.Path) -> str:
-    with zipfile.ZipFile(path) as archive:
-        xml_data = archive.read("word/document.xml")
-    root = ET.fromstring(xml_data)
-    paragraphs = []
-    for para in root.findall(".//w:p", NAMESPACE):
-        texts = []
-        for node in para.findall(".//w:t", NAMESPACE):
-            if node.text:
-                texts.append(node.text)
-        if texts:
-            paragraphs.append("".join(texts))
-    return "\n".join(paragraphs)
+    parser.add_argument(
+        "--no-normalize",
+        action="store_true",
+        help="Send the extracted transcript verbatim instead of normalising it.",
+    )
+    parser.add_argument(
+        "--strip-timestamps",
+        action="store_true",
+        help="Also drop timestamps while normalising.",
+    )
+    parser.add_argument(
+        "--extraction-cache-dir",
+        default=str(DEFAULT_EXTRACTION_CACHE_DIR),
+        help="Directory of extracted .docx/.pdf text shared with run_cursor_meeting_agent.py "
+        f"(default: {DEFAULT_EXTRACTION_CACHE_DIR}).",
+    )
+    parser.add_argument(
+        "--no-extraction-cache",
+        action="store_true",
+        help="Always re-extract .docx/.pdf transcripts.",
+    )
+    parser.add_argument(
+        "--pdf-workers",
+        type=int,
+        help="Processes of the shared PDF extraction pool (default: $TRANSCRIPT_PDF_WORKERS or CPU count; "
+        "1 extracts serially).",
+    )
+    args = parser.parse_args()
+    if args.pdf_workers is not None:
+        if args.pdf_workers < 1:
+            parser.error("--pdf-workers must be at least 1")
+        from transcript_ingest import pdf  # only when asked for: it imports PyPDF2
+
+        pdf.set_workers(args.pdf_workers)
+    return args
 
 
 def call_cursor_cloud_agent(transcript: str, prompt: str, source_path: pathlib.Path) -> Optional[str]:
@@ -129,23 +130,10 @@ def call_cursor_cloud_agent(transcript: str, prompt: str, source_path: pathlib.P
 
 def heuristic_summary(transcript: str, source_path: pathlib.Path, prompt: str) -> str:
     """
-    Provide a very lightweight fallback summary so that the workflow still
-    produces a file even when the Cursor Cloud agent cannot be reached yet.
+    Offline extractive summary so that the workflow still produces a useful
+    file even when the Cursor Cloud agent cannot be reached.
     """
-    lines = [line.strip() for line in transcript.splitlines() if line.strip()]
-    excerpt = "\n".join(lines[: min(12, len(lines))])
-    body = textwrap.dedent(
-        f"""
-        _Cursor Cloud agent fallback mode_
-
-        Prompt: {prompt}
-
-        Transcript excerpt:
-
-        {excerpt}
-        """
-    ).strip()
-    return body
+    return f"_Cursor Cloud agent fallback mode_\n\nPrompt: {prompt}\n\n{extractive_brief(transcript)}"
 
 
 def wrap_markdown(content: str, source_path: pathlib.Path) -> str:
@@ -166,7 +154,12 @@ def main() -> None:
     args = parse_args()
     input_path = pathlib.Path(args.input)
     output_path = pathlib.Path(args.output)
-    text = extract_text(input_path)
+    cache = None if args.no_extraction_cache else ExtractionCache(pathlib.Path(args.extraction_cache_dir))
+    transcript = read_structured(input_path, cache)
+    text = transcript.text
+    if not args.no_normalize:
+        text, report = normalize_transcript(transcript, args.strip_timestamps)
+        print(f"[normalize] {input_path}: {report['bytes_in']:,} -> {report['bytes_out']:,} bytes")
 
     agent_output = call_cursor_cloud_agent(text, args.prompt, input_path)
     if agent_output:
@@ -174,9 +167,10 @@ def main() -> None:
     else:
         summary_body = heuristic_summary(text, input_path, args.prompt)
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(wrap_markdown(summary_body, input_path), encoding="utf-8")
+    write_atomic(output_path, wrap_markdown(summary_body, input_path))
     print(f"Wrote summary to {output_path}")
+    if cache:
+        cache.prune()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Lightweight tracing, metrics and profiling for the meeting runners.
+
+Everything is off by default: `span()` then returns a shared no-op context
+manager and the `record_*`/`count` helpers return immediately, so the
+instrumentation left in the hot paths costs one global lookup per call.
+
+`configure()` enables any combination of:
+
+* a JSON-lines metrics file – one line per finished span, then a final line
+  with counters and HTTP latency/size histograms;
+* an OpenTelemetry-compatible file – spans in OTLP/JSON (`resourceSpans`)
+  form, loadable by an OTLP file receiver or converted with standard tools;
+* a cProfile dump of the local (CPU-bound) stages, merged across worker
+  threads and readable with `python -m pstats`.
+
+Before Python 3.12 a profiler only sees the thread that enabled it, so each
+`profiled()` block runs its own and the results are merged. From 3.12 a
+profiler covers every thread and only one may be active at a time, so
+concurrent blocks share one profiler that stays enabled while any of them
+is running.
+"""
+
+from __future__ import annotations
+
+import bisect
+import collections
+import contextlib
+import itertools
+import json
+import os
+import pathlib
+import sys
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+SHARED_PROFILER = sys.version_info >= (3, 12)
+
+SERVICE_NAME = "meeting-agent"
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+SIZE_BUCKETS_BYTES = (256, 1024, 4096, 16384, 65536, 262144, 1048576)
+
+_NOOP = contextlib.nullcontext()
+
+
+class Histogram:
+    def __init__(self, bounds: tuple) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"bounds": list(self.bounds), "counts": self.counts, "sum": self.total, "count": self.count}
+
+
+class Span:
+    __slots__ = ("name", "trace_id", "span_id", "parent_id", "start_ns", "start", "attrs", "duration")
+
+    def __init__(self, name: str, trace_id: str, span_id: str, parent_id: Optional[str], attrs: Dict[str, Any]):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.attrs = attrs
+        self.start_ns = time.time_ns()
+        self.start = time.monotonic()
+        self.duration = 0.0
+
+    def set(self, key: str, value: Any) -> None:
+        self.attrs[key] = value
+
+
+class Telemetry:
+    def __init__(
+        self,
+        metrics_file: Optional[pathlib.Path] = None,
+        otel_file: Optional[pathlib.Path] = None,
+        profile_file: Optional[pathlib.Path] = None,
+    ) -> None:
+        self.metrics_file = metrics_file
+        self.otel_file = otel_file
+        self.profile_file = profile_file
+        self.spans: List[Span] = []
+        self.counters: Dict[str, int] = collections.Counter()
+        self.histograms: Dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._ids = itertools.count(1)
+        self._run_id = os.urandom(8).hex()
+        self._profile_stats: Optional["pstats.Stats"] = None
+        self._profiler: Optional["cProfile.Profile"] = None
+        self._profiled = 0  # profiled() blocks currently using the shared profiler
+
+    def _new_id(self, width: int) -> str:
+        return f"{next(self._ids):0{width}x}"
+
+    @contextlib.contextmanager
+    def span(self, name: str, **attrs: Any) -> Iterator[Span]:
+        stack: List[Span] = self._local.__dict__.setdefault("stack", [])
+        parent = stack[-1] if stack else None
+        trace_id = parent.trace_id if parent else f"{self._run_id}{self._new_id(16)}"
+        current = Span(name, trace_id, self._new_id(16), parent.span_id if parent else None, attrs)
+        stack.append(current)
+        try:
+            yield current
+        except BaseException as exc:
+            current.set("error", f"{type(exc).__name__}: {exc}")
+            raise
+        finally:
+            current.duration = time.monotonic() - current.start
+            stack.pop()
+            with self._lock:
+                self.spans.append(current)
+
+    def count(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            self.counters[name] += value
+
+    def observe(self, name: str, value: float, bounds: tuple) -> None:
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram(bounds)
+            histogram.observe(value)
+
+    @contextlib.contextmanager
+    def profiled(self) -> Iterator[None]:
+        import cProfile  # only loaded when --profile is used
+
+        if not SHARED_PROFILER:
+            profiler = cProfile.Profile()
+            profiler.enable()
+            try:
+                yield
+            finally:
+                profiler.disable()
+                with self._lock:
+                    self._add_profile(profiler)
+            return
+        with self._lock:
+            if self._profiled == 0:
+                self._profiler = cProfile.Profile()
+                self._profiler.enable()
+            self._profiled += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._profiled -= 1
+                if self._profiled == 0 and self._profiler is not None:
+                    self._profiler.disable()
+                    self._add_profile(self._profiler)
+                    self._profiler = None
+
+    def _add_profile(self, profiler: "cProfile.Profile") -> None:
+        import pstats
+
+        if self._profile_stats is None:
+            self._profile_stats = pstats.Stats(profiler)
+        else:
+            self._profile_stats.add(profiler)
+
+    def flush(self) -> None:
+        with self._lock:
+            spans = list(self.spans)
+            counters = dict(self.counters)
+            histograms = {name: hist.as_dict() for name, hist in self.histograms.items()}
+            profile_stats = self._profile_stats
+        if self.metrics_file:
+            self.metrics_file.parent.mkdir(parents=True, exist_ok=True)
+            with self.metrics_file.open("w", encoding="utf-8") as handle:
+                for item in spans:
+                    handle.write(
+                        json.dumps(
+                            {
+                                "type": "span",
+                                "name": item.name,
+                                "trace_id": item.trace_id,
+                                "span_id": item.span_id,
+                                "parent_id": item.parent_id,
+                                "start_unix_ns": item.start_ns,
+                                "duration_s": round(item.duration, 6),
+                                "attrs": item.attrs,
+                            },
+                            default=str,
+                        )
+                        + "\n"
+                    )
+                handle.write(json.dumps({"type": "metrics", "counters": counters, "histograms": histograms}) + "\n")
+        if self.otel_file:
+            self.otel_file.parent.mkdir(parents=True, exist_ok=True)
+            self.otel_file.write_text(json.dumps(_otlp_payload(spans)), encoding="utf-8")
+        if self.profile_file and profile_stats is not None:
+            self.profile_file.parent.mkdir(parents=True, exist_ok=True)
+            profile_stats.dump_stats(str(self.profile_file))
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_payload(spans: List[Span]) -> Dict[str, Any]:
+    otlp_spans = []
+    for item in spans:
+        entry: Dict[str, Any] = {
+            "traceId": item.trace_id,
+            "spanId": item.span_id,
+            "name": item.name,
+            "kind": 1,
+            "startTimeUnixNano": str(item.start_ns),
+            "endTimeUnixNano": str(item.start_ns + int(item.duration * 1e9)),
+            "attributes": [{"key": key, "value": _otlp_value(value)} for key, value in item.attrs.items()],
+        }
+        if item.parent_id:
+            entry["parentSpanId"] = item.parent_id
+        if "error" in item.attrs:
+            entry["status"] = {"code": 2, "message": str(item.attrs["error"])}
+        otlp_spans.append(entry)
+    return {
+        "resourceSpans": [
+            {
+                "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": SERVICE_NAME}}]},
+                "scopeSpans": [{"scope": {"name": SERVICE_NAME}, "spans": otlp_spans}],
+            }
+        ]
+    }
+
+
+_telemetry: Optional[Telemetry] = None
+
+
+def configure(
+    metrics_file: Optional[str] = None,
+    otel_file: Optional[str] = None,
+    profile_file: Optional[str] = None,
+) -> None:
+    global _telemetry
+    if not (metrics_file or otel_file or profile_file):
+        _telemetry = None
+        return
+    _telemetry = Telemetry(
+        pathlib.Path(metrics_file) if metrics_file else None,
+        pathlib.Path(otel_file) if otel_file else None,
+        pathlib.Path(profile_file) if profile_file else None,
+    )
+
+
+def enabled() -> bool:
+    return _telemetry is not None
+
+
+def span(name: str, **attrs: Any) -> Any:
+    if _telemetry is None:
+        return _NOOP
+    return _telemetry.span(name, **attrs)
+
+
+def profiled() -> Any:
+    """Profile the enclosed local work when `--profile` is active."""
+    if _telemetry is None or _telemetry.profile_file is None:
+        return _NOOP
+    return _telemetry.profiled()
+
+
+def count(name: str, value: int = 1) -> None:
+    if _telemetry is not None:
+        _telemetry.count(name, value)
+
+
+def record_http(method: str, route: str, status: int, sent: int, received: int, seconds: float) -> None:
+    if _telemetry is None:
+        return
+    _telemetry.count("http.requests")
+    _telemetry.count(f"http.requests.{method} {route}")
+    _telemetry.count(f"http.status.{status}")
+    _telemetry.count("http.bytes_sent", sent)
+    _telemetry.count("http.bytes_received", received)
+    _telemetry.observe(f"http.latency_ms.{method} {route}", seconds * 1000, LATENCY_BUCKETS_MS)
+    _telemetry.observe("http.response_bytes", received, SIZE_BUCKETS_BYTES)
+
+
+def flush() -> None:
+    if _telemetry is not None:
+        _telemetry.flush()
@@ -0,0 +1,51 @@
+"""
+Shared transcript ingestion for the meeting runners.
+
+`read_transcript(path)` dispatches on the file suffix through a small format
+registry. Each reader lives in its own module and is imported only when a file
+of that format is read, so a plain `.md` run never pays for `zipfile`,
+`xml.etree` or `PyPDF2`.
+
+`read_transcript(path, cache)` reuses the text of a `.docx`/`.pdf` that was
+already extracted, keyed on its content (see `cache.py`).
+
+`read_structured(path, cache)` returns the same text as a `Transcript` of
+speaker turns (see `model.py`), built while the file is parsed.
+
+Only the registry is imported with the package; `ExtractionCache`,
+`Transcript` and `Turn` load their modules on first access, so tools that only
+need `SUPPORTED_EXTENSIONS` start quickly.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+from .registry import SUPPORTED_EXTENSIONS, get_reader, read_structured, read_transcript, register_reader
+
+_LAZY = {
+    "ExtractionCache": ".cache",
+    "Transcript": ".model",
+    "Turn": ".model",
+}
+
+__all__ = [
+    "ExtractionCache",
+    "SUPPORTED_EXTENSIONS",
+    "Transcript",
+    "Turn",
+    "get_reader",
+    "read_structured",
+    "read_transcript",
+    "register_reader",
+]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,96 @@
+"""
+Content-addressed cache of extracted transcripts.
+
+Parsing a `.docx` or `.pdf` costs far more than hashing it, so the extracted
+`Transcript` (text and turn index, see `Transcript.to_bytes`) is kept in
+`.cache/transcript-text/<sha256>.trns.gz`, keyed on the file's bytes and the
+extractor version. Both runners share the directory, so a binary
+parsed by one run (or by the other runner) is not parsed again; renaming or
+re-committing the file does not invalidate the entry, while a changed file or
+a bumped extractor version does.
+
+Entries are written to a temporary file and renamed into place, so concurrent
+workers never see a half-written entry. An entry that does not decompress
+(truncated or corrupted on disk) is treated as a miss and deleted, so the file
+is extracted again and the entry rewritten. Eviction drops the least recently
+used entries until the directory fits in `max_bytes`.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import os
+import pathlib
+import struct
+import zlib
+from typing import Optional
+
+from atomic_write import write_atomic
+
+from .model import Transcript
+
+DEFAULT_CACHE_DIR = pathlib.Path(".cache/transcript-text")
+DEFAULT_MAX_BYTES = 100 * 1024 * 1024
+HASH_BLOCK = 1024 * 1024
+
+
+def file_key(path: pathlib.Path, extractor_version: str) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for block in iter(lambda: handle.read(HASH_BLOCK), b""):
+            digest.update(block)
+    return hashlib.sha256(f"{extractor_version}:{digest.hexdigest()}".encode("ascii")).hexdigest()
+
+
+class ExtractionCache:
+    def __init__(self, directory: pathlib.Path = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def _path(self, key: str) -> pathlib.Path:
+        return self.directory / f"{key}.trns.gz"
+
+    def get(self, key: str) -> Optional[Transcript]:
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        try:
+            transcript = Transcript.from_bytes(gzip.decompress(data))
+        except (OSError, EOFError, zlib.error, ValueError, struct.error):
+            try:
+                path.unlink(missing_ok=True)  # so the re-extracted transcript replaces it
+            except OSError:
+                pass
+            return None
+        try:
+            os.utime(path)  # refresh LRU position
+        except OSError:
+            pass
+        return transcript
+
+    def put(self, key: str, transcript: Transcript) -> None:
+        write_atomic(self._path(key), gzip.compress(transcript.to_bytes(), compresslevel=6, mtime=0))
+
+    def prune(self) -> int:
+        """Evict least recently used entries until the directory fits; returns the number removed."""
+        if not self.directory.is_dir():
+            return 0
+        entries = []
+        for path in self.directory.glob("*.gz"):  # includes text-only entries from older versions
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        return removed
@@ -0,0 +1,62 @@
+"""WebVTT (`.vtt`) and SubRip (`.srt`) caption files exported by meeting tools."""
+
+from __future__ import annotations
+
+import pathlib
+import re
+from typing import Iterable, List
+
+TIMING = re.compile(r"^(?P<start>[\d:.,]+)\s+-->\s+[\d:.,]+")
+VOICE = re.compile(r"<v(?:\.[^ >]*)?\s+(?P<speaker>[^>]+)>")
+TAG = re.compile(r"</?[^>]+>")
+
+
+def _timestamp(value: str) -> str:
+    """Normalise `00:01:02.345` / `01:02,345` to `00:01:02`."""
+    clock = value.replace(",", ".").split(".")[0]
+    parts = clock.split(":")
+    while len(parts) < 3:
+        parts.insert(0, "00")
+    return ":".join(part.zfill(2) for part in parts[-3:])
+
+
+def _cue_text(lines: List[str]) -> str:
+    text = " ".join(line.strip() for line in lines if line.strip())
+    voice = VOICE.search(text)
+    speaker = voice.group("speaker").strip() if voice else None
+    text = TAG.sub("", text).strip()
+    return f"{speaker}: {text}" if speaker else text
+
+
+def _parse_cues(lines: Iterable[str]) -> str:
+    output: List[str] = []
+    start = None
+    cue_lines: List[str] = []
+
+    def flush() -> None:
+        if start is not None and cue_lines:
+            text = _cue_text(cue_lines)
+            if text:
+                output.append(f"[{start}] {text}")
+
+    for raw in lines:
+        line = raw.rstrip("\n")
+        timing = TIMING.match(line.strip())
+        if timing:
+            flush()
+            start = _timestamp(timing.group("start"))
+            cue_lines = []
+        elif not line.strip():
+            flush()
+            start = None
+            cue_lines = []
+        elif start is not None:
+            cue_lines.append(line)
+    flush()
+    return "\n".join(output)
+
+
+def read_captions(path: pathlib.Path) -> str:
+    # Header, NOTE/STYLE blocks and cue identifiers carry no timing line and
+    # are skipped by _parse_cues, so the same parser handles VTT and SRT.
+    return _parse_cues(path.read_text(encoding="utf-8-sig").splitlines())
@@ -0,0 +1,65 @@
+"""Streaming text extraction for Word `.docx` transcripts."""
+
+from __future__ import annotations
+
+import pathlib
+import xml.etree.ElementTree as ET
+import zipfile
+from typing import Iterator, List
+
+from .model import Transcript, TranscriptBuilder
+
+NAMESPACE = {"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"}
+
+
+def iter_docx_paragraphs(path: pathlib.Path) -> Iterator[str]:
+    """
+    Stream the text of each `w:p` paragraph in `word/document.xml`.
+
+    Matches the old `findall(".//w:p")` walk exactly: paragraphs come out in
+    document order, and a paragraph nested inside another (text boxes) is
+    emitted after its container, whose text also includes it. Completed
+    top-level elements are cleared so memory stays bounded by one paragraph.
+    """
+    paragraph_tag = f"{{{NAMESPACE['w']}}}p"
+    text_tag = f"{{{NAMESPACE['w']}}}t"
+    open_paragraphs: List[List[str]] = []
+    group: List[List[str]] = []
+    depth = 0
+    body = None
+    with zipfile.ZipFile(path) as archive, archive.open("word/document.xml") as xml_stream:
+        for event, elem in ET.iterparse(xml_stream, events=("start", "end")):
+            if event == "start":
+                depth += 1
+                if depth == 2:
+                    body = elem
+                if elem.tag == paragraph_tag:
+                    texts: List[str] = []
+                    open_paragraphs.append(texts)
+                    group.append(texts)
+                continue
+            depth -= 1
+            if elem.tag == text_tag:
+                if elem.text:
+                    for texts in open_paragraphs:
+                        texts.append(elem.text)
+            elif elem.tag == paragraph_tag:
+                open_paragraphs.pop()
+                if not open_paragraphs:
+                    for texts in group:
+                        if texts:
+                            yield "".join(texts)
+                    group = []
+            if depth == 2 and body is not None and not open_paragraphs:
+                body.clear()
+
+
+def extract_docx_text(path: pathlib.Path) -> str:
+    return "\n".join(iter_docx_paragraphs(path))
+
+
+def read_docx_transcript(path: pathlib.Path) -> Transcript:
+    builder = TranscriptBuilder()
+    for paragraph in iter_docx_paragraphs(path):
+        builder.add_line(paragraph)
+    return builder.build()
@@ -0,0 +1,16 @@
+"""Google Drive `.gdoc` shortcuts, which carry a URL but no transcript text."""
+
+from __future__ import annotations
+
+import json
+import pathlib
+
+
+def read_gdoc(path: pathlib.Path) -> str:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    url = data.get("url", "https://docs.google.com/")
+    return (
+        "WARNING: Google .gdoc files are Drive shortcuts.\n"
+        "Please export the meeting notes as Markdown or DOCX and commit that file.\n"
+        f"Referenced document: {url}"
+    )
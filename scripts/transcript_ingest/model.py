@@ -0,0 +1,238 @@
+"""
+Structured transcript: speaker turns as offsets into one shared text buffer.
+
+`Transcript.text` is exactly the flat string `read_transcript` returns, so
+existing consumers keep working. Turns are not stored as string copies: five
+`array` columns hold each turn's line start, body start (after any bullet,
+timestamp and `Speaker:` prefix), end, speaker id and timestamp in seconds, and
+`Turn` objects (with `__slots__`) are created on access. A docx paragraph that
+runs several speakers together ("Okay.Terri Corney: Sure.") yields one turn per
+speaker. Lines that are only a timestamp (`### 00:07:38 {#00:07:38}`) set the
+timestamp of the turns that follow.
+
+Readers build it in the same pass that extracts the text (`TranscriptBuilder`
+indexes each paragraph or page as it is produced); normalization, chunking
+and the offline summary then work on its turns instead of re-splitting the
+string. `Transcript.to_bytes` / `from_bytes` give the binary form the
+extraction cache stores: a small header, the UTF-8 text, the speaker names and
+the raw column arrays, so a cache hit skips indexing as well as parsing.
+"""
+
+from __future__ import annotations
+
+import array
+import json
+import re
+import struct
+import sys
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+# Docx exports often run several speaker turns together: "Okay.Terri Corney: Sure."
+# Name words must be whitespace-separated so the lookahead cannot backtrack through long mixed-case tokens (URLs, ids).
+TURN_BREAK = re.compile(r"(?<=[a-z.!?,])(?=[A-Z][\w'\-]*(?:\s[A-Z][\w'\-]*){0,3}\s?:\s)")
+TIMESTAMP = r"\d{1,2}:\d{2}(?::\d{2})?"
+# Matched with pattern.match(buffer, pos, endpos), so no "^": the prefix of one turn.
+TURN_PREFIX = re.compile(
+    rf"\s*(?:[-*•]\s+)?(?:[\[(]?(?P<timestamp>{TIMESTAMP})[\])]?\s*)?"
+    r"(?:(?:\*\*)?(?P<speaker>[A-Z][\w.'’ \-]{0,40}?):(?:\*\*)?\s+)?"
+)
+TIMESTAMP_LINE = re.compile(rf"[ \t]*(?:#+[ \t]*)?\[?(?P<timestamp>{TIMESTAMP})\]?(?:[ \t]*\{{#[\d:]+\}})?[ \t]*")
+
+MAGIC = b"TRNS"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sBBxxIII")  # magic, version, little-endian flag, turns, speakers bytes, text bytes
+NO_SPEAKER = -1
+NO_TIMESTAMP = -1
+
+
+def _seconds(value: str) -> int:
+    seconds = 0
+    for part in value.split(":"):
+        seconds = seconds * 60 + int(part)
+    return seconds
+
+
+class Turn:
+    __slots__ = ("_text", "speaker", "timestamp", "start", "body_start", "end")
+
+    def __init__(
+        self, text: str, speaker: Optional[str], timestamp: Optional[int], start: int, body_start: int, end: int
+    ) -> None:
+        self._text = text
+        self.speaker = speaker
+        self.timestamp = timestamp
+        self.start = start
+        self.body_start = body_start
+        self.end = end
+
+    @property
+    def body(self) -> str:
+        """What was said, without bullet, timestamp or speaker prefix."""
+        return self._text[self.body_start:self.end]
+
+    @property
+    def line(self) -> str:
+        return self._text[self.start:self.end]
+
+    def __repr__(self) -> str:
+        return f"Turn(speaker={self.speaker!r}, timestamp={self.timestamp!r}, {self.start}:{self.end})"
+
+
+class Transcript:
+    __slots__ = ("text", "speakers", "starts", "body_starts", "ends", "speaker_ids", "timestamps")
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.speakers: List[str] = []
+        self.starts = array.array("I")
+        self.body_starts = array.array("I")
+        self.ends = array.array("I")
+        self.speaker_ids = array.array("i")
+        self.timestamps = array.array("i")
+
+    @classmethod
+    def from_text(cls, text: str) -> "Transcript":
+        """Index `text` in one pass; lines are scanned in place, not copied."""
+        transcript = cls(text)
+        _Indexer(transcript).index_lines(text, 0)
+        return transcript
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __getitem__(self, index: int) -> Turn:
+        speaker_id = self.speaker_ids[index]
+        timestamp = self.timestamps[index]
+        return Turn(
+            self.text,
+            self.speakers[speaker_id] if speaker_id != NO_SPEAKER else None,
+            timestamp if timestamp != NO_TIMESTAMP else None,
+            self.starts[index],
+            self.body_starts[index],
+            self.ends[index],
+        )
+
+    def __iter__(self) -> Iterator[Turn]:
+        for index in range(len(self.starts)):
+            yield self[index]
+
+    def bodies(self) -> Iterator[Tuple[Optional[str], str]]:
+        """`(speaker, body)` per turn without building `Turn` objects (for hot loops)."""
+        text = self.text
+        speakers = self.speakers
+        for body_start, end, speaker_id in zip(self.body_starts, self.ends, self.speaker_ids):
+            yield (speakers[speaker_id] if speaker_id != NO_SPEAKER else None), text[body_start:end]
+
+    def by_speaker(self, speaker: str) -> Iterator[Turn]:
+        if speaker not in self.speakers:
+            return
+        wanted = self.speakers.index(speaker)
+        for index, speaker_id in enumerate(self.speaker_ids):
+            if speaker_id == wanted:
+                yield self[index]
+
+    def to_bytes(self) -> bytes:
+        text = self.text.encode("utf-8")
+        speakers = json.dumps(self.speakers, ensure_ascii=False).encode("utf-8")
+        header = HEADER.pack(MAGIC, FORMAT_VERSION, sys.byteorder == "little", len(self), len(speakers), len(text))
+        columns = b"".join(column.tobytes() for column in self._columns())
+        return header + speakers + text + columns
+
+    @classmethod
+    def from_bytes(cls, data: Union[bytes, memoryview]) -> "Transcript":
+        magic, version, little_endian, turns, speakers_size, text_size = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError("not a transcript cache file of this version")
+        view = memoryview(data)
+        offset = HEADER.size
+        speakers = json.loads(bytes(view[offset:offset + speakers_size]).decode("utf-8"))
+        offset += speakers_size
+        transcript = cls(bytes(view[offset:offset + text_size]).decode("utf-8"))
+        offset += text_size
+        transcript.speakers = speakers
+        for column in transcript._columns():
+            size = turns * column.itemsize
+            column.frombytes(view[offset:offset + size])
+            if bool(little_endian) != (sys.byteorder == "little"):
+                column.byteswap()
+            offset += size
+        return transcript
+
+    def _columns(self) -> List[array.array]:
+        return [self.starts, self.body_starts, self.ends, self.speaker_ids, self.timestamps]
+
+
+class _Indexer:
+    """Appends the turns of one line at a time to a transcript's columns."""
+
+    def __init__(self, transcript: Transcript) -> None:
+        self.transcript = transcript
+        self.speaker_index: Dict[str, int] = {}
+        self.timestamp = NO_TIMESTAMP
+
+    def index_lines(self, buffer: str, shift: int) -> None:
+        position = 0
+        length = len(buffer)
+        while position <= length:
+            end = buffer.find("\n", position)
+            if end < 0:
+                end = length
+            self.index(buffer, position, end, shift)
+            position = end + 1
+
+    def index(self, buffer: str, start: int, end: int, shift: int) -> None:
+        """Index `buffer[start:end]`, which sits at `start + shift` in the transcript text."""
+        while start < end and buffer[start].isspace():
+            start += 1
+        while end > start and buffer[end - 1].isspace():
+            end -= 1
+        if start == end:
+            return
+        stamp = TIMESTAMP_LINE.fullmatch(buffer, start, end)
+        if stamp:
+            self.timestamp = _seconds(stamp.group("timestamp"))
+            return
+        transcript = self.transcript
+        boundaries = [match.start() for match in TURN_BREAK.finditer(buffer, start, end)]
+        for turn_start, turn_end in zip([start, *boundaries], [*boundaries, end]):
+            prefix = TURN_PREFIX.match(buffer, turn_start, turn_end)
+            body_start = prefix.end()
+            while turn_end > body_start and buffer[turn_end - 1].isspace():
+                turn_end -= 1
+            if body_start >= turn_end:
+                continue
+            speaker = prefix.group("speaker")
+            if speaker:
+                speaker_id = self.speaker_index.get(speaker)
+                if speaker_id is None:
+                    speaker_id = self.speaker_index[speaker] = len(transcript.speakers)
+                    transcript.speakers.append(speaker)
+            else:
+                speaker_id = NO_SPEAKER
+            stamp_text = prefix.group("timestamp")
+            transcript.starts.append(turn_start + shift)
+            transcript.body_starts.append(body_start + shift)
+            transcript.ends.append(turn_end + shift)
+            transcript.speaker_ids.append(speaker_id)
+            transcript.timestamps.append(_seconds(stamp_text) if stamp_text else self.timestamp)
+
+
+class TranscriptBuilder:
+    """Build a transcript from lines as a reader produces them (one pass, no re-scan)."""
+
+    def __init__(self) -> None:
+        self._lines: List[str] = []
+        self._length = -1  # so the first line starts at offset 0
+        self._transcript = Transcript("")
+        self._indexer = _Indexer(self._transcript)
+
+    def add_line(self, line: str) -> None:
+        """Append `line` (which may itself span several lines, e.g. a PDF page)."""
+        offset = self._length + 1
+        self._lines.append(line)
+        self._length = offset + len(line)
+        self._indexer.index_lines(line, offset)
+
+    def build(self) -> Transcript:
+        self._transcript.text = "\n".join(self._lines)
+        return self._transcript
@@ -0,0 +1,154 @@
+"""
+PDF transcript extraction via the optional PyPDF2 dependency.
+
+Long documents are split into page ranges that are extracted by a process
+pool and reassembled in page order. The pool is created on first use and
+shared by every extraction in the process, so transcripts read concurrently by
+the runners' worker threads queue their page ranges on the same workers
+instead of each starting a pool of their own. Workers are started with
+`forkserver` (or `spawn`), never forked from a multi-threaded runner.
+
+* `set_workers(n)` (the runners' `--pdf-workers`) or `TRANSCRIPT_PDF_WORKERS`
+  – worker processes (default: CPU count; `1` forces the serial path).
+* `TRANSCRIPT_PDF_PARALLEL_MIN_PAGES` – documents shorter than this are read
+  serially, where process start-up would cost more than it saves (default: 32).
+"""
+
+from __future__ import annotations
+
+import atexit
+import multiprocessing
+import os
+import pathlib
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Optional, Tuple
+
+from .model import Transcript, TranscriptBuilder
+
+try:
+    import PyPDF2
+except ImportError:  # pragma: no cover - only triggered if dependency missing
+    PyPDF2 = None
+
+DEFAULT_PARALLEL_MIN_PAGES = 32
+CHUNKS_PER_WORKER = 2
+
+_workers: Optional[int] = None
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, ""))
+    except ValueError:
+        return default
+
+
+def _extract_pages(reader: "PyPDF2.PdfReader", start: int, stop: int) -> List[str]:
+    texts = []
+    for index in range(start, stop):
+        try:
+            extracted = reader.pages[index].extract_text() or ""
+        except Exception as exc:  # pragma: no cover - PyPDF2 edge cases
+            extracted = f"[Warning: failed to read a PDF page: {exc}]"
+        texts.append(extracted.strip())
+    return texts
+
+
+def _extract_page_range(path: str, start: int, stop: int) -> List[str]:
+    # Runs in a worker process: each worker opens its own reader.
+    with open(path, "rb") as fh:
+        return _extract_pages(PyPDF2.PdfReader(fh), start, stop)
+
+
+def _page_ranges(page_count: int, chunks: int) -> List[Tuple[int, int]]:
+    size = -(-page_count // chunks)
+    return [(start, min(start + size, page_count)) for start in range(0, page_count, size)]
+
+
+def set_workers(workers: Optional[int]) -> None:
+    """Worker processes of the shared pool; None falls back to `TRANSCRIPT_PDF_WORKERS`."""
+    global _workers
+    _workers = workers
+
+
+def default_workers() -> int:
+    if _workers is not None:
+        return _workers
+    return _env_int("TRANSCRIPT_PDF_WORKERS", os.cpu_count() or 1)
+
+
+def _shared_pool(workers: int) -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            if "forkserver" in multiprocessing.get_all_start_methods():
+                context = multiprocessing.get_context("forkserver")
+                context.set_forkserver_preload([__name__])  # workers start with PyPDF2 already imported
+            else:
+                context = multiprocessing.get_context("spawn")
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+        return _pool
+
+
+def shutdown_pool() -> None:
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+atexit.register(shutdown_pool)
+
+
+def _extract_parallel(path: pathlib.Path, page_count: int, workers: int) -> Optional[List[str]]:
+    global _pool
+    ranges = _page_ranges(page_count, workers * CHUNKS_PER_WORKER)
+    pool = _shared_pool(workers)
+    try:
+        parts = pool.map(_extract_page_range, [str(path)] * len(ranges), *zip(*ranges))
+        return [text for part in parts for text in part]
+    except (BrokenProcessPool, OSError):
+        with _pool_lock:
+            if _pool is pool:
+                _pool = None  # the next extraction starts a fresh pool
+        return None
+
+
+def extract_pdf_pages(path: pathlib.Path, workers: Optional[int] = None) -> List[str]:
+    """Text of each non-empty page, in order; a single notice if there is nothing to extract."""
+    if PyPDF2 is None:
+        return [
+            "PDF transcript provided, but PyPDF2 is not installed in this environment.\n"
+            "Install PyPDF2 to enable extraction, or provide the transcript in Markdown/TXT/DOCX."
+        ]
+    if workers is None:
+        workers = default_workers()
+    min_pages = _env_int("TRANSCRIPT_PDF_PARALLEL_MIN_PAGES", DEFAULT_PARALLEL_MIN_PAGES)
+    with path.open("rb") as fh:
+        reader = PyPDF2.PdfReader(fh)
+        page_count = len(reader.pages)
+        text = None
+        if workers > 1 and page_count >= max(min_pages, 2):
+            text = _extract_parallel(path, page_count, min(workers, page_count))
+        if text is None:
+            text = _extract_pages(reader, 0, page_count)
+    pages = [page for page in text if page]
+    return pages or ["PDF transcript contained no extractable text. Please export to Markdown or DOCX."]
+
+
+def extract_pdf_text(path: pathlib.Path, workers: Optional[int] = None) -> str:
+    return "\n\n".join(extract_pdf_pages(path, workers))
+
+
+def read_pdf_transcript(path: pathlib.Path, workers: Optional[int] = None) -> Transcript:
+    builder = TranscriptBuilder()
+    for number, page in enumerate(extract_pdf_pages(path, workers)):
+        if number:
+            builder.add_line("")
+        builder.add_line(page)
+    return builder.build()
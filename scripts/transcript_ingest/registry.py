@@ -0,0 +1,102 @@
+"""Suffix → reader registry with lazy imports."""
+
+from __future__ import annotations
+
+import importlib
+import pathlib
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .cache import ExtractionCache
+    from .model import Transcript
+
+Reader = Callable[[pathlib.Path], str]
+
+# Readers are referenced as "module:function" (relative to this package) and
+# resolved on first use.
+_READERS: Dict[str, str] = {
+    ".docx": ".docx:extract_docx_text",
+    ".pdf": ".pdf:extract_pdf_text",
+    ".md": ".text:read_text",
+    ".txt": ".text:read_text",
+    ".gdoc": ".gdoc:read_gdoc",
+    ".vtt": ".captions:read_captions",
+    ".srt": ".captions:read_captions",
+}
+_FALLBACK = ".text:read_text_lenient"
+_resolved: Dict[str, Reader] = {}
+# Readers that build a `Transcript` while parsing; other formats are indexed from their text.
+_STRUCTURED_READERS: Dict[str, str] = {
+    ".docx": ".docx:read_docx_transcript",
+    ".pdf": ".pdf:read_pdf_transcript",
+}
+# Formats worth caching (parsing costs more than hashing). Bump a version when
+# its extractor's output changes so cached transcripts from the old one are not reused.
+_EXTRACTOR_VERSIONS: Dict[str, str] = {
+    ".docx": "docx-1",
+    ".pdf": "pdf-1",
+}
+
+_DEFAULT_READERS = dict(_READERS)
+
+SUPPORTED_EXTENSIONS: Tuple[str, ...] = tuple(sorted(_READERS))
+
+
+def register_reader(suffix: str, target: str) -> None:
+    """Register (or replace) the reader for `suffix`, e.g. `".rtf", "mypkg.rtf:read"`."""
+    suffix = suffix.lower()
+    _READERS[suffix] = target
+    _resolved.pop(suffix, None)
+
+
+def _resolve(target: str) -> Any:
+    module_name, _, attr = target.partition(":")
+    module = importlib.import_module(module_name, package=__package__)
+    return getattr(module, attr)
+
+
+def get_reader(suffix: str) -> Reader:
+    suffix = suffix.lower()
+    reader = _resolved.get(suffix)
+    if reader is None:
+        reader = _resolve(_READERS.get(suffix, _FALLBACK))
+        _resolved[suffix] = reader
+    return reader
+
+
+def _is_default(suffix: str) -> bool:
+    return _READERS.get(suffix) == _DEFAULT_READERS.get(suffix)
+
+
+def read_transcript(path: pathlib.Path, cache: Optional["ExtractionCache"] = None) -> str:
+    """Extract the text of `path`; with `cache`, `.docx`/`.pdf` extractions are reused by content hash."""
+    suffix = path.suffix.lower()
+    if cache is not None and suffix in _EXTRACTOR_VERSIONS and _is_default(suffix):
+        return read_structured(path, cache).text
+    return get_reader(suffix)(path)
+
+
+def read_structured(path: pathlib.Path, cache: Optional["ExtractionCache"] = None) -> "Transcript":
+    """Read `path` as a `Transcript` whose `text` equals `read_transcript(path)`, built while it is parsed."""
+    suffix = path.suffix.lower()
+    default = _is_default(suffix)
+    version = _EXTRACTOR_VERSIONS.get(suffix) if default else None
+    key = None
+    if cache is not None and version is not None:
+        from .cache import file_key
+
+        key = file_key(path, version)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+    target = _STRUCTURED_READERS.get(suffix) if default else None
+    if target:
+        transcript = _resolve(target)(path)
+    else:
+        from .model import Transcript
+
+        transcript = Transcript.from_text(get_reader(suffix)(path))
+    if key is not None:
+        cache.put(key, transcript)
+    return transcript
+
@@ -0,0 +1,14 @@
+"""Plain-text readers (.md, .txt and unknown suffixes)."""
+
+from __future__ import annotations
+
+import pathlib
+
+
+def read_text(path: pathlib.Path) -> str:
+    return path.read_text(encoding="utf-8")
+
+
+def read_text_lenient(path: pathlib.Path) -> str:
+    # Unknown formats: binary-safe read that drops undecodable bytes.
+    return path.read_text(encoding="utf-8", errors="ignore")
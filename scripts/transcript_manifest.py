@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Manifest of transcripts that already have a generated brief.
+
+`meeting_outputs/.manifest.json` maps each transcript path to the git blob
+SHA of the content that was summarised and the brief it produced. The runner
+records an entry after every brief it writes; `list_changed_transcripts.py`
+skips transcripts whose blob SHA is already known, so force-pushes, new
+branches and no-op content changes do not re-summarise the whole repository.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import pathlib
+import threading
+from typing import Dict, Set
+
+from atomic_write import write_atomic
+
+DEFAULT_MANIFEST_PATH = pathlib.Path("meeting_outputs/.manifest.json")
+MANIFEST_VERSION = 1
+
+
+def git_blob_sha(data: bytes) -> str:
+    """SHA-1 git assigns to a blob with this content (`git hash-object`)."""
+    digest = hashlib.sha1(f"blob {len(data)}\0".encode("ascii"))
+    digest.update(data)
+    return digest.hexdigest()
+
+
+class TranscriptManifest:
+    def __init__(self, path: pathlib.Path = DEFAULT_MANIFEST_PATH) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self.entries: Dict[str, Dict[str, str]] = self._load()
+
+    def _load(self) -> Dict[str, Dict[str, str]]:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        transcripts = data.get("transcripts", {}) if isinstance(data, dict) else {}
+        return {key: value for key, value in transcripts.items() if isinstance(value, dict)}
+
+    def known_blobs(self) -> Set[str]:
+        with self._lock:
+            return {entry["blob"] for entry in self.entries.values() if entry.get("blob")}
+
+    def record(self, transcript: pathlib.Path, brief: pathlib.Path) -> None:
+        """Record `transcript`'s current content as summarised into `brief` and save."""
+        blob = git_blob_sha(transcript.read_bytes())
+        with self._lock:
+            self.entries[transcript.as_posix()] = {"blob": blob, "brief": brief.as_posix()}
+            self._save_locked()
+
+    def _save_locked(self) -> None:
+        payload = {"version": MANIFEST_VERSION, "transcripts": dict(sorted(self.entries.items()))}
+        write_atomic(self.path, json.dumps(payload, indent=2) + "\n")
@@ -0,0 +1,456 @@
+#!/usr/bin/env python3
+"""
+Watch mode for the meeting runner: summarise transcripts as they land on disk.
+
+`run_cursor_meeting_agent.py --watch meeting_transcripts/` keeps one process
+(and one pooled HTTP client) alive and:
+
+* detects new or rewritten files with a transcript extension via inotify
+  (through libc with ctypes), or by rescanning the tree every
+  `--watch-interval` seconds where inotify is unavailable. Excluded
+  directories (the runner's output directory, whose briefs are `.md` files
+  too) are neither watched nor scanned, so the daemon never summarises its
+  own briefs;
+* waits until a file has been quiet for `--watch-debounce` seconds with an
+  unchanged size and mtime, so half-copied exports are not read;
+* queues it for a bounded pool of `--max-concurrency` workers. A file that
+  changes while it is queued is not queued twice, and one that changes while
+  it is being processed is processed again afterwards;
+* serves `GET /healthz` and `GET /metrics` (JSON: queue depth, in-flight work,
+  counts by brief source, processing and end-to-end latency percentiles) on
+  `127.0.0.1:--health-port`.
+"""
+
+from __future__ import annotations
+
+import collections
+import ctypes
+import ctypes.util
+import json
+import os
+import pathlib
+import queue
+import select
+import signal
+import struct
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+from list_changed_transcripts import VALID_EXTENSIONS
+
+DEFAULT_DEBOUNCE_SECONDS = 2.0
+DEFAULT_SCAN_INTERVAL = 2.0
+DEFAULT_HEALTH_PORT = 8787
+LATENCY_SAMPLES = 500
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+EVENT_HEADER = struct.Struct("iIII")
+
+Signature = Tuple[int, int]
+
+
+def is_transcript(path: pathlib.Path) -> bool:
+    # Skip editor/Office lock and temp files such as "~$notes.docx" and ".notes.md.swp".
+    return path.suffix.lower() in VALID_EXTENSIONS and not path.name.startswith(("~$", "."))
+
+
+def is_excluded(path: pathlib.Path, exclude: Tuple[pathlib.Path, ...]) -> bool:
+    """Whether `path` is one of the (resolved) `exclude` directories or inside one."""
+    if not exclude:
+        return False
+    resolved = path.resolve()
+    return any(resolved == directory or directory in resolved.parents for directory in exclude)
+
+
+def _subdirs(directory: str, names: List[str], exclude: Tuple[pathlib.Path, ...]) -> List[str]:
+    return [
+        name for name in names if not name.startswith(".") and not is_excluded(pathlib.Path(directory, name), exclude)
+    ]
+
+
+def iter_transcripts(root: pathlib.Path, exclude: Tuple[pathlib.Path, ...] = ()) -> Iterator[pathlib.Path]:
+    for directory, subdirs, files in os.walk(root):
+        subdirs[:] = _subdirs(directory, subdirs, exclude)
+        for name in files:
+            path = pathlib.Path(directory, name)
+            if is_transcript(path):
+                yield path
+
+
+def file_signature(path: pathlib.Path) -> Optional[Signature]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+class InotifyWatcher:
+    name = "inotify"
+
+    def __init__(self, root: pathlib.Path, exclude: Tuple[pathlib.Path, ...] = ()) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError("inotify is not available on this platform")
+        self._libc = libc
+        self.root = root
+        self.exclude = exclude
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs: Dict[int, pathlib.Path] = {}
+        self._add_tree(root)
+
+    def _add_tree(self, root: pathlib.Path) -> None:
+        for directory, subdirs, _ in os.walk(root):
+            subdirs[:] = _subdirs(directory, subdirs, self.exclude)
+            wd = self._libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+            if wd < 0:
+                raise OSError(ctypes.get_errno(), f"cannot watch {directory}")
+            self._dirs[wd] = pathlib.Path(directory)
+
+    def changes(self, timeout: float) -> List[pathlib.Path]:
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        paths: List[pathlib.Path] = []
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+            if mask & IN_Q_OVERFLOW:
+                # The kernel dropped events: treat every file as possibly changed.
+                paths.extend(iter_transcripts(self.root, self.exclude))
+                continue
+            if mask & IN_IGNORED:
+                self._dirs.pop(wd, None)
+                continue
+            directory = self._dirs.get(wd)
+            if directory is None or not name:
+                continue
+            path = directory / os.fsdecode(name)
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO) and _subdirs(directory.as_posix(), [path.name], self.exclude):
+                    self._add_tree(path)
+                    paths.extend(iter_transcripts(path, self.exclude))  # files written before the watch existed
+                continue
+            paths.append(path)
+        return paths
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    name = "polling"
+
+    def __init__(
+        self, root: pathlib.Path, interval: float = DEFAULT_SCAN_INTERVAL, exclude: Tuple[pathlib.Path, ...] = ()
+    ) -> None:
+        self.root = root
+        self.interval = interval
+        self.exclude = exclude
+        self._snapshot = self._scan()
+        self._scanned = time.monotonic()
+
+    def _scan(self) -> Dict[pathlib.Path, Optional[Signature]]:
+        return {path: file_signature(path) for path in iter_transcripts(self.root, self.exclude)}
+
+    def changes(self, timeout: float) -> List[pathlib.Path]:
+        remaining = self.interval - (time.monotonic() - self._scanned)
+        if remaining > 0:
+            time.sleep(min(timeout, remaining))
+            return []
+        snapshot = self._scan()
+        self._scanned = time.monotonic()
+        changed = [path for path, signature in snapshot.items() if self._snapshot.get(path) != signature]
+        self._snapshot = snapshot
+        return changed
+
+    def close(self) -> None:
+        pass
+
+
+def open_watcher(
+    root: pathlib.Path, force_polling: bool, interval: float, exclude: Tuple[pathlib.Path, ...] = ()
+) -> Any:
+    if not force_polling and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(root, exclude)
+        except OSError as exc:
+            print(f"[warn] inotify unavailable ({exc}); polling {root} every {interval:g}s", file=sys.stderr)
+    return PollingWatcher(root, interval, exclude)
+
+
+class Debouncer:
+    """Hold paths until they have been quiet for `quiet` seconds with an unchanged size and mtime."""
+
+    def __init__(self, quiet: float = DEFAULT_DEBOUNCE_SECONDS) -> None:
+        self.quiet = quiet
+        self._pending: Dict[pathlib.Path, Tuple[float, float, Optional[Signature]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def touch(self, path: pathlib.Path) -> None:
+        now = time.monotonic()
+        first_seen = self._pending.get(path, (now,))[0]
+        self._pending[path] = (first_seen, now, file_signature(path))
+
+    def next_due(self) -> Optional[float]:
+        if not self._pending:
+            return None
+        last = min(touched for _, touched, _ in self._pending.values())
+        return max(0.0, last + self.quiet - time.monotonic())
+
+    def ready(self) -> List[Tuple[pathlib.Path, float]]:
+        """Settled paths with the monotonic time they were first seen."""
+        now = time.monotonic()
+        settled = []
+        for path, (first_seen, touched, signature) in list(self._pending.items()):
+            if now - touched < self.quiet:
+                continue
+            current = file_signature(path)
+            if current is None or current[0] == 0:
+                del self._pending[path]  # deleted or emptied; a later write re-adds it
+            elif current != signature:
+                self._pending[path] = (first_seen, now, current)  # still being written
+            else:
+                del self._pending[path]
+                settled.append((path, first_seen))
+        return settled
+
+
+class WatchService:
+    """Bounded worker pool with per-path coalescing and latency statistics."""
+
+    def __init__(
+        self,
+        process: Callable[[pathlib.Path, Dict[str, Any]], Any],
+        workers: int,
+        queue_size: int,
+    ) -> None:
+        self._process = process
+        self._queue: "queue.Queue[Optional[Tuple[pathlib.Path, float]]]" = queue.Queue(maxsize=queue_size)
+        self._lock = threading.Lock()
+        self._queued: Set[pathlib.Path] = set()
+        self._running: Set[pathlib.Path] = set()
+        self._rerun: Set[pathlib.Path] = set()
+        self.started = time.monotonic()
+        self.counts: Dict[str, int] = collections.Counter()
+        self.last_error: Optional[str] = None
+        self._processing: Deque[float] = collections.deque(maxlen=LATENCY_SAMPLES)
+        self._latency: Deque[float] = collections.deque(maxlen=LATENCY_SAMPLES)
+        self._threads = [
+            threading.Thread(target=self._work, name=f"watch-worker-{index}", daemon=True) for index in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, path: pathlib.Path, detected: float) -> None:
+        """Queue `path`; blocks while the queue is full."""
+        with self._lock:
+            if path in self._queued:
+                return
+            if path in self._running:
+                self._rerun.add(path)
+                return
+            self._queued.add(path)
+        self._queue.put((path, detected))
+
+    def _work(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            path, detected = item
+            with self._lock:
+                self._queued.discard(path)
+                self._running.add(path)
+            while True:
+                self._run_one(path, detected)
+                with self._lock:
+                    if path not in self._rerun:
+                        self._running.discard(path)
+                        break
+                    self._rerun.discard(path)
+                detected = time.monotonic()
+
+    def _run_one(self, path: pathlib.Path, detected: float) -> None:
+        started = time.monotonic()
+        stats: Dict[str, Any] = {}
+        try:
+            output = self._process(path, stats)
+        except Exception as exc:  # keep the daemon alive
+            with self._lock:
+                self.counts["failed"] += 1
+                self.last_error = f"{path}: {exc}"
+            print(f"[error] {path}: {exc}", file=sys.stderr)
+            return
+        finished = time.monotonic()
+        with self._lock:
+            self.counts["processed"] += 1
+            self.counts[f"source_{stats.get('source', 'unknown')}"] += 1
+            self._processing.append(finished - started)
+            self._latency.append(finished - detected)
+        print(f"Wrote meeting brief to {output} ({finished - detected:.1f}s after it was detected)")
+
+    def close(self) -> int:
+        """Drop queued work, let in-flight transcripts finish; return how many were dropped."""
+        dropped = 0
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            dropped += item is not None
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join()
+        return dropped
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            processing = sorted(self._processing)
+            latency = sorted(self._latency)
+            return {
+                "uptime_s": round(time.monotonic() - self.started, 1),
+                "queue_depth": self._queue.qsize(),
+                "in_progress": len(self._running),
+                "counts": dict(self.counts),
+                "processing_s": _summary(processing),
+                "latency_s": _summary(latency),
+                "last_error": self.last_error,
+            }
+
+
+def _summary(ordered: List[float]) -> Dict[str, Optional[float]]:
+    if not ordered:
+        return {"count": 0, "p50": None, "p95": None, "max": None}
+
+    def pick(fraction: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(fraction * len(ordered)))], 3)
+
+    return {"count": len(ordered), "p50": pick(0.5), "p95": pick(0.95), "max": round(ordered[-1], 3)}
+
+
+class HealthHandler(BaseHTTPRequestHandler):
+    server: "HealthServer"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        return
+
+    def do_GET(self) -> None:
+        if self.path == "/healthz":
+            status = self.server.status()
+            self._send(200 if status["status"] == "ok" else 503, status)
+        elif self.path == "/metrics":
+            self._send(200, {**self.server.status(), **self.server.service.metrics()})
+        else:
+            self._send(404, {"error": "not found"})
+
+    def _send(self, code: int, payload: Dict[str, Any]) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class HealthServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, port: int, service: WatchService, details: Callable[[], Dict[str, Any]]) -> None:
+        super().__init__(("127.0.0.1", port), HealthHandler)
+        self.service = service
+        self._details = details
+
+    def status(self) -> Dict[str, Any]:
+        details = self._details()
+        details["status"] = "degraded" if details.get("circuit") == "open" else "ok"
+        return details
+
+
+def watch(
+    root: pathlib.Path,
+    process: Callable[[pathlib.Path, Dict[str, Any]], Any],
+    workers: int,
+    debounce: float = DEFAULT_DEBOUNCE_SECONDS,
+    interval: float = DEFAULT_SCAN_INTERVAL,
+    force_polling: bool = False,
+    health_port: int = DEFAULT_HEALTH_PORT,
+    include_existing: bool = False,
+    circuit_state: Callable[[], Optional[str]] = lambda: None,
+    exclude: Sequence[pathlib.Path] = (),
+) -> None:
+    """Run until SIGINT/SIGTERM; in-flight transcripts finish before returning.
+
+    The signal handlers in place before the call are restored while in-flight
+    transcripts finish, so a second signal reaches them (the runner's
+    `cancellable` aborts the remaining agents).
+    """
+    if not root.is_dir():
+        raise SystemExit(f"--watch directory does not exist: {root}")
+    excluded = tuple(directory.resolve() for directory in exclude)
+    watcher = open_watcher(root, force_polling, interval, excluded)
+    debouncer = Debouncer(debounce)
+    service = WatchService(process, workers, queue_size=workers * 4)
+    health: Optional[HealthServer] = None
+    if health_port:
+        health = HealthServer(
+            health_port,
+            service,
+            lambda: {"watcher": watcher.name, "root": root.as_posix(), "debouncing": len(debouncer), "circuit": circuit_state()},
+        )
+        threading.Thread(target=health.serve_forever, name="watch-health", daemon=True).start()
+
+    stop = threading.Event()
+
+    def request_stop(signum: int, frame: Any) -> None:
+        stop.set()
+
+    previous = {sig: signal.signal(sig, request_stop) for sig in (signal.SIGINT, signal.SIGTERM)}
+    if include_existing:
+        for path in iter_transcripts(root, excluded):
+            debouncer.touch(path)
+    endpoint = f"; health on http://127.0.0.1:{health.server_address[1]}/healthz" if health else ""
+    print(f"Watching {root} ({watcher.name}, {debounce:g}s debounce, {workers} workers){endpoint}")
+    try:
+        while not stop.is_set():
+            due = debouncer.next_due()
+            for path in watcher.changes(min(1.0, due) if due is not None else 1.0):
+                if is_transcript(path) and not is_excluded(path, excluded):
+                    debouncer.touch(path)
+            for path, detected in debouncer.ready():
+                service.submit(path, detected)
+    finally:
+        for sig, handler in previous.items():
+            signal.signal(sig, handler)
+        watcher.close()
+        print("Stopping watch mode; waiting for in-flight transcripts…")
+        dropped = service.close()
+        if dropped:
+            print(f"[warn] {dropped} queued transcript(s) were not processed", file=sys.stderr)
+        if health:
+            health.shutdown()
+            health.server_close()
@@ -0,0 +1,30 @@
+import argparse
+import pathlib
+import sys
+
+import pytest
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+# The scripts import each other as top-level modules, and the fake API lives with the benchmarks.
+sys.path[:0] = [str(ROOT / "scripts"), str(ROOT / "benchmarks")]
+
+from agent_cli import add_agent_arguments, configure_agent_args  # noqa: E402
+from cursor_api import CursorClient, set_client  # noqa: E402
+from fake_cursor_api import FakeCursorServer  # noqa: E402
+
+
+@pytest.fixture
+def run_args(request, tmp_path, monkeypatch):
+    """Runner options, with the shared client pointed at a fake API (options via indirect parametrize)."""
+    monkeypatch.chdir(tmp_path)
+    with FakeCursorServer(**getattr(request, "param", {"completion_seconds": 0.0})) as server:
+        set_client(CursorClient("test", base_url=server.base_url))
+        parser = argparse.ArgumentParser()
+        add_agent_arguments(parser)
+        args = parser.parse_args(
+            ["--no-journal", "--no-extraction-cache", "--poll-policy", "fixed", "--poll-interval", "0.05"]
+        )
+        args.output = args.slug = args.meeting_date = args.meeting_title = None
+        configure_agent_args(parser, args)
+        yield args, server
+        set_client(None)
@@ -0,0 +1,72 @@
+import json
+import os
+import time
+
+import pytest
+
+import agent_journal
+from agent_journal import AgentJournal
+
+
+def lines(path):
+    return path.read_text().splitlines()
+
+
+def test_replay_keeps_the_latest_unexpired_record(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    brief = tmp_path / "brief.md"
+    brief.write_text("## Summary")
+    journal = AgentJournal(path)
+    journal.record_agent("p1", "bc_1", "CREATING")
+    journal.record_agent("p1", "bc_1", "RUNNING")
+    journal.record_agent("p2", "bc_2", "CREATING")
+    journal.record_agent("p2", "bc_2", "ERROR")
+    journal.record_brief("k1", tmp_path / "t.txt", brief)
+    journal.record_brief("k2", tmp_path / "gone.txt", tmp_path / "gone.md")
+    stale = {"kind": "agent", "key": "old", "agent_id": "bc_0", "status": "RUNNING", "ts": time.time() - 8 * 86400}
+    with path.open("a") as handle:
+        handle.write(json.dumps(stale) + "\n")
+        handle.write('{"kind": "agent", "key": "p3", "agent_')  # killed mid-write
+
+    replayed = AgentJournal(path)
+    assert replayed.resumable_agent("p1") == "bc_1"
+    assert replayed.resumable_agent("p2") is None
+    assert replayed.resumable_agent("old") is None
+    assert replayed.resumable_agent("p3") is None
+    assert replayed.written_brief("k1") == brief
+    assert replayed.written_brief("k2") is None
+    assert len(lines(path)) == 4
+
+
+@pytest.mark.skipif(agent_journal.fcntl is None, reason="compaction needs fcntl")
+def test_compaction_keeps_lines_appended_by_other_journals(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    mine = AgentJournal(path)
+    mine.record_agent("p1", "bc_1", "CREATING")
+    mine.record_agent("p1", "bc_1", "FINISHED")
+    other = AgentJournal(path)  # another run that opened the journal before we compact
+    other.record_agent("p2", "bc_2", "RUNNING")
+
+    assert mine.compact()
+    assert len(lines(path)) == 2
+    assert mine.resumable_agent("p2") == "bc_2"
+    other.record_agent("p3", "bc_3", "RUNNING")
+    assert AgentJournal(path).resumable_agent("p3") == "bc_3"
+
+
+@pytest.mark.skipif(agent_journal.fcntl is None, reason="compaction needs fcntl")
+def test_compaction_is_skipped_while_another_process_writes(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    journal = AgentJournal(path)
+    journal.record_agent("p1", "bc_1", "CREATING")
+    journal.record_agent("p1", "bc_1", "RUNNING")
+    fd = os.open(journal.lock_path, os.O_RDWR)
+    try:
+        agent_journal.fcntl.flock(fd, agent_journal.fcntl.LOCK_SH)
+        assert not journal.compact()
+        assert AgentJournal(path).resumable_agent("p1") == "bc_1"
+        assert len(lines(path)) == 2
+    finally:
+        os.close(fd)
+    assert journal.compact()
+    assert len(lines(path)) == 1
@@ -0,0 +1,76 @@
+import pytest
+
+import agent_runs
+from agent_runs import PartialBrief, collect_agent, launch_agent, stream_agent_markdown
+from cursor_api import get_client
+
+STREAMING = {"completion_seconds": 0.5, "streaming": True, "stream_write_fraction": 0.8, "heartbeat_seconds": 0.05}
+
+
+class RecordingPartial(PartialBrief):
+    """Keeps what the `.partial` file held after every write."""
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.snapshots = []
+
+    def update(self, text, force=False):
+        super().update(text, force)
+        if self.path.exists():
+            self.snapshots.append(self.path.read_text())
+
+
+@pytest.mark.parametrize("run_args", [STREAMING], indirect=True)
+def test_stream_mirrors_the_brief_to_the_partial_file(tmp_path, run_args, monkeypatch):
+    args, server = run_args
+    monkeypatch.setattr(agent_runs, "PARTIAL_WRITE_INTERVAL", 0.0)
+    agent_id = launch_agent("Alice: ship it", None)
+    partial = RecordingPartial(tmp_path / "meeting_outputs" / "sync.md.partial")
+
+    status, markdown = stream_agent_markdown(agent_id, 10, partial)
+    assert (status, markdown) == ("FINISHED", server.state.agents[agent_id].brief())
+    assert len(partial.snapshots) > 1
+    assert all(markdown.startswith(snapshot) for snapshot in partial.snapshots)
+    assert partial.snapshots[-1] == markdown
+    assert not list(partial.path.parent.glob("*.tmp"))
+    partial.discard()
+    assert not partial.path.exists()
+
+
+@pytest.mark.parametrize("run_args", [STREAMING], indirect=True)
+def test_collect_agent_streams_without_polling(tmp_path, run_args):
+    args, server = run_args
+    args.stream = True
+    agent_id = launch_agent("Alice: ship it", None)
+    partial_path = tmp_path / "sync.md.partial"
+
+    assert collect_agent(agent_id, args, partial_path) == ("FINISHED", server.state.agents[agent_id].brief())
+    assert server.state.counts["status"] == 0
+    assert not partial_path.exists()
+
+
+def test_unsupported_stream_falls_back_to_polling(tmp_path, run_args, capsys):
+    args, server = run_args
+    args.stream = True
+    agent_id = launch_agent("Alice: ship it", None)
+    partial_path = tmp_path / "sync.md.partial"
+
+    assert collect_agent(agent_id, args, partial_path) == ("FINISHED", server.state.agents[agent_id].brief())
+    assert "Falling back to polling" in capsys.readouterr().err
+    assert get_client().streaming is False
+    assert server.state.counts["status"] >= 1
+    assert not partial_path.exists()
+
+    second = launch_agent("Bob: not yet", None)
+    collect_agent(second, args, partial_path)
+    assert "Falling back to polling" not in capsys.readouterr().err  # the client remembers
+
+
+def test_partial_discard(tmp_path):
+    partial = PartialBrief(tmp_path / "out" / "sync.md.partial")
+    partial.update("## Summary", force=True)
+    assert partial.path.read_text() == "## Summary"
+    partial.discard()
+    partial.discard()
+    assert not partial.path.exists()
+    PartialBrief(None).discard()
@@ -0,0 +1,46 @@
+import os
+import stat
+
+import pytest
+
+from atomic_write import write_atomic
+
+
+@pytest.fixture
+def umask():
+    previous = os.umask(0o027)
+    yield 0o027
+    os.umask(previous)
+
+
+def test_replaces_the_file_with_the_usual_mode(tmp_path, umask):
+    target = tmp_path / "briefs" / "brief.md"
+    write_atomic(target, "old")
+    write_atomic(target, "né\n")
+    assert target.read_bytes() == "né\n".encode("utf-8")
+    write_atomic(target, b"\x1f\x8b")
+    assert target.read_bytes() == b"\x1f\x8b"
+    assert stat.S_IMODE(target.stat().st_mode) == 0o666 & ~umask
+    assert os.listdir(target.parent) == ["brief.md"]
+
+
+def test_umask_set_after_import_is_honoured(tmp_path, umask):
+    target = tmp_path / "brief.md"
+    write_atomic(target, "old")
+    os.umask(0o077)
+    write_atomic(target, "new")
+    assert stat.S_IMODE(target.stat().st_mode) == 0o600
+
+
+def test_failed_write_keeps_the_old_file(tmp_path, monkeypatch):
+    target = tmp_path / "brief.md"
+    write_atomic(target, "old")
+
+    def fail(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", fail)
+    with pytest.raises(OSError):
+        write_atomic(target, "new")
+    assert target.read_text() == "old"
+    assert os.listdir(tmp_path) == ["brief.md"]
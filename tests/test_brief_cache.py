@@ -0,0 +1,80 @@
+import datetime
+
+import meeting_briefs
+from agent_journal import AgentJournal
+from brief_cache import BriefCache, cache_key
+from run_cursor_meeting_agent import run
+
+TRANSCRIPT = "Alice: We pick the partner gateway.\nBob: I own the rollout by Friday.\n"
+
+
+def test_key_ignores_whitespace_but_not_template_or_metadata():
+    key = cache_key(TRANSCRIPT, "brief-1", {"stakeholders": ""})
+    assert cache_key(TRANSCRIPT.replace("\n", "  \r\n") + "\n\n\n", "brief-1", {"stakeholders": ""}) == key
+    assert cache_key(TRANSCRIPT, "brief-2", {"stakeholders": ""}) != key
+    assert cache_key(TRANSCRIPT, "brief-1", {"stakeholders": "CTO"}) != key
+    assert cache_key(TRANSCRIPT + "Carol: one more thing.", "brief-1", {"stakeholders": ""}) != key
+
+
+def test_put_get_and_prune(tmp_path):
+    cache = BriefCache(tmp_path, max_bytes=10**6)
+    cache.put("k1", "## Summary", "bc_1", {"title": "Sync"})
+    assert cache.get("k1")["markdown"] == "## Summary"
+    assert cache.get("missing") is None
+    cache.max_age = -1
+    assert cache.prune() == 1
+    assert cache.get("k1") is None
+
+
+def summarise(path, args):
+    stats = {}
+    meeting_briefs.process_transcript(path, args, stats)
+    return stats["source"]
+
+
+def test_renamed_transcript_reuses_the_cached_brief(tmp_path, run_args):
+    args, server = run_args
+    first = tmp_path / "2025-11-27-integration-sync.md"
+    first.write_text(TRANSCRIPT)
+    assert summarise(first, args) == "agent"
+    renamed = tmp_path / "GC-4 Integration - 2025_11_27 16_25 CET - Notes by Gemini.md"
+    renamed.write_text(TRANSCRIPT)
+    assert summarise(renamed, args) == "cache"
+    assert server.state.counts["launch"] == 1
+    brief = (tmp_path / "meeting_outputs" / "gc-4-integration-2025-11-27-16-25-cet-notes-by-gemini.md").read_text()
+    assert 'meeting: "Gc 4 Integration' in brief
+
+
+def test_undated_transcript_hits_the_cache_on_another_day(tmp_path, run_args, monkeypatch):
+    args, server = run_args
+    path = tmp_path / "Integration - Notes by Gemini.md"
+    path.write_text(TRANSCRIPT)
+    assert summarise(path, args) == "agent"
+
+    class NextDay:
+        class date:
+            @staticmethod
+            def today():
+                return datetime.date.today() + datetime.timedelta(days=1)
+
+    monkeypatch.setattr(meeting_briefs, "dt", NextDay)
+    assert summarise(path, args) == "cache"
+    assert server.state.counts["launch"] == 1
+    # An explicit title is part of the prompt, so it is part of the key.
+    args.meeting_title = "Integration sync"
+    assert summarise(path, args) == "agent"
+
+
+def test_brief_already_in_the_journal_is_reported_as_skipped(tmp_path, run_args, capsys):
+    args, server = run_args
+    args.journal = AgentJournal(tmp_path / "journal.jsonl")
+    args.transcripts = [tmp_path / "sync.md"]
+    args.transcripts[0].write_text(TRANSCRIPT)
+    args.watch = False
+    assert run(args) == 0
+    assert "Wrote meeting brief to meeting_outputs/sync.md" in capsys.readouterr().out
+    assert run(args) == 0
+    out = capsys.readouterr().out
+    assert "Wrote meeting brief" not in out
+    assert "Skipped meeting brief meeting_outputs/sync.md (already written)" in out
+    assert server.state.counts["launch"] == 1
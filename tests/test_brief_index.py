@@ -0,0 +1,129 @@
+import os
+
+import pytest
+
+import brief_index
+from brief_index import BriefIndex
+
+GATEWAY = """---
+meeting: "Gateway Sync"
+date: "2025-11-27"
+---
+
+# Gateway Sync
+
+## Architecture / Integration Notes
+
+The payment integration posts a signed webhook to the ledger service.
+
+## Risks & Open Questions
+
+Settlement windows for the pilot are still unclear.
+
+## Action Items
+
+- [ ] Send the webhook payload samples (owner: Alice; due: Friday)
+- [x] **Bob**: confirm the ledger API version
+"""
+
+PROMO = """---
+meeting: "Promo Demo"
+date: "2025-12-03"
+---
+
+## Business Requirements
+
+Only one promo code applies per quotation.
+
+## Action Items
+
+| Action | Owner | Due |
+| --- | --- | --- |
+| Check promo and referral rules | Carol | next week |
+"""
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = BriefIndex(tmp_path / "index.sqlite")
+    yield index
+    index.close()
+
+
+@pytest.fixture
+def outputs(tmp_path):
+    directory = tmp_path / "meeting_outputs"
+    directory.mkdir()
+    (directory / "gateway.md").write_text(GATEWAY)
+    (directory / "promo.md").write_text(PROMO)
+    return directory
+
+
+def count(index, table):
+    return index.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def test_unchanged_briefs_are_not_read_again(index, outputs, monkeypatch):
+    assert index.update(outputs) == {"added": 2, "updated": 0, "unchanged": 0, "removed": 0}
+    monkeypatch.setattr(brief_index, "hashlib", None)  # same size and mtime: not even hashed
+    monkeypatch.setattr(brief_index, "parse_brief", None)
+    assert index.update(outputs) == {"added": 0, "updated": 0, "unchanged": 2, "removed": 0}
+
+
+def test_touched_brief_with_the_same_content_is_not_reparsed(index, outputs, monkeypatch):
+    index.update(outputs)
+    brief = outputs / "gateway.md"
+    os.utime(brief, ns=(brief.stat().st_atime_ns, brief.stat().st_mtime_ns + 10**9))
+    monkeypatch.setattr(brief_index, "parse_brief", None)
+    assert index.update(outputs)["unchanged"] == 2
+    stored = index.conn.execute("SELECT mtime_ns FROM briefs WHERE path = ?", (brief.as_posix(),)).fetchone()[0]
+    assert stored == brief.stat().st_mtime_ns
+
+
+def test_changed_brief_replaces_its_sections_and_actions(index, outputs):
+    index.update(outputs)
+    (outputs / "gateway.md").write_text(GATEWAY.replace("signed webhook", "batched SFTP export"))
+    assert index.update(outputs) == {"added": 0, "updated": 1, "unchanged": 1, "removed": 0}
+    assert index.search("webhook", section="Architecture") == []
+    assert [row["path"] for row in index.search("sftp")] == [(outputs / "gateway.md").as_posix()]
+    assert count(index, "action_items") == 3
+
+
+def test_deleted_brief_is_dropped_from_every_table(index, outputs):
+    index.update(outputs)
+    (outputs / "gateway.md").unlink()
+    assert index.update(outputs) == {"added": 0, "updated": 0, "unchanged": 1, "removed": 1}
+    assert count(index, "briefs") == 1
+    assert count(index, "sections") == 2
+    assert count(index, "action_items") == 1
+    assert index.search("webhook") == []
+    assert index.search("ledger") == []
+
+
+def test_search_supports_fts5_queries(index, outputs):
+    index.update(outputs)
+    # Porter stemming: "integrations" matches "integration".
+    assert [row["heading"] for row in index.search("integrations")] == ["Architecture / Integration Notes"]
+    assert [row["meeting"] for row in index.search('"promo code"')] == ["Promo Demo"]
+    assert len(index.search("NEAR(integration webhook, 5)")) == 1
+    assert index.search("NEAR(integration webhook, 2)") == []
+    assert [row["heading"] for row in index.search("promo NOT referral")] == ["Business Requirements"]
+    assert [row["heading"] for row in index.search("sett*")] == ["Risks & Open Questions"]
+    assert [row["heading"] for row in index.search("webhook OR promo", section="Business")] == [
+        "Business Requirements"
+    ]
+    (row,) = index.search("settlement")
+    assert row["snippet"].startswith("[Settlement]")
+    with pytest.raises(brief_index.sqlite3.OperationalError):
+        index.search('"unbalanced')
+
+
+def test_actions_are_filtered_by_owner_text_and_state(index, outputs):
+    index.update(outputs)
+    assert [(row["owner"], row["due"]) for row in index.actions(owner="carol")] == [("Carol", "next week")]
+    assert [row["text"] for row in index.actions(open_only=True)] == [
+        "Check promo and referral rules",
+        "Send the webhook payload samples (owner: Alice; due: Friday)",
+    ]
+    (done,) = index.actions(match="ledger")
+    assert (done["owner"], done["done"]) == ("Bob", 1)
@@ -0,0 +1,133 @@
+import pathlib
+import subprocess
+
+import pytest
+
+import brief_outputs
+from brief_outputs import CheckpointCommitter, push
+
+
+def git(cwd, *args):
+    return subprocess.run(["git", "-C", str(cwd), *args], check=True, capture_output=True, text=True).stdout.strip()
+
+
+def clone(remote, path):
+    subprocess.run(["git", "clone", "-q", str(remote), str(path)], check=True, capture_output=True)
+    git(path, "config", "user.name", "test")
+    git(path, "config", "user.email", "test@example.com")
+    return path
+
+
+def commit(work, name, text):
+    (work / name).write_text(text)
+    git(work, "add", name)
+    git(work, "commit", "-q", "-m", f"add {name}")
+
+
+@pytest.fixture
+def repos(tmp_path, monkeypatch):
+    """A bare remote and two clones of it; git commands run in the first clone."""
+    remote = tmp_path / "remote.git"
+    subprocess.run(["git", "init", "-q", "--bare", "-b", "main", str(remote)], check=True)
+    seed = clone(remote, tmp_path / "seed")
+    commit(seed, "README.md", "briefs\n")
+    git(seed, "push", "-q", "origin", "HEAD:main")
+    ours, theirs = clone(remote, tmp_path / "ours"), clone(remote, tmp_path / "theirs")
+    monkeypatch.chdir(ours)
+    monkeypatch.delenv("GITHUB_REF_NAME", raising=False)
+    monkeypatch.setattr(brief_outputs.time, "sleep", lambda seconds: None)
+    return remote, ours, theirs
+
+
+def test_rejected_push_is_rebased_and_retried(repos, capsys):
+    remote, ours, theirs = repos
+    commit(theirs, "other.md", "theirs\n")
+    git(theirs, "push", "-q", "origin", "HEAD:main")
+    commit(ours, "brief.md", "ours\n")
+
+    assert push("origin", "main")
+    assert "failed (1/5)" in capsys.readouterr().err
+    assert git(remote, "log", "--format=%s", "main").splitlines() == ["add brief.md", "add other.md", "add README.md"]
+
+
+def test_conflicting_rebase_is_aborted_and_retried(repos, capsys):
+    remote, ours, theirs = repos
+    commit(theirs, "README.md", "theirs\n")
+    git(theirs, "push", "-q", "origin", "HEAD:main")
+    commit(ours, "README.md", "ours\n")
+    head = git(ours, "rev-parse", "HEAD")
+
+    assert not push("origin", "main", attempts=3)
+    err = capsys.readouterr().err
+    assert err.count("rebase onto origin/main failed") == 2
+    assert "failed (3/3)" in err
+    assert git(ours, "rev-parse", "HEAD") == head
+    assert git(ours, "status", "--porcelain") == ""
+    assert not (ours / ".git" / "rebase-merge").exists()
+
+
+def test_push_goes_through_once_the_conflict_is_gone(repos, monkeypatch, capsys):
+    remote, ours, theirs = repos
+    commit(theirs, "README.md", "theirs\n")
+    git(theirs, "push", "-q", "origin", "HEAD:main")
+    commit(ours, "brief.md", "ours\n")
+    commit(ours, "README.md", "ours\n")
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        if len(sleeps) == 2:  # after the first rebase failed, the other side reverts its change
+            git(theirs, "revert", "--no-edit", "HEAD")
+            git(theirs, "push", "-q", "origin", "HEAD:main")
+
+    monkeypatch.setattr(brief_outputs.time, "sleep", sleep)
+    assert push("origin", "main")
+    assert "rebase onto origin/main failed" in capsys.readouterr().err
+    assert git(remote, "show", "main:README.md") == "ours"
+    assert git(remote, "show", "main:brief.md") == "ours"
+
+
+def test_push_gives_up_after_the_last_attempt(repos, capsys):
+    remote, ours, theirs = repos
+    commit(theirs, "other.md", "theirs\n")
+    git(theirs, "push", "-q", "origin", "HEAD:main")
+    commit(ours, "brief.md", "ours\n")
+
+    assert not push("origin", "main", attempts=1)
+    assert "failed (1/1)" in capsys.readouterr().err
+    assert git(remote, "log", "-1", "--format=%s", "main") == "add other.md"
+
+
+def test_checkpoints_commit_every_n_files(repos):
+    remote, ours, theirs = repos
+    committer = CheckpointCommitter(every_files=2, every_seconds=1e9, branch="main")
+    for index in range(3):
+        path = ours / f"brief-{index}.md"
+        path.write_text("## Summary\n")
+        committer.add([path.relative_to(ours)])
+    assert committer.checkpoints == 1
+    assert committer.checkpoint()
+    assert committer.checkpoints == 2
+    assert git(remote, "rev-list", "--count", "main") == "3"
+
+
+def test_checkpoints_only_rebase_once_the_batch_has_drained(repos, capsys):
+    remote, ours, theirs = repos
+    commit(theirs, "other.md", "theirs\n")
+    git(theirs, "push", "-q", "origin", "HEAD:main")
+    committer = CheckpointCommitter(every_files=1, every_seconds=1e9, branch="main")
+    (ours / "writing.md").write_text("## Summ")  # a worker's brief that is not finished yet
+    (ours / "brief-0.md").write_text("## Summary\n")
+    committer.add([pathlib.Path("brief-0.md")])
+
+    assert committer.checkpoints == 1 and committer.unpushed == 1
+    assert "rebase" not in capsys.readouterr().err
+    assert git(ours, "log", "-1", "--format=%s") == "chore: add meeting brief outputs (checkpoint 1, 1 file(s)) [skip ci]"
+    assert git(ours, "rev-list", "--count", "HEAD") == "2"  # nothing pulled while workers write
+    assert git(ours, "status", "--porcelain") == "?? writing.md"
+
+    (ours / "writing.md").write_text("## Summary\n")
+    assert committer.checkpoint(drained=True)
+    assert committer.unpushed == 0
+    assert git(remote, "rev-list", "--count", "main") == "3"
+    assert (ours / "writing.md").read_text() == "## Summary\n"
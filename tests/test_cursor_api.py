@@ -0,0 +1,162 @@
+import json
+import threading
+import time
+
+import pytest
+
+from cursor_api import (
+    CircuitOpenError,
+    CursorClient,
+    Deadline,
+    DeadlineExceeded,
+    EventParser,
+    RunCancelled,
+    StreamingUnsupported,
+    deadline_scope,
+)
+from fake_cursor_api import FakeCursorServer
+from rate_limit import CircuitBreaker, RequestBudget
+
+
+@pytest.fixture
+def server():
+    with FakeCursorServer(completion_seconds=0.0) as server:
+        yield server
+
+
+def half_open_client(server: FakeCursorServer) -> CursorClient:
+    breaker = CircuitBreaker(failure_threshold=1, reset_after=0.0)
+    client = CursorClient("test", base_url=server.base_url, breaker=breaker)
+    client.breaker.record_failure()
+    assert client.breaker.state == "half-open"
+    return client
+
+
+def launch(client: CursorClient) -> str:
+    return client.request("/agents", {"prompt": {"text": "hi"}}, method="POST")["id"]
+
+
+def test_stream_records_the_trial_outcome(server):
+    client = CursorClient("test", base_url=server.base_url)
+    agent_id = launch(client)
+    client.breaker = CircuitBreaker(failure_threshold=1, reset_after=0.0)
+    client.breaker.record_failure()
+    with pytest.raises(StreamingUnsupported):
+        list(client.stream(f"/agents/{agent_id}/conversation"))
+    assert client.breaker.state == "closed"
+    assert client.request(f"/agents/{agent_id}")["status"] == "FINISHED"
+
+
+def test_expired_deadline_releases_the_trial(server):
+    client = half_open_client(server)
+    with deadline_scope(Deadline.after(0.0)):
+        with pytest.raises(DeadlineExceeded):
+            launch(client)
+    assert client.breaker.state == "half-open"
+    launch(client)  # not CircuitOpenError: the trial slot was handed back
+    assert client.breaker.state == "closed"
+
+
+def test_open_circuit_fails_fast(server):
+    breaker = CircuitBreaker(failure_threshold=1, reset_after=60.0)
+    client = CursorClient("test", base_url=server.base_url, breaker=breaker)
+    client.breaker.record_failure()
+    with pytest.raises(CircuitOpenError):
+        launch(client)
+    assert server.state.counts["requests"] == 0
+
+
+def test_cancel_aborts_a_stalled_request():
+    with FakeCursorServer(completion_seconds=0.0, stall_rate=1.0, stall_seconds=10.0) as server:
+        client = CursorClient("test", base_url=server.base_url)
+        agent_id = launch(client)
+        errors = []
+
+        def poll() -> None:
+            try:
+                client.request(f"/agents/{agent_id}")
+            except BaseException as exc:
+                errors.append(exc)
+
+        thread = threading.Thread(target=poll)
+        thread.start()
+        time.sleep(0.3)
+        started = time.monotonic()
+        client.cancel()
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+        assert time.monotonic() - started < 1.0
+        assert [type(exc) for exc in errors] == [RunCancelled]
+        with pytest.raises(RunCancelled):
+            client.request(f"/agents/{agent_id}")
+        assert client.stop_agents([agent_id]) == [agent_id]
+
+
+def drained_client(server: FakeCursorServer) -> CursorClient:
+    """A client whose launch budget has just been spent: the next launch waits 60s for a token."""
+    budget = RequestBudget.build(launch_rate=1 / 60, launch_burst=1)
+    client = CursorClient("test", base_url=server.base_url, budget=budget)
+    launch(client)
+    return client
+
+
+def test_budget_wait_ends_at_the_deadline(server):
+    client = drained_client(server)
+    started = time.monotonic()
+    with deadline_scope(Deadline.after(0.2)):
+        with pytest.raises(DeadlineExceeded):
+            launch(client)
+    assert 0.15 < time.monotonic() - started < 1.0
+    assert server.state.counts["launch"] == 1
+
+
+def test_cancel_interrupts_a_budget_wait(server):
+    client = drained_client(server)
+    errors = []
+
+    def launch_more() -> None:
+        try:
+            launch(client)
+        except BaseException as exc:
+            errors.append(exc)
+
+    thread = threading.Thread(target=launch_more)
+    thread.start()
+    time.sleep(0.2)
+    started = time.monotonic()
+    client.cancel()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    assert time.monotonic() - started < 1.0
+    assert [type(exc) for exc in errors] == [RunCancelled]
+    assert server.state.counts["launch"] == 1
+
+
+def test_stream_decodes_chunked_events():
+    with FakeCursorServer(completion_seconds=0.3, streaming=True, heartbeat_seconds=0.05) as server:
+        client = CursorClient("test", base_url=server.base_url)
+        agent_id = launch(client)
+        events = list(client.stream(f"/agents/{agent_id}/conversation"))
+        # The connection went back to the pool once the chunked body ended.
+        assert client.request(f"/agents/{agent_id}")["status"] == "FINISHED"
+        assert client.connections_opened == 1
+    assert ("", "") in events  # heartbeats
+    statuses = [json.loads(data)["status"] for event, data in events if event == "status"]
+    assert statuses == ["RUNNING", "FINISHED"]
+    text = "".join(json.loads(data)["text"] for event, data in events if event == "message" and "m2" in data)
+    assert text == server.state.agents[agent_id].brief()
+
+
+def test_event_parser():
+    parser = EventParser()
+    lines = [b": ping\n", b"event: status\n", b"data: {\"a\":\n", b"data:  1}\r\n", b"\n", b"data: x\n", b"\n", b"\n"]
+    assert [parser.feed(line) for line in lines] == [
+        ("", ""),
+        None,
+        None,
+        None,
+        ("status", '{"a":\n 1}'),
+        None,
+        ("message", "x"),
+        None,
+    ]
@@ -0,0 +1,62 @@
+import pathlib
+import zipfile
+
+import pytest
+
+from bench_docx_extraction import legacy_extract_docx_text
+from synthetic_transcripts import DOCX_CONTENT_TYPES, DOCX_RELS
+from transcript_ingest.docx import extract_docx_text, iter_docx_paragraphs
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+
+DOCUMENT = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+            xmlns:wp="http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing"><w:body>
+<w:p><w:pPr><w:pStyle w:val="Title"/></w:pPr><w:r><w:t>Weekly BA Connect</w:t></w:r></w:p>
+<w:p/>
+<w:p><w:r><w:rPr><w:b/></w:rPr><w:t xml:space="preserve">Alice: </w:t></w:r><w:r><w:t>Can we ship on </w:t></w:r>\
+<w:r><w:t>Friday?</w:t></w:r></w:p>
+<w:p><w:r><w:t></w:t></w:r><w:r><w:tab/></w:r></w:p>
+<w:tbl><w:tr>
+<w:tc><w:p><w:r><w:t>Owner</w:t></w:r></w:p></w:tc>
+<w:tc><w:p><w:r><w:t>Zoë Müller</w:t></w:r></w:p><w:p><w:r><w:t>Bob &amp; Carol</w:t></w:r></w:p></w:tc>
+</w:tr></w:tbl>
+<w:p><w:r><w:t>Before the box, </w:t></w:r><w:r><w:drawing><wp:inline><w:txbxContent>
+<w:p><w:r><w:t>boxed note</w:t></w:r></w:p>
+</w:txbxContent></wp:inline></w:drawing></w:r><w:r><w:t xml:space="preserve"> after it.</w:t></w:r></w:p>
+<w:p><w:r><w:t xml:space="preserve">  Bob: Yes.  </w:t></w:r></w:p>
+<w:sectPr><w:pgSz w:w="11906" w:h="16838"/></w:sectPr>
+</w:body></w:document>"""
+
+EXPECTED = [
+    "Weekly BA Connect",
+    "Alice: Can we ship on Friday?",
+    "Owner",
+    "Zoë Müller",
+    "Bob & Carol",
+    # A text-box paragraph is part of its container's text and is also emitted on its own, after it.
+    "Before the box, boxed note after it.",
+    "boxed note",
+    "  Bob: Yes.  ",
+]
+
+
+@pytest.fixture
+def docx_path(tmp_path):
+    path = tmp_path / "fixture.docx"
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("[Content_Types].xml", DOCX_CONTENT_TYPES)
+        archive.writestr("_rels/.rels", DOCX_RELS)
+        archive.writestr("word/document.xml", DOCUMENT)
+    return path
+
+
+def test_fixture_text_is_extracted_exactly(docx_path):
+    assert list(iter_docx_paragraphs(docx_path)) == EXPECTED
+    assert extract_docx_text(docx_path) == "\n".join(EXPECTED)
+    assert extract_docx_text(docx_path) == legacy_extract_docx_text(docx_path)
+
+
+@pytest.mark.parametrize("path", sorted((ROOT / "meeting-notes").glob("*.docx")), ids=lambda path: path.name[:30])
+def test_meeting_notes_match_the_whole_tree_extractor(path):
+    assert extract_docx_text(path) == legacy_extract_docx_text(path)
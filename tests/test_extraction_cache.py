@@ -0,0 +1,41 @@
+import gzip
+
+import pytest
+
+from transcript_ingest import ExtractionCache, Transcript
+
+TEXT = "Alice: We pick the partner gateway.\n" * 200
+
+
+def same(a, b):
+    return a.text == b.text and a.speakers == b.speakers and a.to_bytes() == b.to_bytes()
+
+
+def test_round_trip(tmp_path):
+    cache = ExtractionCache(tmp_path)
+    cache.put("k1", Transcript.from_text(TEXT))
+    cached = cache.get("k1")
+    assert same(cached, Transcript.from_text(TEXT))
+    assert len(cached) == 200 and cached.speakers == ["Alice"]
+    assert cache.get("missing") is None
+
+
+@pytest.mark.parametrize(
+    "damage",
+    [
+        lambda data: data[: len(data) // 2],  # truncated: EOFError
+        lambda data: data[:10] + b"\xff" * 20 + data[30:],  # corrupt deflate stream: zlib.error
+        lambda data: b"not gzip at all",  # bad magic: BadGzipFile
+        lambda data: gzip.compress(b"\xff\xfe\xfa"),  # short header: struct.error
+        lambda data: gzip.compress(TEXT.encode("utf-8")),  # text-only entry from an older version
+    ],
+)
+def test_corrupt_entry_is_a_miss_and_removed(tmp_path, damage):
+    cache = ExtractionCache(tmp_path)
+    cache.put("k1", Transcript.from_text(TEXT))
+    path = cache._path("k1")
+    path.write_bytes(damage(path.read_bytes()))
+    assert cache.get("k1") is None
+    assert not path.exists()
+    cache.put("k1", Transcript.from_text(TEXT))
+    assert cache.get("k1").text == TEXT
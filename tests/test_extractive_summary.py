@@ -0,0 +1,94 @@
+import pytest
+
+import extractive_summary
+from extractive_summary import _action_item, _textrank, _tfidf_rows, bucket_sentences, score_sentences, split_sentences
+
+CENTRAL = """Alice: The orange crate arrives with fresh lemons from Valencia.
+Bob: The orange crate arrives with fresh lemons from Valencia today.
+Carol: Fresh lemons and orange crates fill the Valencia warehouse.
+Dave: Lemons from Valencia taste better in the orange crate.
+Erin: Quarterly bicycle helmets need bright purple paint."""
+
+SECTIONED = """Alice: We decided to go with the hosted gateway for the pilot launch.
+Bob: Carol will send the settlement mapping document by Friday.
+Alice: Let's schedule a follow-up workshop with the partner team.
+Bob: Is the partner contract signed yet?
+Alice: The refund flow goes through the upstream ledger interface.
+Bob: The endpoint must return a signed payload within two seconds.
+Alice: Customers want their premium refunded within one week."""
+
+
+def dense_textrank(rows, damping=0.85, iterations=200):
+    weights = [dict(zip(*row)) for row in rows]
+    count = len(rows)
+    similarity = [
+        [0.0 if i == j else sum(w * weights[j].get(t, 0.0) for t, w in weights[i].items()) for j in range(count)]
+        for i in range(count)
+    ]
+    degrees = [sum(row) for row in similarity]
+    rank = [1.0 / count] * count
+    for _ in range(iterations):
+        rank = [
+            (1 - damping) / count
+            + damping * sum(similarity[j][i] / degrees[j] * rank[j] for j in range(count) if degrees[j])
+            for i in range(count)
+        ]
+    total = sum(rank)
+    return [value * count / total for value in rank]
+
+
+def test_textrank_matches_power_iteration_on_the_full_graph():
+    sentences = split_sentences(CENTRAL + "\n" + SECTIONED)
+    rows, terms = _tfidf_rows(sentences)
+    rank, _ = _textrank(rows, len(terms))
+    assert rank == pytest.approx(dense_textrank(rows), rel=1e-3)
+
+
+def test_central_sentences_outrank_off_topic_ones():
+    sentences = split_sentences(CENTRAL)
+    centroid = score_sentences(sentences)
+    assert min(sentence.score for sentence in sentences[:4]) > 4 * sentences[4].score
+    assert set(sorted(centroid, key=centroid.get)[-3:]) == {"orange", "lemons", "valencia"}
+
+
+def test_selection_skips_redundant_sentences_and_keeps_transcript_order(monkeypatch):
+    monkeypatch.setitem(extractive_summary.SECTION_LIMITS, "Summary", 2)
+    sentences = split_sentences(CENTRAL)
+    score_sentences(sentences)
+    summary = bucket_sentences(sentences)["Summary"]
+    # The top sentence (Bob's) is kept, Alice's near-copy of it is skipped.
+    assert [sentence.text for sentence in summary] == [
+        "The orange crate arrives with fresh lemons from Valencia today.",
+        "Fresh lemons and orange crates fill the Valencia warehouse.",
+    ]
+
+
+def test_sentences_are_bucketed_into_the_section_that_fits_best():
+    sentences = split_sentences(SECTIONED)
+    score_sentences(sentences)
+    buckets = {section: [item.text for item in items] for section, items in bucket_sentences(sentences).items()}
+    assert buckets == {
+        "Key Decisions": ["We decided to go with the hosted gateway for the pilot launch."],
+        "Action Items": ["Carol will send the settlement mapping document by Friday."],
+        "Next Steps & Upcoming Sessions": ["Let's schedule a follow-up workshop with the partner team."],
+        "Risks & Open Questions": ["Is the partner contract signed yet?"],
+        "Architecture / Integration Notes": ["The refund flow goes through the upstream ledger interface."],
+        "Technical Requirements": ["The endpoint must return a signed payload within two seconds."],
+        "Business Requirements": ["Customers want their premium refunded within one week."],
+        "Summary": [],
+    }
+
+
+@pytest.mark.parametrize(
+    "line, details",
+    [
+        ("Carol will prepare the schema draft by Friday.", "owner: Carol; due: by Friday"),
+        ("I'll share the updated deck tomorrow.", "owner: Bob; due: tomorrow"),
+        ("Someone needs to send the signed contract next week.", "owner: _unassigned_; due: next week"),
+        ("They will review the pricing sheet on 2025-12-05.", "owner: _unassigned_; due: on 2025-12-05"),
+        ("Carol will reconcile the ledger exports.", "owner: Carol"),
+    ],
+)
+def test_action_items_name_owner_and_due_date(line, details):
+    (sentence,) = split_sentences(f"Bob: {line}")
+    assert _action_item(sentence) == f"- [ ] {line} ({details})"
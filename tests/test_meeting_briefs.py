@@ -0,0 +1,98 @@
+import threading
+import time
+
+import pytest
+
+import agent_runs
+import meeting_briefs
+from agent_journal import AgentJournal
+from cursor_api import CursorApiError
+from meeting_briefs import process_batch
+from synthetic_transcripts import transcript_of_size, write_markdown
+
+
+def test_agents_never_exceed_max_concurrency(tmp_path, run_args, monkeypatch):
+    args, server = run_args
+    args.max_concurrency, args.agent_slots = 2, threading.BoundedSemaphore(2)
+    args.chunk_chars, args.chunk_overlap = 1_000, 0
+    lock = threading.Lock()
+    running = peak = launched = 0
+
+    def fake_agent(prompt, args, partial_path):
+        nonlocal running, peak, launched
+        with lock:
+            running += 1
+            launched += 1
+            peak = max(peak, running)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+        return "bc_1", "## Summary\n\nShip it."
+
+    monkeypatch.setattr(agent_runs, "_run_agent", fake_agent)
+    paths = [write_markdown(tmp_path / f"sync-{index}.md", transcript_of_size(4_000, index)) for index in range(4)]
+    records = list(process_batch(paths, args))
+    assert [record["error"] for record in records] == [None] * 4
+    assert launched > 8  # several chunk agents and a reduce agent per transcript
+    assert peak == 2
+
+
+def write_transcripts(tmp_path, sizes):
+    return [write_markdown(tmp_path / f"sync-{index}.md", transcript_of_size(size, index)) for index, size in enumerate(sizes)]
+
+
+@pytest.mark.parametrize("run_args", [{"completion_seconds": 0.0, "seconds_per_kchar": 0.2}], indirect=True)
+def test_records_are_yielded_as_transcripts_finish(tmp_path, run_args):
+    args, server = run_args
+    paths = write_transcripts(tmp_path, [6_000, 200, 3_000])
+    records = list(process_batch(paths, args))
+    assert [record["transcript"] for record in records] == [paths[1], paths[2], paths[0]]
+    for record in records:
+        assert record["error"] is None
+        assert record["source"] == "agent"
+        assert record["output"].read_text().count("Fake brief for agent") == 1
+    assert server.state.counts["launch"] == 3
+
+
+def test_a_failing_transcript_does_not_stop_the_batch(tmp_path, run_args):
+    args, server = run_args
+    paths = write_transcripts(tmp_path, [500, 500])
+    missing = tmp_path / "missing.md"
+    records = {record["transcript"]: record for record in process_batch([paths[0], missing, paths[1]], args)}
+    assert isinstance(records[missing]["error"], FileNotFoundError)
+    assert records[missing]["output"] is None
+    assert [records[path]["source"] for path in paths] == ["agent", "agent"]
+    assert all(records[path]["output"].exists() for path in paths)
+
+
+def test_failed_agents_fall_back_per_transcript(tmp_path, run_args, monkeypatch):
+    args, server = run_args
+    paths = write_transcripts(tmp_path, [500, 500])
+    real_run_agent = meeting_briefs.run_agent
+
+    def run_agent(prompt, args, partial_path=None):
+        if "sync-1" in str(partial_path):
+            raise CursorApiError("Cursor API error 500: boom", status=500)
+        return real_run_agent(prompt, args, partial_path)
+
+    monkeypatch.setattr(meeting_briefs, "run_agent", run_agent)
+    records = {record["transcript"]: record for record in process_batch(paths, args)}
+    assert [records[path]["source"] for path in paths] == ["agent", "fallback"]
+    assert "extractive, generated offline" in records[paths[1]]["output"].read_text()
+    assert records[paths[1]]["error"] is None
+
+
+def test_journal_reports_written_then_skipped(tmp_path, run_args):
+    args, server = run_args
+    args.journal = AgentJournal(tmp_path / "journal.jsonl")
+    paths = write_transcripts(tmp_path, [500, 500])
+    first = {record["transcript"]: record for record in process_batch(paths, args)}
+    assert [first[path]["outputs"] for path in paths] == [[first[path]["output"]] for path in paths]
+    assert all(first[path]["skipped"] == [] for path in paths)
+
+    second = {record["transcript"]: record for record in process_batch(paths, args)}
+    for path in paths:
+        assert second[path]["source"] == "journal"
+        assert second[path]["outputs"] == []
+        assert second[path]["skipped"] == [first[path]["output"]]
+    assert server.state.counts["launch"] == 2
@@ -0,0 +1,61 @@
+import pytest
+
+from brief_cache import canonical_text
+from normalization import normalize_transcript
+
+TRANSCRIPT = """### 00:00:12 {#00:00:12}
+
+Alice: Can we ship the gateway on Friday? ([00:00:14](#00:00:14))
+Bob: Yes.
+Alice: Is the partner contract signed?
+Bob: No. Um, legal still has it.
+Carol: Right.
+Dave: Okay. Got it.
+Carol: Sounds good.
+Bob: Thank you.
+
+### 00:05:40 {#00:05:40}
+
+The gateway must settle payments within one business day for the pilot.
+The gateway must settle payments within one business day for the pilot.
+"""
+
+NORMALIZED = """### 00:00:12
+
+Alice: Can we ship the gateway on Friday? (00:00:14)
+Bob: Yes.
+Alice: Is the partner contract signed?
+Bob: No. Legal still has it.
+Carol: Right.
+
+### 00:05:40
+
+The gateway must settle payments within one business day for the pilot."""
+
+WITHOUT_TIMESTAMPS = """Alice: Can we ship the gateway on Friday?
+Bob: Yes.
+Alice: Is the partner contract signed?
+Bob: No. Legal still has it.
+Carol: Right.
+
+The gateway must settle payments within one business day for the pilot."""
+
+
+@pytest.mark.parametrize("answer", ["Yes.", "No.", "Nope.", "Right.", "Sure.", "Exactly.", "True.", "Good.", "All of it."])
+def test_answers_are_not_filler(answer):
+    text, report = normalize_transcript(f"Alice: Do we need the contract first?\nBob: {answer}\n")
+    assert text == f"Alice: Do we need the contract first?\nBob: {answer}"
+    assert report["filler_turns"] == 0
+
+
+@pytest.mark.parametrize("strip, expected", [(False, NORMALIZED), (True, WITHOUT_TIMESTAMPS)])
+def test_dedupe_and_timestamp_output_is_stable(strip, expected):
+    text, report = normalize_transcript(TRANSCRIPT, strip)
+    assert text == expected
+    assert report["filler_turns"] == 3 and report["duplicate_paragraphs"] == 1
+    assert report["timestamps_removed"] == (3 if strip else 0)
+    assert normalize_transcript(text, strip)[0] == text
+
+
+def test_cache_hash_form_only_normalises_whitespace():
+    assert canonical_text("Alice: hi  \r\n\r\n\r\n\r\nBob: Okay.\n") == "Alice: hi\n\nBob: Okay."
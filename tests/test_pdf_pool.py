@@ -0,0 +1,22 @@
+import concurrent.futures
+
+import pytest
+
+from synthetic_transcripts import write_pdf
+from transcript_ingest import pdf
+
+pytestmark = pytest.mark.skipif(pdf.PyPDF2 is None, reason="needs PyPDF2")
+
+
+def test_concurrent_extractions_share_one_pool(tmp_path):
+    path = write_pdf(tmp_path / "long.pdf", 40)
+    serial = pdf.extract_pdf_text(path, workers=1)
+    assert pdf._pool is None
+    try:
+        with concurrent.futures.ThreadPoolExecutor(3) as threads:
+            texts = list(threads.map(lambda _: pdf.extract_pdf_text(path, workers=2), range(3)))
+        assert texts == [serial] * 3
+        assert pdf._pool is not None and pdf._pool._max_workers == 2
+    finally:
+        pdf.shutdown_pool()
+    assert pdf._pool is None
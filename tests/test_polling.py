@@ -0,0 +1,21 @@
+import os
+
+import pytest
+
+from polling import AdaptivePolicy, PollPolicy
+
+
+def test_policies_must_define_next_delay():
+    with pytest.raises(TypeError):
+        PollPolicy()
+
+
+def test_adaptive_history_is_replaced_atomically(tmp_path):
+    history = tmp_path / "cache" / "durations.json"
+    policy = AdaptivePolicy(history, jitter=0)
+    for duration in (40.0, 50.0, 60.0):
+        policy.record_completion(duration)
+    assert os.listdir(history.parent) == ["durations.json"]
+    reloaded = AdaptivePolicy(history, jitter=0)
+    assert reloaded.next_delay(0, 0.0) == pytest.approx(30.0)  # sleeps until the earliest usual completion
+    assert reloaded.next_delay(3, 45.0) == pytest.approx(1.0)
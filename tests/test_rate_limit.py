@@ -0,0 +1,102 @@
+from rate_limit import CircuitBreaker, RequestBudget, TokenBucket
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def open_breaker(clock: FakeClock, threshold: int = 2, reset_after: float = 10.0) -> CircuitBreaker:
+    breaker = CircuitBreaker(failure_threshold=threshold, reset_after=reset_after, clock=clock)
+    for _ in range(threshold):
+        breaker.record_failure()
+    return breaker
+
+
+def test_breaker_opens_after_consecutive_failures():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=3, reset_after=10.0, clock=clock)
+    assert not breaker.record_failure()
+    assert not breaker.record_failure()
+    breaker.record_success()  # resets the count
+    assert not breaker.record_failure()
+    assert not breaker.record_failure()
+    assert breaker.state == "closed"
+    assert breaker.record_failure()
+    assert breaker.state == "open"
+    clock.now = 4.0
+    assert breaker.allow() == 6.0
+
+
+def test_half_open_lets_one_trial_through():
+    clock = FakeClock()
+    breaker = open_breaker(clock)
+    clock.now = 10.0
+    assert breaker.state == "half-open"
+    assert breaker.allow() is None
+    assert breaker.allow() is None  # asking does not take the trial slot
+    remaining, trial = breaker.admit()
+    assert remaining is None and trial
+    assert breaker.admit() == (0.0, 0)  # a second request waits for the trial
+    assert breaker.allow() == 0.0
+
+
+def test_trial_success_closes_and_failure_reopens():
+    clock = FakeClock()
+    breaker = open_breaker(clock)
+    clock.now = 10.0
+    breaker.admit()
+    assert breaker.record_failure()
+    assert breaker.state == "open"
+    clock.now = 20.0
+    breaker.admit()
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.admit() == (None, 0)
+
+
+def test_released_trial_frees_the_slot():
+    clock = FakeClock()
+    breaker = open_breaker(clock)
+    clock.now = 10.0
+    _, trial = breaker.admit()
+    breaker.release_trial(trial)
+    assert breaker.state == "half-open"
+    remaining, next_trial = breaker.admit()
+    assert remaining is None and next_trial != trial
+
+
+def test_stale_release_keeps_the_current_trial():
+    clock = FakeClock()
+    breaker = open_breaker(clock)
+    clock.now = 10.0
+    _, first = breaker.admit()
+    breaker.record_failure()  # the first trial failed and re-opened the circuit
+    clock.now = 20.0
+    _, second = breaker.admit()
+    breaker.release_trial(first)
+    assert breaker.admit() == (0.0, 0)
+    breaker.release_trial(second)
+    assert breaker.admit()[0] is None
+
+
+def test_bucket_reserves_on_credit_and_defers():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2.0, burst=2, clock=clock)
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.5
+    clock.now = 1.0
+    bucket.defer(3.0)
+    assert bucket.reserve() == 3.5
+
+
+def test_budget_without_bucket_is_unlimited():
+    budget = RequestBudget.build(launch_rate=0, poll_rate=5)
+    assert "launch" not in budget.buckets
+    assert budget.reserve("launch") == 0.0
+    assert not budget.defer("launch", 1.0)
+    assert budget.defer("poll", 1.0)
@@ -0,0 +1,51 @@
+import threading
+
+from agent_runs import launch_agent, wait_for_agent
+from cursor_api import CursorClient, set_client
+from fake_cursor_api import FakeCursorServer
+from polling import FixedPolicy
+from telemetry import Telemetry
+
+
+def busy(n):
+    return sum(i * i for i in range(n))
+
+
+def test_profiled_blocks_can_overlap_across_threads(tmp_path):
+    telemetry = Telemetry(profile_file=tmp_path / "run.prof")
+    barrier = threading.Barrier(3)
+    errors = []
+
+    def work():
+        try:
+            with telemetry.profiled():
+                barrier.wait(timeout=5)  # all three blocks are open at once
+                busy(20000)
+                barrier.wait(timeout=5)
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=work) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    telemetry.flush()
+    assert (tmp_path / "run.prof").stat().st_size > 0
+    assert any(name == "busy" for _, _, name in telemetry._profile_stats.stats)
+    with telemetry.profiled():  # a later block starts a fresh profiler
+        busy(10)
+
+
+def test_wait_span_counts_polls():
+    telemetry = Telemetry()
+    with FakeCursorServer(completion_seconds=0.3) as server:
+        set_client(CursorClient("test", base_url=server.base_url))
+        try:
+            agent_id = launch_agent("Summarise", None)
+            with telemetry.span("wait", agent_id=agent_id) as span:
+                wait_for_agent(agent_id, 5, FixedPolicy(0.05), span)
+        finally:
+            set_client(None)
+    assert span.attrs["polls"] == server.state.counts["status"] >= 2
@@ -0,0 +1,103 @@
+import json
+import os
+import pathlib
+import subprocess
+import sys
+
+import pytest
+
+import transcript_ingest
+from synthetic_transcripts import write_docx
+from transcript_ingest import registry
+from transcript_ingest.captions import read_captions
+from transcript_ingest.docx import extract_docx_text
+from transcript_ingest.gdoc import read_gdoc
+from transcript_ingest.pdf import extract_pdf_text
+from transcript_ingest.text import read_text, read_text_lenient
+
+SCRIPTS = pathlib.Path(__file__).resolve().parents[1] / "scripts"
+
+PROBE = """
+import json, pathlib, sys
+import transcript_ingest
+
+def loaded():
+    modules = [name for name in sys.modules if name.startswith("transcript_ingest.")]
+    modules += [name for name in ("zipfile", "xml.etree.ElementTree", "PyPDF2") if name in sys.modules]
+    return sorted(modules)
+
+steps = {"import": loaded()}
+transcript_ingest.SUPPORTED_EXTENSIONS
+steps["extensions"] = loaded()
+transcript_ingest.read_transcript(pathlib.Path(sys.argv[1]))
+steps["markdown"] = loaded()
+transcript_ingest.Transcript
+steps["model"] = loaded()
+transcript_ingest.read_transcript(pathlib.Path(sys.argv[2]))
+steps["docx"] = loaded()
+print(json.dumps(steps))
+"""
+
+
+@pytest.fixture(autouse=True)
+def isolated_registry(monkeypatch):
+    monkeypatch.setattr(registry, "_READERS", dict(registry._READERS))
+    monkeypatch.setattr(registry, "_resolved", {})
+
+
+def test_readers_are_imported_only_when_their_format_is_read(tmp_path):
+    markdown = tmp_path / "notes.md"
+    markdown.write_text("Alice: Hello.\n")
+    docx = write_docx(tmp_path / "notes.docx", ["Alice: Hello."])
+    env = dict(os.environ, PYTHONPATH=str(SCRIPTS))
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE, str(markdown), str(docx)], env=env, capture_output=True, text=True, check=True
+    ).stdout
+    steps = json.loads(output)
+    assert steps["import"] == steps["extensions"] == ["transcript_ingest.registry"]
+    assert steps["markdown"] == ["transcript_ingest.registry", "transcript_ingest.text"]
+    assert set(steps["model"]) - set(steps["markdown"]) == {"transcript_ingest.model"}
+    assert "transcript_ingest.docx" in steps["docx"] and "zipfile" in steps["docx"]
+    assert not {"transcript_ingest.pdf", "transcript_ingest.captions", "PyPDF2"} & set(steps["docx"])
+
+
+@pytest.mark.parametrize(
+    "suffix, reader",
+    [
+        (".docx", extract_docx_text),
+        (".PDF", extract_pdf_text),
+        (".md", read_text),
+        (".txt", read_text),
+        (".vtt", read_captions),
+        (".srt", read_captions),
+        (".gdoc", read_gdoc),
+        (".rtf", read_text_lenient),
+        ("", read_text_lenient),
+    ],
+)
+def test_suffixes_dispatch_to_their_reader(suffix, reader):
+    assert registry.get_reader(suffix) is reader
+
+
+def test_read_transcript_uses_the_reader_for_the_suffix(tmp_path):
+    captions = tmp_path / "call.VTT"
+    captions.write_text("WEBVTT\n\n00:00:01.000 --> 00:00:04.000\n<v Alice>Can we ship on Friday?</v>\n")
+    shortcut = tmp_path / "call.gdoc"
+    url = "https://docs.google.com/document/d/abc"
+    shortcut.write_text(json.dumps({"url": url}))
+    unknown = tmp_path / "call.log"
+    unknown.write_bytes(b"Alice: caf\xff\xfe\n")
+    assert transcript_ingest.read_transcript(captions) == "[00:00:01] Alice: Can we ship on Friday?"
+    assert transcript_ingest.read_transcript(shortcut).endswith(f"Referenced document: {url}")
+    assert transcript_ingest.read_transcript(unknown) == "Alice: caf\n"
+
+
+def test_registered_reader_replaces_the_default(tmp_path):
+    notes = tmp_path / "call.docx"
+    notes.write_text("WEBVTT\n\n00:00:01.000 --> 00:00:04.000\n<v Alice>Hello.</v>\n")
+    registry.get_reader(".docx")
+    transcript_ingest.register_reader(".DOCX", "transcript_ingest.captions:read_captions")
+    assert registry.get_reader(".docx") is read_captions
+    # A replaced format is no longer read by the structured reader or cached under its extractor version.
+    assert transcript_ingest.read_transcript(notes, cache=object()) == "[00:00:01] Alice: Hello."
+    assert transcript_ingest.read_structured(notes).text == "[00:00:01] Alice: Hello."
@@ -0,0 +1,77 @@
+import subprocess
+
+import pytest
+
+from list_changed_transcripts import changed_files, filter_transcripts, unsummarised
+from transcript_manifest import TranscriptManifest, git_blob_sha
+
+ROOTS = ["meeting_transcripts"]
+
+
+def git(*args):
+    return subprocess.run(["git", *args], check=True, capture_output=True, text=True).stdout.strip()
+
+
+def commit(message):
+    git("add", "-A")
+    git("commit", "-q", "-m", message)
+    return git("rev-parse", "HEAD")
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    git("init", "-q", "-b", "main")
+    git("config", "user.name", "test")
+    git("config", "user.email", "test@example.com")
+    (tmp_path / "meeting_transcripts").mkdir()
+    return tmp_path
+
+
+def listed(base, head, manifest):
+    return unsummarised(head, filter_transcripts(changed_files(base, head), ROOTS), manifest.known_blobs())
+
+
+def test_blob_sha_matches_git(repo):
+    path = repo / "meeting_transcripts" / "sync.md"
+    path.write_bytes("Alice: ship it\r\n".encode("utf-8"))
+    assert git_blob_sha(path.read_bytes()) == git("hash-object", str(path))
+
+
+def test_manifest_round_trip(repo):
+    path = repo / "meeting_transcripts" / "sync.md"
+    path.write_text("Alice: ship it\n")
+    manifest = TranscriptManifest(repo / "meeting_outputs" / ".manifest.json")
+    manifest.record(path.relative_to(repo), repo / "meeting_outputs" / "sync.md")
+    assert TranscriptManifest(manifest.path).known_blobs() == {git_blob_sha(path.read_bytes())}
+    manifest.path.write_text("{not json")
+    assert TranscriptManifest(manifest.path).known_blobs() == set()
+
+
+def test_only_unsummarised_content_is_listed(repo):
+    transcripts = repo / "meeting_transcripts"
+    manifest = TranscriptManifest(repo / "meeting_outputs" / ".manifest.json")
+    (transcripts / "a.md").write_text("Alice: ship it\n")
+    (transcripts / "b.md").write_text("Bob: not yet\n")
+    (transcripts / "notes.png").write_bytes(b"\x89PNG")
+    (repo / "other.md").write_text("not a transcript\n")
+    base = commit("add transcripts")
+    assert listed("0" * 40, base, manifest) == ["meeting_transcripts/a.md", "meeting_transcripts/b.md"]
+    manifest.record((transcripts / "a.md").relative_to(repo), repo / "meeting_outputs" / "a.md")
+
+    (transcripts / "a.md").rename(transcripts / "a-renamed.md")  # same content: already summarised
+    (transcripts / "b.md").write_text("Bob: ship it next week\n")
+    (transcripts / "c.md").write_text("Carol: new meeting\n")
+    head = commit("rename, edit and add")
+    assert listed(base, head, manifest) == ["meeting_transcripts/b.md", "meeting_transcripts/c.md"]
+
+    (transcripts / "c.md").unlink()
+    deleted = commit("delete c")
+    assert listed(head, deleted, manifest) == []
+
+
+def test_unreachable_base_falls_back_to_the_whole_tree(repo):
+    manifest = TranscriptManifest(repo / "meeting_outputs" / ".manifest.json")
+    (repo / "meeting_transcripts" / "a.md").write_text("Alice: ship it\n")
+    head = commit("add a")
+    assert listed("1" * 40, head, manifest) == ["meeting_transcripts/a.md"]
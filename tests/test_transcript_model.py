@@ -0,0 +1,85 @@
+import pytest
+
+from chunking import split_transcript
+from normalization import normalize_structured, normalize_transcript
+from synthetic_transcripts import transcript_lines, write_docx, write_pdf
+from transcript_ingest import ExtractionCache, Transcript, docx, pdf, read_structured, read_transcript
+from transcript_ingest.cache import file_key
+from transcript_ingest.registry import _EXTRACTOR_VERSIONS
+
+TEXT = """### 00:00:12 {#00:00:12}
+
+Alice: We pick the partner gateway.
+Bob: Okay.
+Alice: It settles in a day.
+Bob: Yeah.
+Carol: The gateway needs a signed contract before the pilot starts next month.
+"""
+
+
+def index(transcript):
+    return transcript.to_bytes()
+
+
+def test_bytes_round_trip():
+    transcript = Transcript.from_text(TEXT)
+    loaded = Transcript.from_bytes(transcript.to_bytes())
+    assert loaded.text == TEXT
+    assert [(turn.speaker, turn.body, turn.timestamp) for turn in loaded] == [
+        (turn.speaker, turn.body, turn.timestamp) for turn in transcript
+    ]
+    with pytest.raises(ValueError):
+        Transcript.from_bytes(b"XXXX" + transcript.to_bytes()[4:])
+
+
+@pytest.mark.parametrize(
+    "write",
+    [
+        lambda tmp_path: write_docx(tmp_path / "sync.docx", transcript_lines(60)),
+        pytest.param(
+            lambda tmp_path: write_pdf(tmp_path / "sync.pdf", 3, lines_per_page=20),
+            marks=pytest.mark.skipif(pdf.PyPDF2 is None, reason="needs PyPDF2"),
+        ),
+    ],
+    ids=["docx", "pdf"],
+)
+def test_readers_build_the_model_while_parsing(tmp_path, write):
+    path = write(tmp_path)
+    transcript = read_structured(path)
+    assert transcript.text == read_transcript(path)
+    assert index(transcript) == index(Transcript.from_text(transcript.text))
+    assert len(transcript) > 0
+
+
+def test_cache_hit_returns_the_model(tmp_path, monkeypatch):
+    path = write_docx(tmp_path / "sync.docx", transcript_lines(30))
+    cache = ExtractionCache(tmp_path / "cache")
+    first = read_structured(path, cache)
+    assert cache._path(file_key(path, _EXTRACTOR_VERSIONS[".docx"])).exists()
+
+    def parse(path):
+        raise AssertionError("a cache hit must not parse the file")
+
+    monkeypatch.setattr(docx, "read_docx_transcript", parse)
+    assert index(read_structured(path, cache)) == index(first)
+    assert read_transcript(path, cache) == first.text
+
+
+def test_normalized_model_indexes_its_own_text():
+    normalized, report = normalize_structured(Transcript.from_text(TEXT))
+    assert normalized.text == normalize_transcript(TEXT)[0]
+    assert index(normalized) == index(Transcript.from_text(normalized.text))
+    assert [turn.speaker for turn in normalized] == ["Alice", "Carol"]
+    assert report["filler_turns"] == 2 and report["merged_turns"] == 1
+
+
+def test_chunks_break_between_turns():
+    lines = transcript_lines(200)
+    transcript = Transcript.from_text("\n\n".join(lines))
+    chunks = split_transcript(transcript, max_chars=2_000, overlap_chars=300)
+    assert len(chunks) > 1
+    assert split_transcript("\n\n".join(lines), 2_000, 300) == chunks
+    for chunk in chunks:
+        assert len(chunk) <= 2_000
+        assert all(line in lines for line in chunk.split("\n"))
+    assert chunks[1].split("\n")[0] in chunks[0]  # overlap repeats whole turns
@@ -0,0 +1,120 @@
+import signal
+import threading
+import time
+
+import pytest
+
+import transcript_watch
+from transcript_watch import Debouncer, InotifyWatcher, PollingWatcher, iter_transcripts
+
+
+@pytest.fixture
+def tree(tmp_path):
+    (tmp_path / "meeting_outputs").mkdir()
+    (tmp_path / "team").mkdir()
+    return tmp_path
+
+
+def settle(debouncer, quiet):
+    time.sleep(quiet * 1.5)
+    return [path for path, _ in debouncer.ready()]
+
+
+def test_debouncer_waits_for_a_quiet_unchanged_file(tmp_path):
+    path = tmp_path / "sync.md"
+    path.write_text("Alice: ship it\n")
+    debouncer = Debouncer(quiet=0.05)
+    debouncer.touch(path)
+    first_seen = time.monotonic()
+    assert debouncer.ready() == []
+    assert 0 < debouncer.next_due() <= 0.05
+
+    time.sleep(0.075)
+    path.write_text("Alice: ship it\nBob: not yet\n")  # still being written when it came due
+    assert debouncer.ready() == []
+    assert len(debouncer) == 1
+
+    time.sleep(0.075)
+    [(settled, seen)] = debouncer.ready()
+    assert settled == path and seen <= first_seen
+    assert len(debouncer) == 0 and debouncer.next_due() is None
+
+
+def test_debouncer_drops_deleted_and_empty_files(tmp_path):
+    gone, empty = tmp_path / "gone.md", tmp_path / "empty.md"
+    gone.write_text("Alice: ship it\n")
+    empty.write_text("")
+    debouncer = Debouncer(quiet=0.02)
+    debouncer.touch(gone)
+    debouncer.touch(empty)
+    gone.unlink()
+    assert settle(debouncer, 0.02) == []
+    assert len(debouncer) == 0
+
+
+def test_polling_watcher_reports_new_and_changed_transcripts(tree):
+    watcher = PollingWatcher(tree, interval=0.01, exclude=((tree / "meeting_outputs").resolve(),))
+    notes = tree / "team" / "sync.md"
+    notes.write_text("Alice: ship it\n")
+    (tree / "team" / "~$sync.docx").write_bytes(b"lock")
+    (tree / "team" / "diagram.png").write_bytes(b"\x89PNG")
+    (tree / "meeting_outputs" / "sync.md").write_text("## Summary\n")
+    time.sleep(0.02)
+    assert watcher.changes(1.0) == [notes]
+    time.sleep(0.02)
+    assert watcher.changes(1.0) == []
+
+    notes.write_text("Alice: ship it\nBob: not yet\n")
+    time.sleep(0.02)
+    assert watcher.changes(1.0) == [notes]
+
+
+def test_excluded_directories_are_not_scanned(tree):
+    (tree / "team" / "sync.md").write_text("Alice: ship it\n")
+    (tree / "meeting_outputs" / "sync.md").write_text("## Summary\n")
+    (tree / "meeting_outputs" / "archive").mkdir()
+    (tree / "meeting_outputs" / "archive" / "old.md").write_text("## Summary\n")
+    assert sorted(iter_transcripts(tree)) == [
+        tree / "meeting_outputs" / "archive" / "old.md",
+        tree / "meeting_outputs" / "sync.md",
+        tree / "team" / "sync.md",
+    ]
+    assert list(iter_transcripts(tree, ((tree / "meeting_outputs").resolve(),))) == [tree / "team" / "sync.md"]
+
+
+def test_inotify_watcher_skips_excluded_directories(tree):
+    try:
+        watcher = InotifyWatcher(tree, ((tree / "meeting_outputs").resolve(),))
+    except OSError as exc:
+        pytest.skip(f"inotify unavailable: {exc}")
+    try:
+        assert sorted(watcher._dirs.values()) == [tree, tree / "team"]
+        (tree / "meeting_outputs" / "sync.md").write_text("## Summary\n")
+        (tree / "team" / "sync.md").write_text("Alice: ship it\n")
+        changed = set()
+        deadline = time.monotonic() + 2
+        while tree / "team" / "sync.md" not in changed and time.monotonic() < deadline:
+            changed.update(watcher.changes(0.1))
+        assert changed == {tree / "team" / "sync.md"}
+    finally:
+        watcher.close()
+
+
+def test_watch_does_not_queue_its_own_briefs(tree):
+    (tree / "meeting_outputs" / "sync.md").write_text("## Summary\n")
+    (tree / "team" / "sync.md").write_text("Alice: ship it\n")
+    processed = []
+
+    def process(path, stats):
+        processed.append(path)
+        (tree / "meeting_outputs" / path.name).write_text("## Summary\n\nShip it.\n")
+        return path
+
+    stop = threading.Timer(0.5, signal.raise_signal, (signal.SIGTERM,))
+    stop.start()
+    try:
+        watch_args = dict(workers=2, debounce=0.0, interval=0.05, force_polling=True, health_port=0)
+        transcript_watch.watch(tree, process, include_existing=True, exclude=[tree / "meeting_outputs"], **watch_args)
+    finally:
+        stop.cancel()
+    assert processed == [tree / "team" / "sync.md"]